@@ -0,0 +1,369 @@
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import time
+
+import CoolProp
+import numpy as np
+
+from Boiler import Boiler
+from Compressor import Compressor
+from Condenser import Condenser
+from ContinuousDomain import ContinuousDomain
+from Evaporator import Evaporator
+from FitnessCache import FitnessCache
+from GA_MOO import check_convergence, front
+from GA_SOO import genetic_algorithm_soo
+from HDRM_MOO_calc_model import calculate_cost_of_hdrm, calculate_eff_evap_as_heat_source
+from HDRM_SOO_calc_model import calculate_eff
+from Mixer import Mixer
+from ParetoArchive import ParetoArchive
+from PropertyService import property_service
+from Pump import Pump
+from ThrottlingValve import ThrottlingValve
+from Turbine import Turbine
+from Turboequipment import Turboequipment
+
+# Benchmarks of the model of HDRM and of the genetic algorithms. Like the other scripts, this one imports the modules
+# by their names, so the directories with the components, the calculating models and the genetic algorithms (including
+# "Common tools") have to be on the path of Python (e.g. marked as source roots, or added to PYTHONPATH).
+#
+# Every benchmark is run repeat times and the time of every run is measured separately - the results (mean, minimum and
+# standard deviation of time) are saved to a JSON file together with the number of properties asked for from the
+# property service and the number of them really calculated by CoolProp (misses of its cache). The file of the previous
+# run can be given to compare_results() to find the benchmarks which have become slower.
+#
+# The benchmarks of the model are run in two modes: 'cold' - the cache of property service is cleared before every run,
+# so the time includes all calculations of CoolProp, and 'warm' - the cache contains all properties from the previous
+# runs, so only the calculations of the model itself are measured.
+
+# Default input data of the multi-objective model (the same as in HDRM_MOO_calc_model.py):
+MOO_INPUTS = dict(q_cap=1e5, work_fl='ammonia', amb_work_fl_cond='air', amb_work_fl_evap='air',
+                  t_cond=35 + 273.15, overc_cond=2, t_evap=-12 + 273.15, overh_evap=2,
+                  press_bef_turb=56e5, temp_bef_turb=295 + 273.15,
+                  pr_evap=0.99, amb_pr_evap=0.99, pr_cond=0.99, amb_pr_cond=0.99, pr_boil=0.99, pr_evap_hot_side=0.99,
+                  amb_t_evap_in=-4 + 273.15, amb_t_evap_out=-8 + 273.15, amb_t_cond_in=20 + 273.15,
+                  amb_t_cond_out=30 + 273.15, amb_p_evap_out=1e5, amb_p_cond_out=1e5,
+                  isent_eff_turb=0.7, isent_eff_pump=0.9, elec_eff_pump=0.9, isent_eff_comp=0.7, eff_turboeq=0.99,
+                  amb_work_fl_evap_hot_side='water', amb_p_evap_hot_side_out=1e5, evap_hot_side_pinch_point=5,
+                  amb_t_evap_hot_side_in=300 + 273.15, amb_pr_evap_hot_side=0.99)
+
+# Default input data of the single-objective model (the same as in GA_SOO.py):
+SOO_INPUTS = dict(q_cap=1e5, work_fl='ammonia', amb_work_fl_cond='air', amb_work_fl_evap='air',
+                  t_cond=35 + 273.15, overc_cond=2, t_evap=-12 + 273.15, overh_evap=2,
+                  press_bef_turb=60e5, temp_bef_turb=180 + 273.15,
+                  pr_evap=0.99, amb_pr_evap=0.99, pr_cond=0.99, amb_pr_cond=0.99, pr_boil=0.99,
+                  amb_t_evap_in=-4 + 273.15, amb_t_evap_out=-8 + 273.15, amb_t_cond_in=20 + 273.15,
+                  amb_t_cond_out=30 + 273.15, amb_p_evap_out=1e5, amb_p_cond_out=1e5,
+                  isent_eff_turb=0.7, isent_eff_pump=0.9, elec_eff_pump=0.9, isent_eff_comp=0.7,
+                  eff_boil=0.9, fuel_heat_val=26e6, eff_turboeq=0.99)
+
+
+def run_benchmark(name, function, setup=None, repeat=10, mode='warm'):
+
+    # Measures repeat runs of function(argument), where the argument is returned by setup() (e.g. a new instance of
+    # component), which isn't measured. In mode 'cold' the cache of property service is cleared before every run, in
+    # mode 'warm' the function is run once before the measurement. The output of the model (prints) is suppressed.
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'warm':
+            function(setup() if setup is not None else None)
+        for i in range(repeat):
+            argument = setup() if setup is not None else None
+            if mode == 'cold':
+                property_service.clear_cache()
+            property_service.reset_counters()
+            start = time.perf_counter()
+            function(argument)
+            times.append(time.perf_counter() - start)
+    result = {'mode': mode, 'repeat': repeat, 'mean': float(np.mean(times)), 'min': float(np.min(times)),
+              'std': float(np.std(times)),
+              # Counters of the last run:
+              'property_lookups': property_service.hits + property_service.misses + property_service.table_lookups,
+              'coolprop_calls': property_service.misses, 'hit_rate': property_service.hit_rate()}
+    print(name + " (" + mode + "): " + str(round(result['mean'] * 1e3, 3)) + " ms +- "
+          + str(round(result['std'] * 1e3, 3)) + " ms, " + str(result['coolprop_calls']) + " CoolProp calls of "
+          + str(result['property_lookups']) + " lookups")
+    return result
+
+
+def component_cases(inputs):
+
+    # The components are calculated one after another in the same way as in calculate_eff_evap_as_heat_source(). For
+    # every calculating function there's a pair of functions: the first one creates the component prepared for
+    # the calculation (inputs from the components calculated before), the second one runs the measured function.
+    # The functions calculate_cost() are measured on the calculated components.
+    i = inputs
+    cases = []
+
+    def new_throttling_valve():
+        return ThrottlingValve(temp_in=i['t_cond'] - i['overc_cond'], overc_cond=i['overc_cond'],
+                               temp_out=i['t_evap'], work_fl=i['work_fl'])
+    cases.append(('ThrottlingValve.calculate', new_throttling_valve, lambda c: c.calculate()))
+    throttling_valve = new_throttling_valve()
+    throttling_valve.calculate()
+    press_cond_in = throttling_valve.press_in / i['pr_cond']
+
+    def new_evaporator():
+        evaporator = Evaporator(enth_in=throttling_valve.enth_out, temp_in=i['t_evap'], overh=i['overh_evap'],
+                                q_cap=i['q_cap'], work_fl=i['work_fl'], amb_work_fl=i['amb_work_fl_evap'],
+                                pr=i['pr_evap'], amb_pr=i['amb_pr_evap'], amb_temp_in=i['amb_t_evap_in'],
+                                amb_temp_out=i['amb_t_evap_out'], amb_press_out=i['amb_p_evap_out'])
+        evaporator.set_attr_refr_cyc()
+        return evaporator
+    cases.append(('Evaporator.calculate', new_evaporator, lambda c: c.calculate()))
+    evaporator = new_evaporator()
+    evaporator.calculate()
+    throttling_valve.mass_fl = evaporator.mass_fl
+
+    def new_compressor():
+        return Compressor(press_in=evaporator.press_out, entr_in=evaporator.entr_out, enth_in=evaporator.enth_out,
+                          work_fl=i['work_fl'], press_out=press_cond_in, isent_eff=i['isent_eff_comp'],
+                          mass_fl=evaporator.mass_fl)
+    cases.append(('Compressor.calculate', new_compressor, lambda c: c.calculate()))
+    compressor = new_compressor()
+    compressor.calculate()
+
+    def new_turbine():
+        return Turbine(cycle_name="cycle", press_in=i['press_bef_turb'], temp_in=i['temp_bef_turb'],
+                       press_out=press_cond_in, work_fl=i['work_fl'], isent_eff=i['isent_eff_turb'])
+    cases.append(('Turbine.calculate', new_turbine, lambda c: c.calculate()))
+    turbine = new_turbine()
+    turbine.calculate()
+
+    def new_turboequipment():
+        return Turboequipment(compressor=compressor, turbine=turbine, eff=i['eff_turboeq'])
+    cases.append(('Turboequipment.calculate', new_turboequipment, lambda c: c.calculate()))
+    new_turboequipment().calculate()
+
+    def new_pump():
+        return Pump(cycle_name="cycle", mass_fl=turbine.mass_fl, press_in=throttling_valve.press_in,
+                    press_out=i['press_bef_turb'] / i['pr_boil'], temp_in=i['t_cond'] - i['overc_cond'],
+                    work_fl=i['work_fl'], isent_eff=i['isent_eff_pump'], elec_eff=i['elec_eff_pump'])
+    cases.append(('Pump.calculate', new_pump, lambda c: c.calculate()))
+    pump = new_pump()
+    pump.calculate()
+
+    def new_boiler():
+        return Boiler(temp_in=pump.temp_out, temp_out=i['temp_bef_turb'], press_out=i['press_bef_turb'],
+                      work_fl=i['work_fl'], mass_fl=turbine.mass_fl, fuel_heat_val=SOO_INPUTS['fuel_heat_val'],
+                      eff=SOO_INPUTS['eff_boil'], pr=i['pr_boil'])
+    cases.append(('Boiler.calculate_fuel_dem', new_boiler, lambda c: c.calculate_fuel_dem()))
+
+    def new_evaporator_hot_side():
+        return Evaporator(press_out=i['press_bef_turb'], temp_out=i['temp_bef_turb'], temp_in=pump.temp_out,
+                          mass_fl=pump.mass_fl, work_fl=i['work_fl'], amb_work_fl=i['amb_work_fl_evap_hot_side'],
+                          pr=i['pr_evap_hot_side'], amb_pr=i['amb_pr_evap_hot_side'],
+                          amb_press_out=i['amb_p_evap_hot_side_out'], amb_temp_in=i['amb_t_evap_hot_side_in'],
+                          pinch_point=i['evap_hot_side_pinch_point'])
+    cases.append(('Evaporator.calculate_hot_side', new_evaporator_hot_side, lambda c: c.calculate_hot_side()))
+    evaporator_hot_side = new_evaporator_hot_side()
+    evaporator_hot_side.calculate_hot_side()
+
+    def new_mixer():
+        return Mixer(press_in=press_cond_in, enth_in_1=turbine.enth_out, enth_in_2=compressor.enth_out,
+                     mass_fl_in_1=turbine.mass_fl, mass_fl_in_2=compressor.mass_fl, work_fl=i['work_fl'])
+    cases.append(('Mixer.calculate', new_mixer, lambda c: c.calculate()))
+    mixer = new_mixer()
+    mixer.calculate()
+
+    def new_condenser():
+        condenser = Condenser(enth_out=throttling_valve.enth_in, enth_in=mixer.enth_out, press_in=mixer.press_out,
+                              mass_fl=mixer.mass_fl_out, work_fl=i['work_fl'], amb_work_fl=i['amb_work_fl_cond'],
+                              pr=i['pr_cond'], amb_pr=i['amb_pr_cond'], amb_temp_in=i['amb_t_cond_in'],
+                              amb_temp_out=i['amb_t_cond_out'], amb_press_out=i['amb_p_cond_out'])
+        condenser.set_attr_combined_cycle()
+        return condenser
+    cases.append(('Condenser.calculate_combined_cyc', new_condenser, lambda c: c.calculate_combined_cyc()))
+    condenser = new_condenser()
+    condenser.calculate_combined_cyc()
+
+    # Costs of the calculated components. Every run gets new components calculated in setup, so in mode 'cold' the
+    # properties needed by calculate_cost() aren't left in the cache from the calculation of components before:
+    def calculated(new_component, method='calculate'):
+        component = new_component()
+        getattr(component, method)()
+        return component
+
+    def calculated_turbine():
+        # Mass flow and power of the turbine are calculated by the turboequipment:
+        turbine = calculated(new_turbine)
+        Turboequipment(compressor=compressor, turbine=turbine, eff=i['eff_turboeq']).calculate()
+        return turbine
+
+    def calculated_hdrm():
+        return (calculated(new_throttling_valve), calculated(new_evaporator), calculated(new_compressor),
+                calculated(new_mixer), calculated(new_condenser, 'calculate_combined_cyc'), calculated(new_pump),
+                calculated(new_evaporator_hot_side, 'calculate_hot_side'), calculated_turbine())
+
+    cases.append(('ThrottlingValve.calculate_cost', lambda: calculated(new_throttling_valve),
+                  lambda c: c.calculate_cost()))
+    cases.append(('Evaporator.calculate_cost', lambda: calculated(new_evaporator),
+                  lambda c: c.calculate_cost(surf_cost=20)))
+    cases.append(('Compressor.calculate_cost', lambda: calculated(new_compressor), lambda c: c.calculate_cost()))
+    cases.append(('Mixer.calculate_cost', lambda: calculated(new_mixer), lambda c: c.calculate_cost()))
+    cases.append(('Condenser.calculate_cost', lambda: calculated(new_condenser, 'calculate_combined_cyc'),
+                  lambda c: c.calculate_cost(surf_cost=150)))
+    cases.append(('Pump.calculate_cost', lambda: calculated(new_pump), lambda c: c.calculate_cost()))
+    cases.append(('Evaporator.calculate_cost (hot side)',
+                  lambda: calculated(new_evaporator_hot_side, 'calculate_hot_side'),
+                  lambda c: c.calculate_cost(surf_cost=150)))
+    cases.append(('Turbine.calculate_cost', calculated_turbine, lambda c: c.calculate_cost()))
+    cases.append(('calculate_cost_of_hdrm', calculated_hdrm, lambda components: calculate_cost_of_hdrm(*components)))
+    return cases
+
+
+def benchmark_components(repeat=10):
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        cases = component_cases(MOO_INPUTS)
+    for name, setup, function in cases:
+        for mode in ('cold', 'warm'):
+            results[name + ' [' + mode + ']'] = run_benchmark(name, function, setup, repeat, mode)
+    return results
+
+
+def benchmark_models(repeat=10):
+    results = {}
+    for mode in ('cold', 'warm'):
+        results['calculate_eff [' + mode + ']'] = run_benchmark(
+            'calculate_eff', lambda argument: calculate_eff(**SOO_INPUTS), repeat=repeat, mode=mode)
+        results['calculate_eff_evap_as_heat_source [' + mode + ']'] = run_benchmark(
+            'calculate_eff_evap_as_heat_source', lambda argument: calculate_eff_evap_as_heat_source(**MOO_INPUTS),
+            repeat=repeat, mode=mode)
+    return results
+
+
+def random_members(size, rng):
+    # Members of multi-objective algorithm with random efficiency (index 32) and SIC (index 33). The genes don't matter:
+    genes = [0] * 32
+    return [genes + [float(eff), float(sic)] for eff, sic in zip(rng.random(size), rng.random(size))]
+
+
+def random_front(size, rng):
+    # Non-dominated members sorted by efficiency from the highest one - both efficiency and SIC are decreasing:
+    genes = [0] * 32
+    return [genes + [float(eff), float(sic)]
+            for eff, sic in zip(np.sort(rng.random(size))[::-1], np.sort(rng.random(size))[::-1])]
+
+
+def benchmark_pareto(sizes=(100, 1000, 10000), repeat=10):
+    # Functions front() and check_convergence() of the multi-objective algorithm and the Pareto archive for growing
+    # numbers of members. The random members are the same in every run of benchmarks:
+    results = {}
+    rng = np.random.default_rng(0)
+    for size in sizes:
+        members = random_members(size, rng)
+        old_total = random_front(size, rng)
+        new_pareto_set = random_front(size, rng)
+        results['front, ' + str(size) + ' random members'] = run_benchmark(
+            'front, ' + str(size) + ' random members', lambda argument: front(members), repeat=repeat)
+        results['front, ' + str(size) + ' non-dominated members'] = run_benchmark(
+            'front, ' + str(size) + ' non-dominated members', lambda argument: front(old_total), repeat=repeat)
+        results['check_convergence, ' + str(size) + ' members'] = run_benchmark(
+            'check_convergence, ' + str(size) + ' members',
+            lambda argument: check_convergence(old_total, new_pareto_set, 0.5), repeat=repeat)
+        results['ParetoArchive.insert_members, ' + str(size) + ' members'] = run_benchmark(
+            'ParetoArchive.insert_members, ' + str(size) + ' members',
+            lambda archive: archive.insert_members(members), setup=ParetoArchive, repeat=repeat)
+    return results
+
+
+def ga_inputs():
+    # Inputs of the single-objective genetic algorithm - the ones of calculate_eff() with four of them optimized:
+    var = dict(SOO_INPUTS)
+    var['t_cond'] = ContinuousDomain(30 + 273.15, 40 + 273.15, 0.1)
+    var['press_bef_turb'] = ContinuousDomain(40e5, 80e5, 0.1e5)
+    var['temp_bef_turb'] = ContinuousDomain(150 + 273.15, 250 + 273.15, 1)
+    var['isent_eff_turb'] = ContinuousDomain(0.6, 0.9, 0.01)
+    return var
+
+
+def benchmark_genetic_algorithm(population=10, generations=3, probability=0.2, seed=0, repeat=3):
+
+    # One run of the single-objective genetic algorithm with the fixed seed, so every run evaluates the same members.
+    # The cache of property service is cleared before every run. The number of evaluations of the model (misses of
+    # the cache of fitness) is used to calculate the number of evaluations per second.
+    var = ga_inputs()
+    evaluations = []
+
+    def run(fitness_cache):
+        genetic_algorithm_soo(population, probability, generations, fitness_cache=fitness_cache,
+                              rng=np.random.default_rng(seed), **var)
+        evaluations.append(fitness_cache.misses)
+
+    result = run_benchmark('genetic_algorithm_soo', run, setup=lambda: FitnessCache(calculate_eff, len(var)),
+                           repeat=repeat, mode='cold')
+    result['evaluations'] = evaluations[-1]
+    result['evaluations_per_second'] = evaluations[-1] / result['mean']
+    print("genetic_algorithm_soo: " + str(round(result['evaluations_per_second'], 2)) + " evaluations per second")
+    return {'genetic_algorithm_soo, population ' + str(population) + ', ' + str(generations) + ' generations': result}
+
+
+def profile_genetic_algorithm(file_name, population=10, generations=3, probability=0.2, seed=0):
+
+    # The same run of genetic algorithm as in benchmark_genetic_algorithm() with the profiler of property service,
+    # which shows the components spending most of the time on properties. The statistics are saved to the xlsx file:
+    var = ga_inputs()
+    property_service.clear_cache()
+    profiler = property_service.start_profiling()
+    profiler.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        genetic_algorithm_soo(population, probability, generations, rng=np.random.default_rng(seed), **var)
+    property_service.stop_profiling()
+    profiler.print_report()
+    profiler.save(file_name)
+    return profiler
+
+
+def run_all_benchmarks(file_name, repeat=10):
+    results = {}
+    results.update(benchmark_components(repeat))
+    results.update(benchmark_models(repeat))
+    results.update(benchmark_pareto(repeat=repeat))
+    results.update(benchmark_genetic_algorithm())
+    saved = {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+             'python': platform.python_version(), 'numpy': np.__version__, 'coolprop': CoolProp.__version__,
+             'machine': platform.platform(), 'benchmarks': results}
+    with open(file_name, 'w') as file:
+        json.dump(saved, file, indent=2)
+    return saved
+
+
+def compare_results(old_file_name, new_file_name, tolerance=0.2):
+
+    # Compares the minimal times of benchmarks saved in two files. Returns the names of benchmarks, which are slower
+    # by more than the tolerance (relatively), or which make more calls of CoolProp than before.
+    with open(old_file_name) as file:
+        old_benchmarks = json.load(file)['benchmarks']
+    with open(new_file_name) as file:
+        new_benchmarks = json.load(file)['benchmarks']
+    regressions = []
+    for name, new in new_benchmarks.items():
+        if name not in old_benchmarks:
+            continue
+        old = old_benchmarks[name]
+        ratio = new['min'] / old['min'] if old['min'] > 0 else 1
+        print(name + ": " + str(round(ratio, 3)) + " x time of the previous run, CoolProp calls "
+              + str(old['coolprop_calls']) + " -> " + str(new['coolprop_calls']))
+        if ratio > 1 + tolerance or new['coolprop_calls'] > old['coolprop_calls']:
+            regressions.append(name)
+    if len(regressions) > 0:
+        print("Regressions: " + str(regressions))
+    return regressions
+
+
+if __name__ == "__main__":
+    # Results of this run and (optionally) of the previous run to compare with:
+    file_name = "HDRM_benchmarks_" + datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".json"
+    previous_file_name = ''
+    # Statistics of properties asked for by the components during the run of genetic algorithm (optional):
+    profile_file_name = ''
+    run_all_benchmarks(file_name, repeat=10)
+    if previous_file_name != '' and os.path.isfile(previous_file_name):
+        compare_results(previous_file_name, file_name)
+    if profile_file_name != '':
+        profile_genetic_algorithm(profile_file_name)
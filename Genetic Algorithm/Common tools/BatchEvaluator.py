@@ -0,0 +1,36 @@
+import numpy as np
+
+from SerialEvaluator import SerialEvaluator
+
+
+class BatchEvaluator(SerialEvaluator):
+
+    """
+    Calculates all members of the population with one call of the batch version of the model (calculate_eff_batch or
+    calculate_eff_evap_as_heat_source_batch), which receives the columns of genes as arrays. The batch function has to
+    match the calculating function given to the genetic algorithm, which is not used by this evaluator. The results
+    are returned in the same form as the ones of the calculating function: efficiency, or the list [efficiency, SIC].
+    Members which can't be solved by the model (nan returned by the batch function) get the worst possible values,
+    efficiency -inf and SIC +inf, so they are ranked behind all solved members and never become the best member or
+    a member of Pareto front.
+    """
+
+    def __init__(self, batch_function):
+        self.batch_function = batch_function
+
+    def evaluate(self, calc_function, list_of_genes):
+        if len(list_of_genes) == 0:
+            return []
+
+        columns_of_genes = [list(column) for column in zip(*list_of_genes)]
+        results = self.batch_function(*columns_of_genes)
+
+        # Multi-objective model returns the list of arrays [efficiencies, SICs]:
+        if isinstance(results, list):
+            efficiencies, sics = np.asarray(results[0], dtype=float), np.asarray(results[1], dtype=float)
+            unsolved = np.isnan(efficiencies) | np.isnan(sics)
+            efficiencies = np.where(unsolved, -np.inf, efficiencies)
+            sics = np.where(unsolved, np.inf, sics)
+            return [[efficiency, sic] for efficiency, sic in zip(efficiencies.tolist(), sics.tolist())]
+        efficiencies = np.asarray(results, dtype=float)
+        return np.where(np.isnan(efficiencies), -np.inf, efficiencies).tolist()
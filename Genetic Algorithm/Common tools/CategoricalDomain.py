@@ -0,0 +1,9 @@
+from DiscreteDomain import DiscreteDomain
+
+
+class CategoricalDomain(DiscreteDomain):
+
+    """
+    Set of values without any order, e.g. names of working fluids ['ammonia', 'R134a']. The candidates are drawn and
+    mutated the same as in DiscreteDomain, but the values aren't numbers.
+    """
@@ -0,0 +1,63 @@
+import os
+import pickle
+
+
+class Checkpoint:
+
+    """
+    Saves the state of the genetic algorithm to the file every given number of generations, so the interrupted run can
+    be continued from the last saved generation instead of from the beginning. The state contains the population (with
+    the generator of random numbers, so the continued run draws the same numbers as the uninterrupted one) and the
+    variables of the algorithm, together with the states of FitnessCache, ParetoArchive and ResultsStore, if they're
+    used by the run. When the run with ResultsStore is continued, the store has to be opened with mode 'a' - the rows
+    saved after the checkpoint are removed from it.
+
+    The file is written to a temporary file first, which then replaces the old one, so the process killed during the
+    saving leaves the previous checkpoint untouched. After the last generation the results of the algorithm are saved
+    as the finished state - running the algorithm again with the same checkpoint returns these results at once, so the
+    finished runs of a series (e.g. repeated runs in a loop) aren't calculated again. To start the run from the
+    beginning the file has to be removed (function remove()).
+    """
+
+    def __init__(self, file_name, every=1):
+        self.file_name = file_name
+        self.every = every
+
+    def is_due(self, generation):
+        return (generation + 1) % self.every == 0
+
+    def save(self, state, fitness_cache=None, pareto_archive=None, results_store=None):
+        state = dict(state)
+        state['fitness_cache'] = None if fitness_cache is None else fitness_cache.get_state()
+        state['pareto_archive'] = None if pareto_archive is None else pareto_archive.get_state()
+        state['results_store'] = None if results_store is None else results_store.get_state()
+        temporary_file_name = self.file_name + '.tmp'
+        with open(temporary_file_name, 'wb') as file:
+            pickle.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_file_name, self.file_name)
+
+    def save_finished(self, results, fitness_cache=None, pareto_archive=None, results_store=None):
+        self.save({'finished': True, 'results': results}, fitness_cache, pareto_archive, results_store)
+
+    def load(self, fitness_cache=None, pareto_archive=None, results_store=None):
+
+        # Returns the saved state of the algorithm (None, if there's no checkpoint yet) and brings the given fitness
+        # cache, Pareto archive and results store back to the state from the time of saving:
+        if not os.path.isfile(self.file_name):
+            return None
+        with open(self.file_name, 'rb') as file:
+            state = pickle.load(file)
+        if fitness_cache is not None and state['fitness_cache'] is not None:
+            fitness_cache.set_state(state['fitness_cache'])
+        if pareto_archive is not None and state['pareto_archive'] is not None:
+            pareto_archive.set_state(state['pareto_archive'])
+        if results_store is not None and state['results_store'] is not None:
+            results_store.set_state(state['results_store'])
+        print("The run is continued from the checkpoint " + self.file_name + ".")
+        return state
+
+    def remove(self):
+        if os.path.isfile(self.file_name):
+            os.remove(self.file_name)
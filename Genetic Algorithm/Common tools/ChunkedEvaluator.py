@@ -0,0 +1,37 @@
+from ProcessPoolEvaluator import ProcessPoolEvaluator
+
+
+def evaluate_batch(calc_function, batch):
+    results = []
+    for genes in batch:
+        results.append(calc_function(*genes))
+    return results
+
+
+class ChunkedEvaluator(ProcessPoolEvaluator):
+
+    """
+    Works like ProcessPoolEvaluator, but the members are sent to the workers in batches - the population is divided
+    into batches_per_worker batches for every process. It reduces the cost of communication between processes, when
+    the evaluation of one member is short (e.g. most of properties are already in the cache of property service).
+    """
+
+    def __init__(self, max_workers=None, batches_per_worker=1, warm_up_modules=(), warm_up_fluids=()):
+        super().__init__(max_workers, warm_up_modules, warm_up_fluids)
+        self.batches_per_worker = batches_per_worker
+
+    def evaluate(self, calc_function, list_of_genes):
+        if self.executor is None:
+            self.start(calc_function)
+        if len(list_of_genes) == 0:
+            return []
+
+        # Dividing the members into batches of (almost) equal size:
+        number_of_batches = min(len(list_of_genes), self.max_workers * self.batches_per_worker)
+        batch_size = -(-len(list_of_genes) // number_of_batches)
+        batches = [list_of_genes[i:i + batch_size] for i in range(0, len(list_of_genes), batch_size)]
+
+        results = []
+        for batch_results in self.executor.map(evaluate_batch, [calc_function] * len(batches), batches):
+            results.extend(batch_results)
+        return results
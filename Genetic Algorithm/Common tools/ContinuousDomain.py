@@ -0,0 +1,20 @@
+from GeneDomain import GeneDomain
+
+
+class ContinuousDomain(GeneDomain):
+
+    """
+    Continuous range of values from lower to upper (both included) with the given resolution, e.g. pressure before
+    the turbine from 56e5 to 72e5 Pa every 0.001e5 Pa. The value of candidate is calculated from its index as
+    lower + index * resolution, so there is no error accumulated by adding the resolution many times.
+    """
+
+    def __init__(self, lower, upper, resolution):
+        self.lower = lower
+        self.upper = upper
+        self.resolution = resolution
+        # The small tolerance keeps the upper limit in the domain, when the range isn't exactly divisible in floats:
+        super().__init__(int((upper - lower) / resolution + 1e-9) + 1)
+
+    def value(self, index):
+        return self.lower + int(index) * self.resolution
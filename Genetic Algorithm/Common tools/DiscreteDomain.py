@@ -0,0 +1,16 @@
+from GeneDomain import GeneDomain
+
+
+class DiscreteDomain(GeneDomain):
+
+    """
+    Finite set of numerical candidate values given explicitly, e.g. [40e5, 50e5, 60e5] Pa. Lists of values given to
+    the genetic algorithm are treated as this domain.
+    """
+
+    def __init__(self, values):
+        self.values = list(values)
+        super().__init__(len(self.values))
+
+    def value(self, index):
+        return self.values[index]
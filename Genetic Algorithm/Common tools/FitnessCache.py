@@ -0,0 +1,101 @@
+import os
+import pickle
+
+
+class FitnessCache:
+
+    """
+    Once the population of the genetic algorithm starts to converge, many of the children are identical to one of their
+    parents or to a member which has been already evaluated in one of the previous generations. Calculating the model
+    of HDRM again for such a member gives exactly the same result, so the results are stored in this class under the
+    key made of the values of all genes of the member (28 genes in single-objective and 32 genes in multi-objective
+    optimization).
+
+    If the name of file is given, the results are loaded from this file during initialization and can be saved to it
+    with function save(), so the next runs of the algorithm with the same input data don't have to calculate them again.
+    Function close_generation() should be called at the end of every generation - it saves the hit rate of this
+    generation to the list hit_rates.
+    """
+
+    def __init__(self, calc_function, number_of_genes, file_name=''):
+        self.calc_function = calc_function
+        self.number_of_genes = number_of_genes
+        self.file_name = file_name
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+        # Counters of the current generation:
+        self.gen_hits = 0
+        self.gen_misses = 0
+        # The first element describes the content of the list, the same as in lists of the best members:
+        self.hit_rates = ['hit_rate']
+        if self.file_name != '':
+            self.load()
+
+    def key(self, member):
+        # The objectives stored after the genes are not a part of the key:
+        return tuple(member[0:self.number_of_genes])
+
+    def evaluate_members(self, members_matrix, evaluator):
+        # Only the members which aren't in the cache yet are sent to the evaluator (SerialEvaluator,
+        # ProcessPoolEvaluator, ...). Members repeated in the same generation are calculated once.
+        keys = [self.key(m) for m in members_matrix]
+        missing_keys = []
+        missing_set = set()
+        for key in keys:
+            if key in self.results or key in missing_set:
+                self.hits += 1
+                self.gen_hits += 1
+            else:
+                self.misses += 1
+                self.gen_misses += 1
+                missing_keys.append(key)
+                missing_set.add(key)
+
+        for key, result in zip(missing_keys, evaluator.evaluate(self.calc_function, missing_keys)):
+            self.results[key] = result
+
+        return [self.results[key] for key in keys]
+
+    def close_generation(self):
+        if self.gen_hits + self.gen_misses == 0:
+            gen_hit_rate = 0
+        else:
+            gen_hit_rate = self.gen_hits / (self.gen_hits + self.gen_misses)
+        self.hit_rates.append(gen_hit_rate)
+        print("Fitness cache hit rate: " + str(round(gen_hit_rate * 100, 1)) + " % (" + str(self.gen_hits) + " of "
+              + str(self.gen_hits + self.gen_misses) + " members)")
+        self.gen_hits = 0
+        self.gen_misses = 0
+        return gen_hit_rate
+
+    def get_state(self):
+        # State saved in the checkpoint of the algorithm (see Checkpoint):
+        return {'results': self.results, 'hits': self.hits, 'misses': self.misses, 'hit_rates': self.hit_rates}
+
+    def set_state(self, state):
+        self.results = state['results']
+        self.hits = state['hits']
+        self.misses = state['misses']
+        self.hit_rates = state['hit_rates']
+        self.gen_hits = 0
+        self.gen_misses = 0
+
+    def load(self):
+        if not os.path.isfile(self.file_name):
+            print("FitnessCache.load(): The file " + self.file_name + " doesn't exist yet. It will be created by save().")
+            return
+        with open(self.file_name, 'rb') as file:
+            saved = pickle.load(file)
+        if saved['number_of_genes'] != self.number_of_genes:
+            print("FitnessCache.load(): The file " + self.file_name + " contains results of members with "
+                  + str(saved['number_of_genes']) + " genes, not " + str(self.number_of_genes) + ". It was ignored.")
+            return
+        self.results.update(saved['results'])
+
+    def save(self):
+        if self.file_name == '':
+            print("FitnessCache.save(): The name of file hasn't been set, so the results can't be saved.")
+            return
+        with open(self.file_name, 'wb') as file:
+            pickle.dump({'number_of_genes': self.number_of_genes, 'results': self.results}, file)
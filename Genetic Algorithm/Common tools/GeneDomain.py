@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class GeneDomain(ABC):
+
+    """
+    Base class of domains of the genes optimized by the genetic algorithm. A domain knows the number of candidate
+    values of a gene (size) and returns the value of candidate with the given index, so the values don't have to be
+    stored in a list. The population stores only the indexes of values (see Population).
+    """
+
+    def __init__(self, size):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    @abstractmethod
+    def value(self, index):
+        pass
@@ -0,0 +1,101 @@
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ProcessPoolEvaluator import warm_up_worker
+from RandomStreams import child_seeds
+
+
+def expand_grid(parameters):
+    # All combinations of values of the parameters given as the dictionary (name: list of values), e.g.
+    # {'population': [20, 40], 'probability': [0.2, 0.8]} gives 4 cases. The last parameter changes the fastest:
+    names = list(parameters.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*parameters.values())]
+
+
+def names_of_fluids(fluids):
+    # The fluids of the model are given as names or, if they're optimized, as lists or domains of names - all names are
+    # collected for the warm-up of the workers:
+    names = []
+    for fluid in fluids:
+        values = [fluid] if isinstance(fluid, str) else getattr(fluid, 'values', fluid)
+        for value in values:
+            if value not in names:
+                names.append(value)
+    return names
+
+
+def run_job(genetic_algorithm, case, arguments, seed, metrics, keep_results):
+    # One run of the genetic algorithm - executed in the worker process. The wall time of the run is always measured,
+    # the other values are calculated from the results of the algorithm by the function metrics:
+    start_time = time.time()
+    results = genetic_algorithm(rng=seed, **case, **arguments)
+    values = {'wall_time': time.time() - start_time}
+    if metrics is not None:
+        values.update(metrics(results))
+    return [results if keep_results else None, values]
+
+
+def run_study(genetic_algorithm, cases, arguments, run_times=1, metrics=None, seed=None, max_workers=None,
+              keep_results=False, warm_up_fluids=()):
+
+    # Runs the genetic algorithm for every case (dictionary of its parameters, e.g. made by expand_grid()) run_times
+    # times. The arguments common for all cases (inputs of the model) are given in the dictionary arguments. All runs
+    # are independent jobs, which are executed in parallel by max_workers processes (number of cores of processor by
+    # default, 1 runs them in the current process).
+    #
+    # Every case gets its own seed made from the given one, and every run of the case its own child of this seed (see
+    # child_seeds()), so the runs don't depend on the order in which the workers execute them and the whole study can
+    # be repeated with the same seed.
+    #
+    # Returns the list of rows - for every case its parameters, number of runs and mean and standard deviation of every
+    # value returned by metrics(results) and of the wall time - and the list of results of all runs of every case (if
+    # keep_results is True, otherwise only the rows are kept, so the results don't have to be sent between processes).
+    case_seeds = child_seeds(seed, len(cases))
+    jobs = []
+    for case, case_seed in zip(cases, case_seeds):
+        for run_seed in child_seeds(case_seed, run_times):
+            jobs.append((genetic_algorithm, case, arguments, run_seed, metrics, keep_results))
+
+    if max_workers is None:
+        max_workers = os.cpu_count()
+    if max_workers == 1:
+        job_results = [run_job(*job) for job in jobs]
+    else:
+        # The module of the algorithm is imported by the workers in advance - for a functools.partial (like the versions
+        # of genetic_algorithm_soo()) it's the module of the wrapped function:
+        module_name = getattr(genetic_algorithm, 'func', genetic_algorithm).__module__
+        initargs = ([module_name], names_of_fluids(warm_up_fluids))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=warm_up_worker, initargs=initargs) as executor:
+            futures = [executor.submit(run_job, *job) for job in jobs]
+            job_results = [future.result() for future in futures]
+
+    rows = []
+    results = []
+    for number, case in enumerate(cases):
+        runs = job_results[number * run_times:(number + 1) * run_times]
+        row = dict(case)
+        row['runs'] = run_times
+        for name in runs[0][1]:
+            values = [run[1][name] for run in runs]
+            row[name + '_mean'] = float(np.mean(values))
+            row[name + '_std'] = float(np.std(values))
+        rows.append(row)
+        results.append([run[0] for run in runs])
+    return [rows, results]
+
+
+def write_study_table(worksheet, rows):
+    # Consolidated table of the study - one row for every case, the columns are the parameters of the case and
+    # the mean and standard deviation of measured values:
+    if len(rows) == 0:
+        return
+    names = list(rows[0].keys())
+    for column, name in enumerate(names):
+        worksheet.write(0, column, name)
+    for row_number, row in enumerate(rows):
+        for column, name in enumerate(names):
+            worksheet.write(row_number + 1, column, row[name])
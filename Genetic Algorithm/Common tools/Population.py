@@ -0,0 +1,150 @@
+import numpy as np
+
+from CategoricalDomain import CategoricalDomain
+from DiscreteDomain import DiscreteDomain
+from GeneDomain import GeneDomain
+
+
+def gene_domain(v):
+
+    # Domain of the gene given to the algorithm: domains (ContinuousDomain, DiscreteDomain, CategoricalDomain) are used
+    # as they are, lists of values are treated as discrete (or categorical, if they contain names) domains. None is
+    # returned for the fixed genes.
+    if isinstance(v, GeneDomain):
+        return v
+    if type(v) is list:
+        if any(isinstance(value, str) for value in v):
+            return CategoricalDomain(v)
+        return DiscreteDomain(v)
+    return None
+
+
+def permutation_pairs(number_of_parents, number_of_children, rng):
+
+    # Pairing of parents for the children of one generation. In every round all parents (indexes 0, 1, ...) are
+    # shuffled and paired one after another, so every parent takes part in the reproduction once per round - like
+    # drawing pairs of parents without returning them. If the number of parents is odd, the last parent of the round
+    # gets a random partner from the other parents. All rounds are drawn at once.
+    pairs_per_round = (number_of_parents + 1) // 2
+    rounds = -(-number_of_children // pairs_per_round)
+    shuffled = rng.permuted(np.tile(np.arange(number_of_parents), (rounds, 1)), axis=1)
+    if number_of_parents % 2 == 1:
+        partners = (shuffled[:, -1] + rng.integers(1, max(number_of_parents, 2), size=rounds)) % number_of_parents
+        shuffled = np.column_stack([shuffled, partners])
+    parents1 = shuffled[:, 0::2].ravel()[0:number_of_children]
+    parents2 = shuffled[:, 1::2].ravel()[0:number_of_children]
+    return [parents1, parents2]
+
+
+class Population:
+
+    """
+    Members of population of the genetic algorithm stored in NumPy arrays. Every gene of a member is stored as the
+    index of its value in the domain of the gene (see gene_domain()) given in the list var of all genes - the fixed
+    genes are given as single values and get the index 0. The genes of all members make one integer array
+    genes with one row per member, so mutation, crossover and sorting are operations on rows and columns of this array.
+
+    The objectives are stored in the structured array objectives with named fields (e.g. 'efficiency' or
+    'efficiency' and 'sic'), so they are read by names, not by the index after the last gene. The values of genes are
+    decoded only when the members are sent to evaluation or saved to the results - function members_matrix() returns
+    the members in the same form as the lists of members used before: values of genes followed by the objectives.
+
+    Random operations (initialization, mutation, crossover) use the NumPy generator rng, which is shared by all
+    populations made from this one.
+    """
+
+    def __init__(self, var, size, objective_names, rng=None):
+        self.var = var
+        self.objective_names = tuple(objective_names)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.domains = [gene_domain(v) for v in var]
+        # Number of candidate values of every gene, 1 for the fixed ones:
+        self.domain_sizes = np.array([1 if d is None else d.size for d in self.domains], dtype=np.int64)
+        self.genes = np.zeros((size, len(var)), dtype=np.int64)
+        self.objectives = np.full(size, np.nan, dtype=[(name, float) for name in self.objective_names])
+
+    def __len__(self):
+        return self.genes.shape[0]
+
+    def copy_structure(self, size):
+        # Empty population with the same genes and objectives:
+        population = Population([], 0, self.objective_names, self.rng)
+        population.var = self.var
+        population.domains = self.domains
+        population.domain_sizes = self.domain_sizes
+        population.genes = np.zeros((size, len(self.var)), dtype=np.int64)
+        population.objectives = np.full(size, np.nan, dtype=self.objectives.dtype)
+        return population
+
+    def randomize(self):
+        # Random choice of the values of all genes (the fixed genes have only one value):
+        self.genes = self.rng.integers(0, self.domain_sizes, size=self.genes.shape)
+        self.objectives[:] = np.nan
+
+    def value(self, gene, index):
+        domain = self.domains[gene]
+        return self.var[gene] if domain is None else domain.value(index)
+
+    def values(self, member):
+        # Values of genes of one member - arguments of the calculating function:
+        return [self.value(gene, index) for gene, index in enumerate(self.genes[member].tolist())]
+
+    def list_of_genes(self):
+        return [self.values(member) for member in range(len(self))]
+
+    def set_objectives(self, results):
+        # Results of the calculating function in the order of members - single values for one objective, lists of
+        # values in the order of objective_names for more of them:
+        if len(self.objective_names) == 1:
+            self.objectives[self.objective_names[0]] = results
+        else:
+            for number, name in enumerate(self.objective_names):
+                self.objectives[name] = [result[number] for result in results]
+
+    def take(self, members):
+        # New population made of the members with given indexes (in the given order):
+        population = self.copy_structure(0)
+        population.genes = self.genes[members]
+        population.objectives = self.objectives[members]
+        return population
+
+    def concatenate(self, other):
+        population = self.copy_structure(0)
+        population.genes = np.concatenate([self.genes, other.genes])
+        population.objectives = np.concatenate([self.objectives, other.objectives])
+        return population
+
+    def sort(self, name, reverse=False):
+        # Sorting members by one objective in place. The sorting is stable, so the members with equal values keep their
+        # order, the same as with function sorted():
+        order = np.argsort(self.objectives[name], kind='stable')
+        if reverse:
+            # Like sorted() followed by reverse():
+            order = order[::-1]
+        self.genes = self.genes[order]
+        self.objectives = self.objectives[order]
+
+    def mutate(self, probability, first_member=0):
+        # Every gene which has more than one candidate value is mutated with the given probability into a different
+        # value. The members before first_member (e.g. the alpha member) aren't mutated. The genes to be mutated are
+        # chosen for the whole population at once with the mask of random numbers.
+        genes = self.genes[first_member:]
+        mask = (self.rng.random(size=genes.shape) < probability) & (self.domain_sizes > 1)
+        # Shifting the index by 1 to (number of values - 1) positions gives every other value with the same
+        # probability:
+        shift = self.rng.integers(1, np.maximum(self.domain_sizes, 2), size=genes.shape)
+        genes[mask] = ((genes + shift) % self.domain_sizes)[mask]
+        self.objectives[first_member:][mask.any(axis=1)] = np.nan
+
+    def crossover(self, parents1, parents2):
+        # Uniform crossover - every gene of the child is taken from one of its two parents (indexes of members) at
+        # random. All children are made at once. Returns the population of children:
+        children = self.copy_structure(len(parents1))
+        from_first_parent = self.rng.random(size=children.genes.shape) < 0.5
+        children.genes = np.where(from_first_parent, self.genes[parents1], self.genes[parents2])
+        return children
+
+    def members_matrix(self):
+        # Members as the lists of values of genes followed by the values of objectives:
+        return [self.values(member) + [float(self.objectives[name][member]) for name in self.objective_names]
+                for member in range(len(self))]
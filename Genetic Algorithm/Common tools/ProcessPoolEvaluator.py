@@ -0,0 +1,56 @@
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from CoolProp.CoolProp import PropsSI
+
+from SerialEvaluator import SerialEvaluator
+
+
+def warm_up_worker(module_names, fluids):
+    # Executed once in every worker process before it receives the first member. Importing the modules of the model
+    # and loading the data of fluids into CoolProp takes time, which otherwise would be added to the evaluation of the
+    # first members sent to each worker.
+    for module_name in module_names:
+        importlib.import_module(module_name)
+    for fluid in fluids:
+        PropsSI('Tcrit', fluid)
+
+
+def evaluate_genes(calc_function, genes):
+    return calc_function(*genes)
+
+
+class ProcessPoolEvaluator(SerialEvaluator):
+
+    """
+    Evaluation of one member is pure CPU work in CoolProp, so the members of population are distributed between the
+    processes of concurrent.futures.ProcessPoolExecutor - every member is sent to the workers as a separate task.
+    The pool is started during the first evaluation, with warm-up of the module of calculating function, modules given
+    in warm_up_modules and the fluids given in warm_up_fluids. The number of processes equals max_workers (number of
+    cores of processor by default).
+    """
+
+    def __init__(self, max_workers=None, warm_up_modules=(), warm_up_fluids=()):
+        if max_workers is None:
+            max_workers = os.cpu_count()
+        self.max_workers = max_workers
+        self.warm_up_modules = list(warm_up_modules)
+        self.warm_up_fluids = list(warm_up_fluids)
+        self.executor = None
+
+    def start(self, calc_function):
+        module_names = [calc_function.__module__] + self.warm_up_modules
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=warm_up_worker,
+                                            initargs=(module_names, self.warm_up_fluids))
+
+    def evaluate(self, calc_function, list_of_genes):
+        if self.executor is None:
+            self.start(calc_function)
+        # Function map() returns the results in the order of given members:
+        return list(self.executor.map(evaluate_genes, [calc_function] * len(list_of_genes), list_of_genes))
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
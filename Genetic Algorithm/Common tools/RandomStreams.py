@@ -0,0 +1,26 @@
+import numpy as np
+
+
+def make_rng(seed=None):
+
+    # Generator of random numbers of one run of the genetic algorithm. The seed can be:
+    # - None - the generator is seeded with fresh entropy from the operating system, so every run is different,
+    # - an integer or numpy.random.SeedSequence (e.g. one of child_seeds()) - the run can be repeated,
+    # - numpy.random.Generator - it's used as it is, so the runs can share one stream of numbers.
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def child_seeds(seed, number):
+
+    # Independent seeds for number of runs made from one seed (e.g. repeated runs of the same case, or cases sent to
+    # different processes). The children of SeedSequence don't overlap with each other and with the parent, which isn't
+    # guaranteed for consecutive integer seeds. The same seed always gives the same children, so a whole series of
+    # runs can be repeated. The seed can be given in the same forms as to make_rng() - for SeedSequence and Generator
+    # the next children are returned at every call.
+    if isinstance(seed, np.random.Generator):
+        return [np.random.SeedSequence(s) for s in seed.integers(0, 2 ** 63, size=number).tolist()]
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(number)
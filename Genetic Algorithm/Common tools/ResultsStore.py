@@ -0,0 +1,173 @@
+import json
+import os
+
+import numpy as np
+
+
+def write_json_atomically(file_name, data):
+    # The data is written to a temporary file, which then replaces the old one, so after a crash the file contains
+    # either the old or the new data, never a part of them:
+    temporary_file_name = file_name + '.tmp'
+    with open(temporary_file_name, 'w') as file:
+        json.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_file_name, file_name)
+
+
+class ResultsStore:
+
+    """
+    Saves the results of the genetic algorithm to the disk during the run, generation after generation, instead of
+    keeping them in memory until the end. The results are stored in the directory as tables of columns - every column
+    is a separate binary file (raw NumPy array), to which the values of new rows are appended. The names and types of
+    columns and the number of saved rows are stored in the file index.json, which is replaced after every appended
+    block of rows, so the rows written during a crash are ignored and the data of all finished generations survives.
+
+    Table 'members' contains the members of every generation - the columns 'generation' and 'set' (the number of the
+    set in SETS: the whole population, its Pareto front, or the non-dominated members of the whole run), followed by
+    the columns of genes and objectives given in member_columns, in the order of values in members matrix. Other tables
+    (e.g. 'convergence') can be added with append_row().
+
+    The saved members are read one generation after another with members_matrices(), so even the results of long runs
+    can be exported (e.g. to xlsx) without loading them all at once. With mode 'a' the results are appended to the
+    already existing store, e.g. when the interrupted run is continued.
+    """
+
+    SETS = ('population', 'pareto', 'total')
+
+    def __init__(self, directory, member_columns, mode='w'):
+        self.directory = directory
+        self.member_columns = list(member_columns)
+        # For every table: {'columns': [[name, type], ...], 'rows': number of saved rows}
+        self.tables = {}
+        self.files = {}
+        os.makedirs(directory, exist_ok=True)
+        if mode == 'a' and os.path.isfile(self.index_file_name()):
+            with open(self.index_file_name()) as file:
+                self.set_state(json.load(file)['tables'])
+        else:
+            for file_name in os.listdir(directory):
+                if file_name.endswith('.bin') or file_name == 'index.json':
+                    os.remove(os.path.join(directory, file_name))
+            write_json_atomically(self.index_file_name(), {'tables': self.tables})
+
+    def index_file_name(self):
+        return os.path.join(self.directory, 'index.json')
+
+    def column_file_name(self, table, name):
+        return os.path.join(self.directory, table + '.' + name + '.bin')
+
+    def append(self, table, columns):
+
+        # Appends the rows given as the dictionary of columns (name: list of values) to the table. The types of columns
+        # are chosen when the first rows are appended: numbers are saved as floats, names (e.g. of fluids) as strings.
+        if table not in self.tables:
+            description = []
+            for name, values in columns.items():
+                if name in ('generation', 'set'):
+                    column_type = '<i8'
+                elif any(isinstance(value, str) for value in values):
+                    column_type = '<U32'
+                else:
+                    column_type = '<f8'
+                description.append([name, column_type])
+            self.tables[table] = {'columns': description, 'rows': 0}
+
+        number_of_rows = 0
+        for name, column_type in self.tables[table]['columns']:
+            values = np.asarray(columns[name], dtype=column_type)
+            number_of_rows = len(values)
+            key = (table, name)
+            if key not in self.files:
+                self.files[key] = open(self.column_file_name(table, name), 'ab')
+            values.tofile(self.files[key])
+            self.files[key].flush()
+        self.tables[table]['rows'] += number_of_rows
+        write_json_atomically(self.index_file_name(), {'tables': self.tables})
+
+    def get_state(self):
+        # Saved in the checkpoint of the algorithm (see Checkpoint), so the rows appended after the checkpoint can be
+        # removed, when the run is continued from it:
+        return json.loads(json.dumps(self.tables))
+
+    def set_state(self, tables):
+        # Removing the rows which have been written after the given state (e.g. after the last update of index):
+        for file in self.files.values():
+            file.close()
+        self.files = {}
+        self.tables = tables
+        for table, description in self.tables.items():
+            for name, column_type in description['columns']:
+                size = description['rows'] * np.dtype(column_type).itemsize
+                with open(self.column_file_name(table, name), 'ab') as file:
+                    if file.tell() < size:
+                        print("ResultsStore.set_state(): The file " + self.column_file_name(table, name) + " doesn't "
+                              "contain all saved rows. The store has to be opened with mode 'a' to continue the run.")
+                    else:
+                        file.truncate(size)
+        for table_file_name in os.listdir(self.directory):
+            if table_file_name.endswith('.bin') and table_file_name.split('.')[0] not in self.tables:
+                os.remove(os.path.join(self.directory, table_file_name))
+        write_json_atomically(self.index_file_name(), {'tables': self.tables})
+
+    def append_members(self, generation, set_name, members_matrix):
+        columns = {'generation': [generation] * len(members_matrix),
+                   'set': [self.SETS.index(set_name)] * len(members_matrix)}
+        for number, name in enumerate(self.member_columns):
+            columns[name] = [member[number] for member in members_matrix]
+        self.append('members', columns)
+
+    def append_row(self, table, row):
+        # Appends one row given as the dictionary (name: value):
+        self.append(table, {name: [value] for name, value in row.items()})
+
+    def read(self, table):
+        # Returns the dictionary of columns of the table (name: array). The arrays are mapped to the files, not loaded
+        # to memory, so only the parts of columns which are used are read from the disk:
+        if table not in self.tables:
+            return {}
+        for file in self.files.values():
+            file.flush()
+        rows = self.tables[table]['rows']
+        columns = {}
+        for name, column_type in self.tables[table]['columns']:
+            if rows == 0:
+                columns[name] = np.zeros(0, dtype=column_type)
+            else:
+                columns[name] = np.memmap(self.column_file_name(table, name), dtype=column_type, mode='r',
+                                          shape=(rows,))
+        return columns
+
+    def members_matrices(self, set_name):
+        # Generator of members matrices of the given set, one for every generation, in the same form as in the lists
+        # of results of the genetic algorithm (values of genes followed by the objectives):
+        columns = self.read('members')
+        if len(columns) == 0:
+            return
+        # The rows of one generation are saved together, so they're found as the consecutive rows of the set:
+        rows = np.flatnonzero(columns['set'] == self.SETS.index(set_name))
+        if len(rows) == 0:
+            return
+        starts = np.flatnonzero(np.diff(columns['generation'][rows]) != 0) + 1
+        for block in np.split(rows, starts):
+            member_columns = [columns[name][block].tolist() for name in self.member_columns]
+            yield [list(member) for member in zip(*member_columns)]
+
+    def rows(self, table):
+        # All rows of the (small) table as the lists of values:
+        columns = self.read(table)
+        if len(columns) == 0:
+            return []
+        return [list(row) for row in zip(*[column.tolist() for column in columns.values()])]
+
+    def close(self):
+        for file in self.files.values():
+            file.close()
+        self.files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,28 @@
+class SerialEvaluator:
+
+    """
+    Evaluators calculate the model of HDRM for the members of population in step "Evaluation" of the genetic algorithm.
+    Function evaluate() receives the calculating function (calculate_eff or calculate_eff_evap_as_heat_source) and the
+    list of genes of members, and returns the list of results in the same order.
+
+    This evaluator calculates members one after another in the current process. It is the default one - the other
+    evaluators (ProcessPoolEvaluator, ChunkedEvaluator) distribute the members between processes and have to be closed
+    with function shutdown() after the last run of the algorithm, or used in the "with" statement. BatchEvaluator
+    calculates the whole population with one call of the batch version of the model.
+    """
+
+    def evaluate(self, calc_function, list_of_genes):
+        results = []
+        for genes in list_of_genes:
+            results.append(calc_function(*genes))
+        return results
+
+    def shutdown(self):
+        # There's nothing to be closed in this evaluator.
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -1,41 +1,87 @@
-import random
 import time
+from bisect import bisect_left, bisect_right
 
+import numpy as np
 import xlsxwriter
-from numpy.random import randint
-from numpy.random import seed
 
 from HDRM_MOO_calc_model import calculate_eff_evap_as_heat_source
 from HDRM_SOO_calc_model import calculate_eff
-
-def is_dominated_by_any(member, dominants):
-    for dominant in dominants:
-        if (member[32] < dominant[32] and member[33] >= dominant[33]) \
-                or (member[32] <= dominant[32] and member[33] > dominant[33]):
-            return True
-    return False
-
-
-def is_equal_to_any(member, dominants):
-    for dominant in dominants:
-        if member == dominant:
-            return True
-    return False
+from Checkpoint import Checkpoint
+from ContinuousDomain import ContinuousDomain
+from FitnessCache import FitnessCache
+from ParameterStudy import expand_grid, run_study, write_study_table
+from ParetoArchive import ParetoArchive
+from Population import Population, permutation_pairs
+from RandomStreams import child_seeds, make_rng
+from ResultsStore import ResultsStore
+from SerialEvaluator import SerialEvaluator
+
+# Names of values in members matrices - 32 genes (arguments of calculate_eff_evap_as_heat_source) and the objectives,
+# used as the names of columns in ResultsStore:
+MEMBER_COLUMNS = ['q_cap', 'work_fl', 'amb_work_fl_cond', 'amb_work_fl_evap', 't_cond', 'overc_cond', 't_evap',
+                  'overh_evap', 'press_bef_turb', 'temp_bef_turb', 'pr_evap', 'amb_pr_evap', 'pr_cond', 'amb_pr_cond',
+                  'pr_boil', 'pr_evap_hot_side', 'amb_t_evap_in', 'amb_t_evap_out', 'amb_t_cond_in', 'amb_t_cond_out',
+                  'amb_p_evap_out', 'amb_p_cond_out', 'isent_eff_turb', 'isent_eff_pump', 'elec_eff_pump',
+                  'isent_eff_comp', 'eff_turboeq', 'amb_work_fl_evap_hot_side', 'amb_p_evap_hot_side_out',
+                  'evap_hot_side_pinch_point', 'amb_t_evap_hot_side_in', 'amb_pr_evap_hot_side', 'efficiency', 'sic']
+# Names of the data of convergence saved after every generation:
+CONVERGENCE_COLUMNS = ['current_total', 'old_dominated', 'old_nondominated', 'new_nondominated', 'hypervolume']
+
+
+def efficiency_keys(members_matrix):
+    # Keys for the bisection in lists of members sorted by efficiency from the highest one:
+    return [-member[32] for member in members_matrix]
+
+
+def is_dominated_by_any(member, dominants, keys):
+
+    # The dominants have to be non-dominated members sorted by efficiency from the highest one (like the Pareto set
+    # returned by front()), keys are their efficiency_keys(). Going down the list the SIC decreases as well, so among
+    # the members with efficiency not lower than the one of checked member, the last one has the lowest SIC and only
+    # this one has to be compared.
+    index = bisect_right(keys, -member[32])
+    if index == 0:
+        return False
+    dominant = dominants[index - 1]
+    return dominant[33] < member[33] or (dominant[33] == member[33] and dominant[32] > member[32])
+
+
+def is_equal_to_any(member, dominants, keys):
+    # Only the members with the same efficiency can be equal:
+    return member in dominants[bisect_left(keys, -member[32]):bisect_right(keys, -member[32])]
+
+
+def front_indexes(members_matrix):
+
+    # Sort-and-sweep method for two objectives: the members are visited in order of decreasing efficiency (members
+    # with equal efficiencies in order of increasing SIC). A member is non-dominated, if its SIC is lower than the SIC
+    # of all members visited before. A member with the same SIC as the lowest one is non-dominated only if it has
+    # also the same efficiency. The indexes of Pareto members are returned in the order of members_matrix.
+    order = sorted(range(len(members_matrix)), key=lambda i: (-members_matrix[i][32], members_matrix[i][33]))
+    is_pareto = [False for x in range(len(members_matrix))]
+    lowest_sic = None
+    for i in order:
+        member = members_matrix[i]
+        if lowest_sic is None or member[33] < lowest_sic[33]:
+            lowest_sic = member
+            is_pareto[i] = True
+        elif member[33] == lowest_sic[33] and member[32] == lowest_sic[32]:
+            is_pareto[i] = True
+    return [i for i in range(len(members_matrix)) if is_pareto[i]]
 
 
 def front(members_matrix):
+    return [members_matrix[i] for i in front_indexes(members_matrix)]
 
-    if len(members_matrix) == 1:
-        return members_matrix
 
-    else:
-        t = front(members_matrix[0:int(len(members_matrix)/2)])
-        b = front(members_matrix[int(len(members_matrix)/2):len(members_matrix)])
-        m = []  # matrix containing final results
-        for member in b:
-            if not is_dominated_by_any(member, t):
-                m.append(member)
-    return m + t
+def store_generation(results_store, generation, members_matrix, pareto_members_matrix, convergence_result):
+    # Saving the members, the Pareto front and the data of convergence of one generation to the ResultsStore:
+    results_store.append_members(generation, 'population', members_matrix)
+    results_store.append_members(generation, 'pareto', pareto_members_matrix)
+    row = {'generation': generation}
+    for name, value in zip(CONVERGENCE_COLUMNS, convergence_result):
+        row[name] = value
+    results_store.append_row('convergence', row)
 
 
 def ga_multi_obj_opt_kungs_alg(population, probability, generations, consolidation_ratio,
@@ -60,20 +106,22 @@ def ga_multi_obj_opt_kungs_alg(population, probability, generations, consolidati
 
                                          amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
                                          amb_t_evap_hot_side_in,
-                                         amb_pr_evap_hot_side):
+                                         amb_pr_evap_hot_side, fitness_cache=None, evaluator=None,
+                                         pareto_archive=None, rng=None, results_store=None,
+                                         checkpoint=None):
 
     # This function realizes multi objective optimization according to Kung's method. Therefore, it is
     # necessary to choose two objectives according to which the model is going to be optimized.
     # These objectives are efficiency of HDRM and specified investment cost (SIC) of HDRM.
 
-    # This list is going to be returned as the result of algorithm:
+    # This list is going to be returned as the result of algorithm. If the ResultsStore is given, the members and
+    # Pareto fronts of generations are saved to it as the run progresses instead of these lists, so the memory used
+    # doesn't grow with the number of generations and a crash doesn't lose the finished generations:
     list_of_members_matrices = []
     list_of_pareto_members = []
     current_total = []
-    old_dominated = []
-    old_nondominated = []
-    new_nondominated = []
-    # In the list below after every generation the lengths of lists above will be saved.
+    # In the list below after every generation the lengths of lists of old-dominated, old-nondominated and
+    # new-nondominated members will be saved.
     convergence_results = []
     # For the investigation of convergence:
     gen_completed = 0
@@ -88,70 +136,60 @@ def ga_multi_obj_opt_kungs_alg(population, probability, generations, consolidati
            amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
            amb_pr_evap_hot_side]
 
-    # Size of this matrix must take into consideration the efficiency and SIC
-    # which will be stored on the last indexes in every member.
-    members_matrix = [[0 for x in range(var.__len__() + 2)] for y in range(population)]
-
-    # There's a need of a list containing the best members of particular generations. This is only for the purpose
-    # of evaluation of the algorithm:
-    best_members = ['efficiency']
-    best_members_turb_eff = ['turb_eff']
-    best_members_temp_cond = ['temp_cond']
-    best_members_comp_eff = ['comp_eff']
-    best_members_pump_eff = ['pump_eff']
-    best_members_boil_eff = ['boil_eff']
-
-    # Number of members of population is set by the client. Values are being ascribed to members:
-    for m in members_matrix:
-        var_count = 0
-        for v in var:
-            if type(v) is list:
-                # Random choice of the value
-                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-            else:
-                # Choosing the fixed value
-                m[var_count] = v
-            var_count += 1
-
-    for x in range(generations):
+    # The results of members which have been already evaluated are reused. If the cache of fitness hasn't been given,
+    # it's created only for this run of the algorithm:
+    if fitness_cache is None:
+        fitness_cache = FitnessCache(calculate_eff_evap_as_heat_source, var.__len__())
+    # Members are calculated one after another, unless an evaluator distributing them between processes is given:
+    if evaluator is None:
+        evaluator = SerialEvaluator()
+    # Generator of random numbers for all random operations of the algorithm - rng can be a generator or a seed, runs
+    # with the same seed give the same results:
+    rng = make_rng(rng)
+
+    # Number of members of population is set by the client. Values are being ascribed to members at random, the
+    # efficiency and SIC are stored as the objectives of population:
+    members = Population(var, population, ('efficiency', 'sic'), rng)
+    members.randomize()
+
+    # If the checkpoint has been saved by the previous (interrupted) run, the run is continued from the saved
+    # generation. The finished run returns its saved results:
+    first_generation = 0
+    state = None if checkpoint is None else checkpoint.load(fitness_cache, pareto_archive, results_store)
+    if state is not None:
+        if state['finished']:
+            return state['results']
+        first_generation = state['generation']
+        members = state['members']
+        list_of_members_matrices, list_of_pareto_members, current_total, convergence_results, gen_completed = \
+            state['variables']
+        start_time = time.time() - state['operation_time']
+
+    for x in range(first_generation, generations):
         print("Generation " + str(x))
 
         # 1. Mutation:
         # No mutation for the 0 generation.
         if x != 0:
-            for m in members_matrix:
-                var_count = 0
-                for v in var:
-                    if type(v) is list:
-                        # With a fixed probability this condition will be entered:
-                        if random.randint(1, 100) <= probability * 100:
-                            # This is necessary to avoid mutating into the same value:
-                            mutated = m[var_count]
-                            while mutated is m[var_count]:
-                                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-                            # After the while loop the mutated value is for sure different from the previous one
-                    var_count += 1
+            members.mutate(probability)
 
         # 2. Evaluation - calculating efficiencies and specified investment cost (SIC) of members, according to which
         # the members are going to be rightly compared in multi objective optimization:
-        for m in members_matrix:
-            results = calculate_eff_evap_as_heat_source(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9],
-                                                        m[10], m[11], m[12], m[13], m[14], m[15], m[16], m[17],
-                                                        m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                                        m[25], m[26], m[27], m[28], m[29], m[30], m[31])
-            m[32] = results[0]  # efficiency
-            m[33] = results[1]  # SIC
+        members.set_objectives(fitness_cache.evaluate_members(members.list_of_genes(), evaluator))
+
+        fitness_cache.close_generation()
 
         # 3. Sorting members regarding one of the objectives - efficiency:
-        members_matrix = sorted(members_matrix, key=lambda member: member[32])
-        members_matrix.reverse()
-        # Saving for the results:
-        list_of_members_matrices.append(members_matrix)
+        members.sort('efficiency', reverse=True)
+        members_matrix = members.members_matrix()
 
         # 4. Choosing non-dominated members, which is unequivocal with choosing the points for Pareto line:
-        pareto_members_matrix = front(members_matrix)
-        # Saving for the results:
-        list_of_pareto_members.append(pareto_members_matrix)
+        pareto_indexes = front_indexes(members_matrix)
+        pareto_members_matrix = [members_matrix[i] for i in pareto_indexes]
+        # Saving for the results - in memory, or to the ResultsStore, if it's given:
+        if results_store is None:
+            list_of_members_matrices.append(members_matrix)
+            list_of_pareto_members.append(pareto_members_matrix)
         # Checking the convergence:
         current_convergence_result = check_convergence(current_total, pareto_members_matrix,
                                                        min_consol_rat=consolidation_ratio)
@@ -160,6 +198,17 @@ def ga_multi_obj_opt_kungs_alg(population, probability, generations, consolidati
         # Saving the data of convergence:
         convergence_results.append([current_convergence_result[1], current_convergence_result[2],
                                     current_convergence_result[3], current_convergence_result[4]])
+        # The hypervolume of Pareto archive (if it's given) is saved with the data of convergence:
+        if pareto_archive is not None:
+            pareto_archive.insert_members(pareto_members_matrix)
+            convergence_results[-1].append(pareto_archive.hypervolume)
+        if results_store is not None:
+            store_generation(results_store, x, members_matrix, pareto_members_matrix, convergence_results[-1])
+        # The run is stopped, when the hypervolume stops improving:
+        if pareto_archive is not None and pareto_archive.close_generation():
+            print("The hypervolume of Pareto front has stopped improving.")
+            gen_completed = x + 1
+            break
         if current_convergence_result[5]:
             print("The algorithm has converged.")
             gen_completed = x + 1
@@ -172,113 +221,330 @@ def ga_multi_obj_opt_kungs_alg(population, probability, generations, consolidati
 
         # 5. The non-dominated members are treated as parents.
         # In oder to avoid situation when after front() function there is too few members to ensure a proper
-        # diversity of gens, there is a minimum number of 3 members required for the reproduction process.
-        if len(pareto_members_matrix) == 1 or len(pareto_members_matrix) == 2:
-            second_best_efficiency_member = members_matrix[1]
-            members_matrix = sorted(members_matrix, key=lambda member: member[33])
-            second_best_sic_member = members_matrix[1]
-            pareto_members_matrix.append(second_best_efficiency_member)
-            pareto_members_matrix.append(second_best_sic_member)
+        # diversity of gens, there is a minimum number of 3 members required for the reproduction process - the second
+        # best members regarding efficiency and SIC are added to the parents.
+        if len(pareto_indexes) == 1 or len(pareto_indexes) == 2:
+            pareto_indexes.append(1)
+            pareto_indexes.append(int(members.objectives['sic'].argsort(kind='stable')[1]))
             # Apparently after this operation the list of parents might contain 3 or 4 members.
 
-        # 4. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. Firstly
-        # two randomly chosen parents are removed from the list of members. From their gens the child is going to be
-        # created. This procedure is repeated until there's no parent left, or there's one last parent left without
-        # pair. In this case for this exact parent, some random parent is going to be chosen from the initiatory
-        # collection of parents.
-        children_matrix = [[0 for i in range(var.__len__() + 2)] for j in range(population)]
-        child_count = 0
-        # This loop is going to be repeated until the number of required members of new population is reached.
-        # First while loop:
-        while child_count + 1 <= population:
-
-            # initiatory_members_matrix is created for the purpose of making children. It's made every time when there's
-            # no parents left to make children. It's necessary, because every time the child is made, both of his
-            # parents are removed from the initiatory_members_matrix. This ensures a proper variety of pairs of parents
-            # mixing each other's gens in order to make children. With such an approach the diversity of gens among next
-            # generation will be possibly increased, which makes the genetic algorithm more efficient.
-            initiatory_members_matrix = pareto_members_matrix[:]
-
-            # Second while loop:
-            while initiatory_members_matrix.__len__() > 0 and child_count + 1 <= population:
-
-                # Random choice of the first parent:
-                parent1 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-
-                # It can happen that there's only one parent left (if there's no parents left the "while" loop will be
-                # ended anyway). This case must be managed:
-                if initiatory_members_matrix.__len__() == 1:
-                    initiatory_members_matrix.remove(parent1)
-                    parent2 = parent1
-                    # This is necessary to avoid choosing the same parent:
-                    while_count = 0
-                    while parent1 == parent2:
-                        parent2 = members_matrix[random.randint(0, members_matrix.__len__() - 1)]
-                        while_count += 1
-                        # In case all members of population are the same, or at least, there's a suspicion of it, it'd
-                        # be good to make sure the loop is not going to run forever:
-                        are_all_equal = True
-                        if while_count > population and are_all_equal:
-                            for m in pareto_members_matrix:
-                                if parent1 != m:
-                                    are_all_equal = False
-                        if are_all_equal:
-                            break
-
-                    # Now it's ensured parents are different, except from the case in which all members of
-                    # population are the same.
-
-                # For the case, in which there're at least two parents in the initiatory_members_matrix:
-                else:
-                    initiatory_members_matrix.remove(parent1)
-                    parent2 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-                    initiatory_members_matrix.remove(parent2)
-
-                # In this moment there're 2 parents chosen, so it's possible to make a child:
-                var_count = 0
-                for v in parent1:
-                    # Random choice of the chromosomes for child:
-                    if random.randint(1, 2) == 1:
-                        children_matrix[child_count][var_count] = v
-                    else:
-                        children_matrix[child_count][var_count] = parent2[var_count]
-                    var_count += 1
-
-                # Because the child has been made:
-                child_count += 1
-
-        # 5. Children become now members of the new generation.
-        members_matrix = children_matrix
-
-    # The last operation is adding current_total list to the list_of_members_matrices in order to show in the
-    # results the overall nondominated solutions found during the entire operation of Genetic Algorithm.
-    list_of_members_matrices.append(current_total)
+        # 6. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. The
+        # parents are paired at random in rounds - in every round each parent is used once (see permutation_pairs()),
+        # which ensures a proper variety of pairs of parents mixing each other's gens.
+        parents = np.array(pareto_indexes)
+        parents1, parents2 = permutation_pairs(len(parents), population, members.rng)
+
+        # 7. Children become now members of the new generation.
+        members = members.crossover(parents[parents1], parents[parents2])
+
+        # Saving the state of the algorithm before the next generation:
+        if checkpoint is not None and checkpoint.is_due(x):
+            checkpoint.save({'finished': False, 'generation': x + 1, 'members': members,
+                             'variables': [list_of_members_matrices, list_of_pareto_members, current_total,
+                                           convergence_results, gen_completed],
+                             'operation_time': time.time() - start_time}, fitness_cache, pareto_archive, results_store)
+
+    # The last operation is adding current_total list to the list_of_members_matrices (or to the ResultsStore) in
+    # order to show in the results the overall nondominated solutions found during the entire operation of Genetic
+    # Algorithm.
+    if results_store is None:
+        list_of_members_matrices.append(current_total)
+    else:
+        results_store.append_members(gen_completed, 'total', current_total)
     end_time = time.time()
     operation_time = end_time - start_time
 
-    return [list_of_members_matrices, list_of_pareto_members, convergence_results,
-            gen_completed, operation_time, current_total]
+    if fitness_cache.file_name != '':
+        fitness_cache.save()
+
+    results = [list_of_members_matrices, list_of_pareto_members, convergence_results,
+               gen_completed, operation_time, current_total]
+    if checkpoint is not None:
+        checkpoint.save_finished(results, fitness_cache, pareto_archive, results_store)
+    return results
+
+
+def objective_points(members):
+    # Pairs (efficiency, SIC) of all members of population:
+    return list(zip(members.objectives['efficiency'].tolist(), members.objectives['sic'].tolist()))
+
+
+def dominates(point, other):
+    # The point (efficiency, SIC) dominates the other one, if it is not worse in any objective and better in at least
+    # one of them (higher efficiency, lower SIC):
+    return ((point[0] > other[0] and point[1] <= other[1])
+            or (point[0] >= other[0] and point[1] < other[1]))
+
+
+def fast_non_dominated_sort(points):
+
+    # Fast non-dominated sorting of NSGA-II: every member gets the number of members dominating it and the list of
+    # members dominated by it. The members which aren't dominated by anyone make the first front. Removing them
+    # decreases the counters of the members dominated by them and these which drop to 0 make the next front, etc.
+    # Returns the list of fronts (lists of indexes of members) and the rank (index of front) of every member.
+    dominated_by = [[] for x in range(len(points))]
+    domination_count = [0 for x in range(len(points))]
+    for i in range(len(points)):
+        for j in range(i + 1, len(points)):
+            if dominates(points[i], points[j]):
+                dominated_by[i].append(j)
+                domination_count[j] += 1
+            elif dominates(points[j], points[i]):
+                dominated_by[j].append(i)
+                domination_count[i] += 1
+
+    rank = [0 for x in range(len(points))]
+    fronts = [[i for i in range(len(points)) if domination_count[i] == 0]]
+    while len(fronts[-1]) > 0:
+        next_front = []
+        for i in fronts[-1]:
+            for j in dominated_by[i]:
+                domination_count[j] -= 1
+                if domination_count[j] == 0:
+                    rank[j] = len(fronts)
+                    next_front.append(j)
+        fronts.append(next_front)
+    # The last front is always empty:
+    fronts.pop()
+    return [fronts, rank]
+
+
+def crowding_distance(points, front_indexes):
+
+    # The crowding distance of a member is the sum (over both objectives) of the distances between its neighbours on
+    # the front, normalized with the range of objective on this front. The members at the ends of the front get the
+    # infinite distance, so they are always preferred and the extent of the front is kept.
+    distance = {i: 0 for i in front_indexes}
+    for objective in [0, 1]:
+        ordered = sorted(front_indexes, key=lambda i: points[i][objective])
+        distance[ordered[0]] = float('inf')
+        distance[ordered[-1]] = float('inf')
+        objective_range = points[ordered[-1]][objective] - points[ordered[0]][objective]
+        # The range is nan on the front of members which couldn't be solved (infinite objectives, see BatchEvaluator),
+        # their distances stay infinite at the ends and 0 between them:
+        if objective_range == 0 or np.isnan(objective_range):
+            continue
+        for k in range(1, len(ordered) - 1):
+            distance[ordered[k]] += (points[ordered[k + 1]][objective]
+                                     - points[ordered[k - 1]][objective]) / objective_range
+    return distance
+
+
+def rank_and_crowding(points):
+    # Rank and crowding distance of every member of the population (lists with the same order as points):
+    fronts, rank = fast_non_dominated_sort(points)
+    distance = [0 for x in range(len(points))]
+    for front_of_members in fronts:
+        for i, d in crowding_distance(points, front_of_members).items():
+            distance[i] = d
+    return [fronts, rank, distance]
+
+
+def tournament(rank, distance, number_of_winners, rng):
+
+    # Binary tournaments: of two randomly chosen members the one with lower rank wins, of two members on the same
+    # front - the one in less crowded region. All tournaments are drawn at once. Returns the indexes of winners.
+    rank = np.array(rank)
+    distance = np.array(distance)
+    i = rng.integers(0, len(rank), size=number_of_winners)
+    j = rng.integers(0, len(rank), size=number_of_winners)
+    first_wins = (rank[i] < rank[j]) | ((rank[i] == rank[j]) & (distance[i] >= distance[j]))
+    return np.where(first_wins, i, j)
+
+
+def select_survivors(members, population):
+
+    # Elitist (mu + lambda) survival of NSGA-II: the joined parents and children are divided into fronts, which are
+    # taken whole as long as they fit into the population. The last front which doesn't fit is truncated - the
+    # members with the highest crowding distance are kept. Returns the population of survivors.
+    points = objective_points(members)
+    fronts = fast_non_dominated_sort(points)[0]
+    survivors = []
+    for front_of_members in fronts:
+        if len(survivors) + len(front_of_members) <= population:
+            survivors.extend(front_of_members)
+        else:
+            distance = crowding_distance(points, front_of_members)
+            ordered = sorted(front_of_members, key=lambda i: distance[i], reverse=True)
+            survivors.extend(ordered[0:population - len(survivors)])
+        if len(survivors) == population:
+            break
+    return members.take(survivors)
+
+
+def ga_multi_obj_opt_nsga2(population, probability, generations, consolidation_ratio,
+
+                           q_cap,
+
+                           work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                           t_cond, overc_cond, t_evap, overh_evap,
+
+                           press_bef_turb, temp_bef_turb,
+
+                           pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
+
+                           amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+                           amb_p_cond_out,
+
+                           isent_eff_turb,
+                           isent_eff_pump, elec_eff_pump,
+                           isent_eff_comp,
+                           eff_turboeq,
+
+                           amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
+                           amb_t_evap_hot_side_in,
+                           amb_pr_evap_hot_side, fitness_cache=None, evaluator=None,
+                           pareto_archive=None, rng=None, results_store=None, checkpoint=None):
+
+    # This function realizes multi objective optimization according to NSGA-II with the same objectives as
+    # ga_multi_obj_opt_kungs_alg() - efficiency and SIC of HDRM. The parents are chosen by binary tournament from the
+    # whole population (ranked into fronts, with crowding distance inside of fronts), so not only the first front
+    # takes part in the reproduction. The children compete with their parents for the places in the next population,
+    # so the best members are never lost. The arguments and the returned results are the same as in
+    # ga_multi_obj_opt_kungs_alg(), so both functions can be given to test_ga_multi_obj().
+
+    list_of_members_matrices = []
+    list_of_pareto_members = []
+    current_total = []
+    convergence_results = []
+    gen_completed = 0
+    operation_time = 0
+    start_time = time.time()
+
+    # Adding all function variables to one matrix (32 arguments).
+    var = [q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
+           press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
+           pr_evap_hot_side, amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+           amb_p_cond_out, isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_turboeq,
+           amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
+           amb_pr_evap_hot_side]
+
+    if fitness_cache is None:
+        fitness_cache = FitnessCache(calculate_eff_evap_as_heat_source, var.__len__())
+    if evaluator is None:
+        evaluator = SerialEvaluator()
+    # Generator of random numbers for all random operations of the algorithm - rng can be a generator or a seed, runs
+    # with the same seed give the same results:
+    rng = make_rng(rng)
+
+    members = Population(var, population, ('efficiency', 'sic'), rng)
+    members.randomize()
+
+    # If the checkpoint has been saved by the previous (interrupted) run, the run is continued from the saved
+    # generation. The finished run returns its saved results:
+    first_generation = 0
+    state = None if checkpoint is None else checkpoint.load(fitness_cache, pareto_archive, results_store)
+    if state is not None:
+        if state['finished']:
+            return state['results']
+        first_generation = state['generation']
+        members = state['members']
+        list_of_members_matrices, list_of_pareto_members, current_total, convergence_results, gen_completed = \
+            state['variables']
+        start_time = time.time() - state['operation_time']
+
+    for x in range(first_generation, generations):
+        print("Generation " + str(x))
+
+        if x == 0:
+            new_members = members
+        else:
+            # 1. Making children - both parents are chosen by binary tournament, the genes are taken from one of them
+            # at random and then mutated with the given probability:
+            fronts, rank, distance = rank_and_crowding(objective_points(members))
+            parents1 = tournament(rank, distance, population, members.rng)
+            parents2 = tournament(rank, distance, population, members.rng)
+            new_members = members.crossover(parents1, parents2)
+            new_members.mutate(probability)
+
+        # 2. Evaluation of the new members (the parents have been evaluated in the previous generations):
+        new_members.set_objectives(fitness_cache.evaluate_members(new_members.list_of_genes(), evaluator))
+
+        fitness_cache.close_generation()
+
+        # 3. Survival of the best members of parents and children:
+        if x != 0:
+            members = select_survivors(members.concatenate(new_members), population)
+
+        # 4. Saving the population and its first front sorted by efficiency, the same as in Kung's method:
+        members.sort('efficiency', reverse=True)
+        members_matrix = members.members_matrix()
+        pareto_members_matrix = front(members_matrix)
+        if results_store is None:
+            list_of_members_matrices.append(members_matrix)
+            list_of_pareto_members.append(pareto_members_matrix)
+        current_convergence_result = check_convergence(current_total, pareto_members_matrix,
+                                                       min_consol_rat=consolidation_ratio)
+        current_total = current_convergence_result[0]
+        convergence_results.append([current_convergence_result[1], current_convergence_result[2],
+                                    current_convergence_result[3], current_convergence_result[4]])
+        gen_completed = x + 1
+        # The hypervolume of Pareto archive (if it's given) is saved with the data of convergence. The run is stopped,
+        # when the hypervolume stops improving:
+        if pareto_archive is not None:
+            pareto_archive.insert_members(pareto_members_matrix)
+            convergence_results[-1].append(pareto_archive.hypervolume)
+        if results_store is not None:
+            store_generation(results_store, x, members_matrix, pareto_members_matrix, convergence_results[-1])
+        if pareto_archive is not None and pareto_archive.close_generation():
+            print("The hypervolume of Pareto front has stopped improving.")
+            break
+        if current_convergence_result[5]:
+            print("The algorithm has converged.")
+            break
+
+        # Saving the state of the algorithm before the next generation:
+        if checkpoint is not None and checkpoint.is_due(x):
+            checkpoint.save({'finished': False, 'generation': x + 1, 'members': members,
+                             'variables': [list_of_members_matrices, list_of_pareto_members, current_total,
+                                           convergence_results, gen_completed],
+                             'operation_time': time.time() - start_time}, fitness_cache, pareto_archive, results_store)
+
+    if results_store is None:
+        list_of_members_matrices.append(current_total)
+    else:
+        results_store.append_members(gen_completed, 'total', current_total)
+    end_time = time.time()
+    operation_time = end_time - start_time
+
+    if fitness_cache.file_name != '':
+        fitness_cache.save()
+
+    results = [list_of_members_matrices, list_of_pareto_members, convergence_results,
+               gen_completed, operation_time, current_total]
+    if checkpoint is not None:
+        checkpoint.save_finished(results, fitness_cache, pareto_archive, results_store)
+    return results
 
 
 def check_convergence(old_total, new_pareto_set, min_consol_rat):
+
+    # Both old_total and new_pareto_set are lists of non-dominated members sorted by efficiency from the highest one,
+    # so the dominance of every member is checked by bisection. The returned current_total is sorted in the same way.
     old_dominated = []
     old_nondominated = []
     new_nondominated = []
     converged = False
     if len(old_total) == 0:
-        return [new_pareto_set, len(new_pareto_set), len(old_dominated), len(old_nondominated),
+        # A copy is returned, so adding parents to the Pareto set later doesn't change the list of non-dominated
+        # members:
+        return [new_pareto_set[:], len(new_pareto_set), len(old_dominated), len(old_nondominated),
                 len(new_nondominated), converged]
     else:
+        new_keys = efficiency_keys(new_pareto_set)
         for old_member in old_total:
-            if is_dominated_by_any(old_member, new_pareto_set):
+            if is_dominated_by_any(old_member, new_pareto_set, new_keys):
                 old_dominated.append(old_member)
             else:
                 old_nondominated.append(old_member)
+        old_keys = efficiency_keys(old_nondominated)
         for new_member in new_pareto_set:
-            if (not is_dominated_by_any(new_member, old_nondominated)
-                    and not is_equal_to_any(new_member, old_nondominated)):
+            if (not is_dominated_by_any(new_member, old_nondominated, old_keys)
+                    and not is_equal_to_any(new_member, old_nondominated, old_keys)):
                 new_nondominated.append(new_member)
-        current_total = old_nondominated + new_nondominated
+        # Both lists are sorted, so sorting of the joined lists only merges them:
+        current_total = sorted(old_nondominated + new_nondominated, key=lambda member: -member[32])
 
         # Using the "Consolidation-ratio" convergence metrics to check, if the algorithm is actually still
         # improving. The consolidation-ratio is the proportion of old solutions that have remained non-dominated
@@ -313,19 +579,8 @@ def test_ga_multi_obj(genetic_algorithm, name_of_file,
 
                       amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
                       amb_t_evap_hot_side_in,
-                      amb_pr_evap_hot_side
-                      ):
-
-    # Preparing an xlsx files to save calculation data:
-    workbook = xlsxwriter.Workbook(name_of_file + '.xlsx')
-    # workbook_mut_prob = xlsxwriter.Workbook(name_of_mut_file + '.xlsx')
-    # workbook_gen_numb = xlsxwriter.Workbook(name_of_gen_file + '.xlsx')
-    worksheet = workbook.add_worksheet('basic_data')
-    worksheet_pareto = workbook.add_worksheet('pareto')
-    worksheet_convergence = workbook.add_worksheet('convergence')
-
-    # worksheet_mut_prob = workbook_mut_prob.add_worksheet()
-    # worksheet_gen_numb = workbook_gen_numb.add_worksheet()
+                      amb_pr_evap_hot_side, pareto_archive=None, rng=None, results_store=None,
+                      checkpoint=None):
 
     # 1. Testing the influence of population number:
     results = []
@@ -351,14 +606,52 @@ def test_ga_multi_obj(genetic_algorithm, name_of_file,
 
                                      amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
                                      amb_t_evap_hot_side_in,
-                                     amb_pr_evap_hot_side)
+                                     amb_pr_evap_hot_side, pareto_archive=pareto_archive, rng=rng,
+                                     results_store=results_store, checkpoint=checkpoint)
     print("Case for population = " + str(population) + ", mutation_prob = " + str(mutation_prob) + ", generations = "
           + str(generations) + " has been calculated.")
 
+    # The results saved in the ResultsStore during the run are read from it one generation after another:
+    if results_store is None:
+        save_results_to_xlsx(name_of_file, population, mutation_prob, results[0], results[1], results[2])
+    else:
+        save_results_to_xlsx(name_of_file, population, mutation_prob, stored_members_matrices(results_store),
+                             results_store.members_matrices('pareto'), stored_convergence_results(results_store))
+
+
+def stored_members_matrices(results_store):
+    # Members of all generations followed by the non-dominated members of the whole run, like in the list of members
+    # matrices returned by the algorithm:
+    for members_matrix in results_store.members_matrices('population'):
+        yield members_matrix
+    for members_matrix in results_store.members_matrices('total'):
+        yield members_matrix
+
+
+def stored_convergence_results(results_store):
+    # The data of convergence without the number of generation, like in the list returned by the algorithm:
+    return [row[1:] for row in results_store.rows('convergence')]
+
+
+def save_results_to_xlsx(name_of_file, population, mutation_prob, members_matrices, pareto_members,
+                         convergence_results):
+
+    # The results can be given as lists returned by the algorithm or read from the ResultsStore (e.g. after the run
+    # has been interrupted). Preparing an xlsx files to save calculation data:
+    workbook = xlsxwriter.Workbook(name_of_file + '.xlsx')
+    # workbook_mut_prob = xlsxwriter.Workbook(name_of_mut_file + '.xlsx')
+    # workbook_gen_numb = xlsxwriter.Workbook(name_of_gen_file + '.xlsx')
+    worksheet = workbook.add_worksheet('basic_data')
+    worksheet_pareto = workbook.add_worksheet('pareto')
+    worksheet_convergence = workbook.add_worksheet('convergence')
+
+    # worksheet_mut_prob = workbook_mut_prob.add_worksheet()
+    # worksheet_gen_numb = workbook_gen_numb.add_worksheet()
+
     # Saving data of all members of each generation:
     results_count = 0
     start_row = 0
-    for members_matrix in results[0]:
+    for members_matrix in members_matrices:
         worksheet.write(start_row, 0, "Generation " + str(results_count) + ", population: "
                         + str(population) + ", mutation probability: "
                         + str(mutation_prob))
@@ -381,7 +674,7 @@ def test_ga_multi_obj(genetic_algorithm, name_of_file,
     # Saving data of pareto members for each generation:
     results_count = 0
     start_row = 0
-    for members_matrix in results[1]:
+    for members_matrix in pareto_members:
         worksheet_pareto.write(start_row, 0, "Generation " + str(results_count) + ", Pareto line")
         worksheet_pareto.write(start_row + 1, 0, "efficiency")
         worksheet_pareto.write(start_row + 2, 0, "SIC")
@@ -395,19 +688,23 @@ def test_ga_multi_obj(genetic_algorithm, name_of_file,
 
     # Saving data of convergence:
     results_count = 0
-    for convergence_data_for_certain_generation in results[2]:
+    for convergence_data_for_certain_generation in convergence_results:
         if results_count == 0:
             worksheet_convergence.write(0, results_count, "Generation")
             worksheet_convergence.write(1, results_count, "Current total")
             worksheet_convergence.write(2, results_count, "Old-dominated")
             worksheet_convergence.write(3, results_count, "Old-nondominated")
             worksheet_convergence.write(4, results_count, "New-nondominated")
+            worksheet_convergence.write(5, results_count, "Hypervolume")
         else:
             worksheet_convergence.write(0, results_count, results_count - 1)
             worksheet_convergence.write(1, results_count, convergence_data_for_certain_generation[0])
             worksheet_convergence.write(2, results_count, convergence_data_for_certain_generation[1])
             worksheet_convergence.write(3, results_count, convergence_data_for_certain_generation[2])
             worksheet_convergence.write(4, results_count, convergence_data_for_certain_generation[3])
+            # The hypervolume is calculated only with the Pareto archive:
+            if len(convergence_data_for_certain_generation) > 4:
+                worksheet_convergence.write(5, results_count, convergence_data_for_certain_generation[4])
         results_count += 1
 
     # Close all worksheets
@@ -437,8 +734,31 @@ def investigation_of_pop_mut_conv(genetic_algorithm, name_of_file,
 
                       amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
                       amb_t_evap_hot_side_in,
-                      amb_pr_evap_hot_side
+                      amb_pr_evap_hot_side, seed=None, max_workers=None
                       ):
+
+    # All runs (run_times runs of every combination of population and mutation probability) are independent jobs,
+    # which are executed in parallel by max_workers processes (see run_study()). Every combination gets its own seed
+    # made from the given one, and every run of this combination its own child of this seed, so the whole
+    # investigation can be repeated with the same seed.
+    cases = expand_grid({'population': population_test, 'probability': mutation_prob_test})
+    arguments = dict(generations=generations, consolidation_ratio=consolidation_ratio, q_cap=q_cap,
+                     work_fl=work_fl, amb_work_fl_cond=amb_work_fl_cond, amb_work_fl_evap=amb_work_fl_evap,
+                     t_cond=t_cond, overc_cond=overc_cond, t_evap=t_evap, overh_evap=overh_evap,
+                     press_bef_turb=press_bef_turb, temp_bef_turb=temp_bef_turb,
+                     pr_evap=pr_evap, amb_pr_evap=amb_pr_evap, pr_cond=pr_cond, amb_pr_cond=amb_pr_cond,
+                     pr_boil=pr_boil, pr_evap_hot_side=pr_evap_hot_side,
+                     amb_t_evap_in=amb_t_evap_in, amb_t_evap_out=amb_t_evap_out, amb_t_cond_in=amb_t_cond_in,
+                     amb_t_cond_out=amb_t_cond_out, amb_p_evap_out=amb_p_evap_out, amb_p_cond_out=amb_p_cond_out,
+                     isent_eff_turb=isent_eff_turb, isent_eff_pump=isent_eff_pump, elec_eff_pump=elec_eff_pump,
+                     isent_eff_comp=isent_eff_comp, eff_turboeq=eff_turboeq,
+                     amb_work_fl_evap_hot_side=amb_work_fl_evap_hot_side,
+                     amb_p_evap_hot_side_out=amb_p_evap_hot_side_out,
+                     evap_hot_side_pinch_point=evap_hot_side_pinch_point,
+                     amb_t_evap_hot_side_in=amb_t_evap_hot_side_in, amb_pr_evap_hot_side=amb_pr_evap_hot_side)
+    rows = run_study(genetic_algorithm, cases, arguments, run_times, convergence_metrics, seed, max_workers,
+                     warm_up_fluids=[work_fl, amb_work_fl_cond, amb_work_fl_evap, amb_work_fl_evap_hot_side])[0]
+
     workbook = xlsxwriter.Workbook("MOOGA_pop_mut_investig.xlsx")
     worksheet = workbook.add_worksheet("sheet")
     pop_count = 0
@@ -450,148 +770,156 @@ def investigation_of_pop_mut_conv(genetic_algorithm, name_of_file,
             worksheet.write(0, mut_count*2 + 1, mutation_prob)
             worksheet.write(0, mut_count*2 + 2, mutation_prob)
 
-            sum_gen_completed = 0
-            sum_operation_time = 0
-            aver_gen_completed = 0
-            aver_operation_time = 0
-
-            # Running the algorithm for certain number of times in order to get a proper average probe:
-            for run_number in range(run_times):
-
-                results = genetic_algorithm(population, mutation_prob, generations, consolidation_ratio,
-
-                                            q_cap,
-
-                                            work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                                            t_cond, overc_cond, t_evap, overh_evap,
-
-                                            press_bef_turb, temp_bef_turb,
-
-                                            pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
-
-                                            amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
-                                            amb_p_evap_out,
-                                            amb_p_cond_out,
-
-                                            isent_eff_turb,
-                                            isent_eff_pump, elec_eff_pump,
-                                            isent_eff_comp,
-                                            eff_turboeq,
-
-                                            amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out,
-                                            evap_hot_side_pinch_point,
-                                            amb_t_evap_hot_side_in,
-                                            amb_pr_evap_hot_side)
-                sum_gen_completed += results[3]
-                sum_operation_time += results[4]
-
-            aver_gen_completed = sum_gen_completed / run_times
-            aver_operation_time = sum_operation_time / run_times
-            worksheet.write(pop_count + 1, mut_count*2 + 1, aver_gen_completed)
-            worksheet.write(pop_count + 1, mut_count*2 + 2, aver_operation_time)
+            # Average of the runs of this combination, in order to get a proper average probe:
+            row = rows[pop_count * len(mutation_prob_test) + mut_count]
+            worksheet.write(pop_count + 1, mut_count*2 + 1, row['gen_completed_mean'])
+            worksheet.write(pop_count + 1, mut_count*2 + 2, row['operation_time_mean'])
             mut_count += 1
         pop_count += 1
 
+    # All cases with the standard deviations in one table:
+    write_study_table(workbook.add_worksheet("study"), rows)
     workbook.close()
 
 
-# Input data:
-q_cap = 1e5
-work_fl = 'ammonia'
-amb_work_fl_cond = 'air'
-amb_work_fl_evap = 'air'
-amb_work_fl_evap_hot_side = 'air'
-t_cond = 35 + 273.15            # K
-overc_cond = 2                  # K
-t_evap = -12 + 273.15           # K
-overh_evap = 2                  # K
-# press_bef_turb = [40e5, 50e5, 60e5, 70e5, 80e5, 90e5]           # Pa
-# temp_bef_turb = [393, 413, 433, 453, 483, 523]    # K
-press_bef_turb = 60e5           # Pa
-temp_bef_turb = 200 + 273.15    # K
-pr_evap = 0.99
-amb_pr_evap = 0.99
-pr_cond = 0.99
-amb_pr_cond = 0.99
-pr_boil = 0.99
-pr_evap_hot_side = 0.99
-amb_pr_evap_hot_side = 0.99
-
-amb_t_evap_in = -4 + 273.15     # K
-amb_t_evap_out = -8 + 273.15    # K
-amb_t_cond_in = 20 + 273.15     # K
-amb_t_cond_out = 30 + 273.15    # K
-evap_hot_side_pinch_point = 5  # K
-amb_t_evap_hot_side_in = 300 + 273.15     # K
-amb_p_evap_out = 1e5            # Pa
-amb_p_cond_out = 1e5            # Pa
-amb_p_evap_hot_side_out = 1e5   # Pa
-
-isent_eff_turb = 0.7
-isent_eff_pump = 0.9
-elec_eff_pump = 0.9
-isent_eff_comp = 0.7
-eff_boil = 0.9
-fuel_heat_val = 26e6            # J/kg
-eff_turboeq = 0.99
-
-pres = 56e5
-press_bef_turb = []
-while pres < 72e5:
-    press_bef_turb.append(pres)
-    pres += 0.001e5
-temp = 30 + 273.15
-t_cond = []
-while temp <= 35 + 273.15:
-    t_cond.append(temp)
-    temp += 0.001
-temp = 200 + 273.15
-temp_bef_turb = []
-while temp <= 295 + 273.15:
-    temp_bef_turb.append(temp)
-    temp += 0.01
-
-population = 40
-mutation_prob = 0.2
-generations = 30
-consolidation_ratio = 0.99
-
-for i in range(3):
-    name_of_file = "investigation_test_" + str(i) + "_pn_" + str(population) + "Pmut" + str(mutation_prob) + "no_conv"
-    test_ga_multi_obj(ga_multi_obj_opt_kungs_alg, name_of_file,
-                      population, mutation_prob, generations, consolidation_ratio,
-
-                      q_cap,
-
-                      work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                      t_cond, overc_cond, t_evap, overh_evap,
-
-                      press_bef_turb, temp_bef_turb,
-
-                      pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
-
-                      amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-                      amb_p_cond_out,
-
-                      isent_eff_turb,
-                      isent_eff_pump, elec_eff_pump,
-                      isent_eff_comp,
-                      eff_turboeq,
-
-                      amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
-                      amb_t_evap_hot_side_in,
-                      amb_pr_evap_hot_side
-                      )
-population = 40
-mutation_prob = 0.8
-generations = 30
-consolidation_ratio = 0.99
-
-for i in range(3):
-    name_of_file = "investigation_test_" + str(i) + "_pn_" + str(population) + "Pmut" + str(mutation_prob) + "no_conv"
-    test_ga_multi_obj(ga_multi_obj_opt_kungs_alg, name_of_file,
+def convergence_metrics(results):
+    # Values of one run of the algorithm averaged by investigation_of_pop_mut_conv():
+    return {'gen_completed': results[3], 'operation_time': results[4]}
+
+
+# The runs of the algorithm below are executed only when this file is run directly, so the functions can be
+# imported without starting the optimization.
+if __name__ == "__main__":
+    # Input data:
+    q_cap = 1e5
+    work_fl = 'ammonia'
+    amb_work_fl_cond = 'air'
+    amb_work_fl_evap = 'air'
+    amb_work_fl_evap_hot_side = 'air'
+    t_cond = 35 + 273.15            # K
+    overc_cond = 2                  # K
+    t_evap = -12 + 273.15           # K
+    overh_evap = 2                  # K
+    # press_bef_turb = [40e5, 50e5, 60e5, 70e5, 80e5, 90e5]           # Pa
+    # temp_bef_turb = [393, 413, 433, 453, 483, 523]    # K
+    press_bef_turb = 60e5           # Pa
+    temp_bef_turb = 200 + 273.15    # K
+    pr_evap = 0.99
+    amb_pr_evap = 0.99
+    pr_cond = 0.99
+    amb_pr_cond = 0.99
+    pr_boil = 0.99
+    pr_evap_hot_side = 0.99
+    amb_pr_evap_hot_side = 0.99
+
+    amb_t_evap_in = -4 + 273.15     # K
+    amb_t_evap_out = -8 + 273.15    # K
+    amb_t_cond_in = 20 + 273.15     # K
+    amb_t_cond_out = 30 + 273.15    # K
+    evap_hot_side_pinch_point = 5  # K
+    amb_t_evap_hot_side_in = 300 + 273.15     # K
+    amb_p_evap_out = 1e5            # Pa
+    amb_p_cond_out = 1e5            # Pa
+    amb_p_evap_hot_side_out = 1e5   # Pa
+
+    isent_eff_turb = 0.7
+    isent_eff_pump = 0.9
+    elec_eff_pump = 0.9
+    isent_eff_comp = 0.7
+    eff_boil = 0.9
+    fuel_heat_val = 26e6            # J/kg
+    eff_turboeq = 0.99
+
+    # The optimized genes - the candidate values are calculated from their indexes, not stored in lists:
+    press_bef_turb = ContinuousDomain(56e5, 72e5, 0.001e5)                  # Pa
+    t_cond = ContinuousDomain(30 + 273.15, 35 + 273.15, 0.001)              # K
+    temp_bef_turb = ContinuousDomain(200 + 273.15, 295 + 273.15, 0.01)      # K
+
+    # Seed of all runs below - every run gets its own child of it. With None the runs are different every time, with
+    # an integer they can be repeated. Every run saves its state after every generation to the file
+    # name_of_file + '.checkpoint', so running the interrupted script again continues the unfinished run and skips
+    # the finished ones:
+    seed = None
+    run_seeds = child_seeds(seed, 7)
+
+    population = 40
+    mutation_prob = 0.2
+    generations = 30
+    consolidation_ratio = 0.99
+
+    for i in range(3):
+        name_of_file = "investigation_test_" + str(i) + "_pn_" + str(population) + "Pmut" + str(mutation_prob) \
+                       + "no_conv"
+        test_ga_multi_obj(ga_multi_obj_opt_kungs_alg, name_of_file,
+                          population, mutation_prob, generations, consolidation_ratio,
+
+                          q_cap,
+
+                          work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                          t_cond, overc_cond, t_evap, overh_evap,
+
+                          press_bef_turb, temp_bef_turb,
+
+                          pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
+
+                          amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+                          amb_p_cond_out,
+
+                          isent_eff_turb,
+                          isent_eff_pump, elec_eff_pump,
+                          isent_eff_comp,
+                          eff_turboeq,
+
+                          amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
+                          amb_t_evap_hot_side_in,
+                          amb_pr_evap_hot_side, rng=run_seeds[i],
+                          checkpoint=Checkpoint(name_of_file + '.checkpoint')
+                          )
+    population = 40
+    mutation_prob = 0.8
+    generations = 30
+    consolidation_ratio = 0.99
+
+    for i in range(3):
+        name_of_file = "investigation_test_" + str(i) + "_pn_" + str(population) + "Pmut" + str(mutation_prob) \
+                       + "no_conv"
+        test_ga_multi_obj(ga_multi_obj_opt_kungs_alg, name_of_file,
+                          population, mutation_prob, generations, consolidation_ratio,
+
+                          q_cap,
+
+                          work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                          t_cond, overc_cond, t_evap, overh_evap,
+
+                          press_bef_turb, temp_bef_turb,
+
+                          pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
+
+                          amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+                          amb_p_cond_out,
+
+                          isent_eff_turb,
+                          isent_eff_pump, elec_eff_pump,
+                          isent_eff_comp,
+                          eff_turboeq,
+
+                          amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
+                          amb_t_evap_hot_side_in,
+                          amb_pr_evap_hot_side, rng=run_seeds[3 + i],
+                          checkpoint=Checkpoint(name_of_file + '.checkpoint')
+                          )
+
+    # The same case optimized with NSGA-II. The run is stopped, when the hypervolume of Pareto archive doesn't grow
+    # during 5 generations:
+    population = 40
+    mutation_prob = 0.2
+    generations = 30
+    consolidation_ratio = 0.99
+
+    name_of_file = "investigation_test_nsga2_pn_" + str(population) + "Pmut" + str(mutation_prob) + "no_conv"
+    test_ga_multi_obj(ga_multi_obj_opt_nsga2, name_of_file,
                       population, mutation_prob, generations, consolidation_ratio,
 
                       q_cap,
@@ -614,7 +942,6 @@ for i in range(3):
 
                       amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
                       amb_t_evap_hot_side_in,
-                      amb_pr_evap_hot_side
+                      amb_pr_evap_hot_side, pareto_archive=ParetoArchive(stagnation_generations=5),
+                      rng=run_seeds[6]
                       )
-
-
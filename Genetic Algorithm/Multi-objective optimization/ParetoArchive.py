@@ -0,0 +1,104 @@
+import math
+from bisect import bisect_left, bisect_right
+
+
+class ParetoArchive:
+
+    """
+    Stores all non-dominated members found during the run of multi-objective genetic algorithm (efficiency at index
+    32 is maximized, SIC at index 33 is minimized). The members are kept sorted by efficiency from the highest one, so
+    SIC decreases along the list as well and a new member is checked and inserted with bisection.
+
+    The hypervolume is the area dominated by the archive and bounded by the reference point (efficiency, SIC). It's
+    updated incrementally with every insertion. If the reference point isn't given, the worst efficiency and the worst
+    SIC of the first inserted members are used.
+
+    Function close_generation() should be called at the end of every generation - it saves the hypervolume of this
+    generation to the list hypervolumes and returns True, when the hypervolume hasn't grown relatively by more than
+    min_improvement during the last stagnation_generations generations. The criterion is switched off, when
+    stagnation_generations is None.
+    """
+
+    def __init__(self, reference_point=None, stagnation_generations=None, min_improvement=1e-4):
+        self.reference_point = reference_point
+        self.stagnation_generations = stagnation_generations
+        self.min_improvement = min_improvement
+        self.members = []
+        # Negative efficiencies of the members, ascending - the keys of bisection:
+        self.keys = []
+        self.hypervolume = 0
+        # The first element describes the content of the list, the same as in lists of the best members:
+        self.hypervolumes = ['hypervolume']
+
+    def contribution(self, index):
+        # The archive dominates the rectangle between the member, the reference point and the SIC of previous member.
+        # Members which are worse than the reference point contribute nothing.
+        if index >= len(self.members):
+            return 0
+        ref_eff, ref_sic = self.reference_point
+        previous_sic = ref_sic if index == 0 else min(self.members[index - 1][33], ref_sic)
+        return max(self.members[index][32] - ref_eff, 0) * max(previous_sic - min(self.members[index][33], ref_sic), 0)
+
+    def is_dominated(self, member):
+        # The last member with efficiency not lower than the one of checked member has the lowest SIC of them:
+        index = bisect_right(self.keys, -member[32])
+        if index == 0:
+            return False
+        dominant = self.members[index - 1]
+        return dominant[33] < member[33] or (dominant[33] == member[33] and dominant[32] > member[32])
+
+    def contains(self, member):
+        return member in self.members[bisect_left(self.keys, -member[32]):bisect_right(self.keys, -member[32])]
+
+    def insert(self, member):
+        # Returns True, if the member has been added to the archive. Members which couldn't be solved by the model
+        # (infinite efficiency and SIC, see BatchEvaluator) are never added:
+        if not (math.isfinite(member[32]) and math.isfinite(member[33])):
+            return False
+        if self.reference_point is None:
+            self.reference_point = (member[32], member[33])
+        if self.is_dominated(member) or self.contains(member):
+            return False
+
+        # The members dominated by the new one have efficiency not higher and SIC not lower than it - they follow
+        # one after another from the place of insertion:
+        index = bisect_left(self.keys, -member[32])
+        end = index
+        while end < len(self.members) and self.members[end][33] >= member[33]:
+            end += 1
+
+        # Only the contributions of the removed members, the new member and the next member change:
+        for i in range(index, end + 1):
+            self.hypervolume -= self.contribution(i)
+        self.members[index:end] = [member]
+        self.keys[index:end] = [-member[32]]
+        self.hypervolume += self.contribution(index) + self.contribution(index + 1)
+        return True
+
+    def insert_members(self, members_matrix):
+        # Returns the number of members added to the archive:
+        solved = [m for m in members_matrix if math.isfinite(m[32]) and math.isfinite(m[33])]
+        if self.reference_point is None and len(solved) > 0:
+            self.reference_point = (min(m[32] for m in solved), max(m[33] for m in solved))
+        return sum(1 for m in solved if self.insert(m))
+
+    def close_generation(self):
+        self.hypervolumes.append(self.hypervolume)
+        print("Hypervolume of Pareto archive: " + str(self.hypervolume) + " (" + str(len(self.members))
+              + " members)")
+        if self.stagnation_generations is None or len(self.hypervolumes) - 1 <= self.stagnation_generations:
+            return False
+        old_hypervolume = self.hypervolumes[-1 - self.stagnation_generations]
+        return self.hypervolume - old_hypervolume <= self.min_improvement * abs(old_hypervolume)
+
+    def get_state(self):
+        # State saved in the checkpoint of the algorithm (see Checkpoint):
+        return {'reference_point': self.reference_point, 'members': self.members, 'keys': self.keys,
+                'hypervolume': self.hypervolume, 'hypervolumes': self.hypervolumes}
+
+    def set_state(self, state):
+        self.reference_point = state['reference_point']
+        self.members = state['members']
+        self.keys = state['keys']
+        self.hypervolume = state['hypervolume']
+        self.hypervolumes = state['hypervolumes']
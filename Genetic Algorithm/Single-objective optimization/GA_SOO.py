@@ -1,383 +1,90 @@
-import random
 import time
+from functools import partial
 
+import numpy as np
 import xlsxwriter
-from numpy.random import randint
-from numpy.random import seed
 
 from HDRM_SOO_calc_model import calculate_eff
+from ContinuousDomain import ContinuousDomain
+from FitnessCache import FitnessCache
+from Population import Population, permutation_pairs
+from ParameterStudy import run_study, write_study_table
+from RandomStreams import make_rng
+from SerialEvaluator import SerialEvaluator
 
 
-# This version of genetic algorithm function favors the best members in case of reproduction - two the best members
-# of population always reproduce with each other. For the rest of members the match is random.
-def genetic_algorithm_basic_all_mutating(population, probability, generations,
+def alpha_favor_pairs(number_of_parents, number_of_children, rng):
 
-                                         q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap,
+    # Pairing of parents sorted from the best one: in every round of pairing the two best parents make the first child
+    # together, the rest of parents are paired at random (every one once per round, like in permutation_pairs()). If
+    # the number of the rest of parents is odd, the last one of the round gets a random partner from all other parents,
+    # so the parents of a child are always different.
+    if number_of_parents <= 2:
+        return [np.zeros(number_of_children, dtype=np.int64), np.full(number_of_children, number_of_parents - 1)]
+    pairs_per_round = 1 + (number_of_parents - 1) // 2
+    rounds = -(-number_of_children // pairs_per_round)
+    shuffled = rng.permuted(np.tile(np.arange(2, number_of_parents), (rounds, 1)), axis=1)
+    if number_of_parents % 2 == 1:
+        partners = (shuffled[:, -1] + rng.integers(1, number_of_parents, size=rounds)) % number_of_parents
+        shuffled = np.column_stack([shuffled, partners])
+    parents1 = np.column_stack([np.zeros(rounds, dtype=np.int64), shuffled[:, 0::2]])
+    parents2 = np.column_stack([np.ones(rounds, dtype=np.int64), shuffled[:, 1::2]])
+    return [parents1.ravel()[0:number_of_children], parents2.ravel()[0:number_of_children]]
 
-                                         t_cond, overc_cond, t_evap, overh_evap,
 
-                                         press_bef_turb, temp_bef_turb,
+def alpha_with_each_pairs(number_of_parents, number_of_children, rng):
 
-                                         pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
+    # Pairing of parents sorted from the best one: the best parent is firstly paired with every other parent, then the
+    # parents are paired at random (every one once per round, see permutation_pairs()).
+    rest1, rest2 = permutation_pairs(number_of_parents, max(number_of_children - (number_of_parents - 1), 0), rng)
+    parents1 = np.concatenate([np.zeros(number_of_parents - 1, dtype=np.int64), rest1])
+    parents2 = np.concatenate([np.arange(1, number_of_parents), rest2])
+    return [parents1[0:number_of_children], parents2[0:number_of_children]]
 
-                                         amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-                                         amb_p_cond_out,
 
-                                         isent_eff_turb,
-                                         isent_eff_pump, elec_eff_pump,
-                                         isent_eff_comp,
-                                         eff_boil, fuel_heat_val,
-                                         eff_turboeq):
+def better_half(members):
+    # Selection of parents: members sorted by efficiency from the worst one, the better half of them (with the median
+    # member, if the number of members is odd) becomes parents of the next generation. The best parent is the first one.
+    return members.take(np.arange(len(members) // 2, len(members))[::-1])
 
-    # Adding all function variables to one matrix.
-    var = [q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
-           press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond,
-           pr_boil, amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-           amb_p_cond_out, isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil,
-           fuel_heat_val, eff_turboeq]
 
-    # Size of this matrix must take into consideration the efficiency which will be stored on the last index in every
-    # member.
-    members_matrix = [[0 for x in range(var.__len__() + 1)] for y in range(population)]
+def mutate_members(members, probability, first_member):
+    # Mutation of the members from first_member on - see Population.mutate():
+    members.mutate(probability, first_member)
 
-    # There's a need of a list containing the best members of particular generations. This is only for the purpose
-    # of evaluation of the algorithm:
-    best_members = ['efficiency']
-    best_members_turb_eff = ['turb_eff']
-    best_members_temp_cond = ['temp_cond']
-    best_members_comp_eff = ['comp_eff']
-    best_members_pump_eff = ['pump_eff']
-    best_members_boil_eff = ['boil_eff']
-
-    # Number of members of population is set by the client. Values are being ascribed to members:
-    for m in members_matrix:
-        var_count = 0
-        for v in var:
-            if type(v) is list:
-                # Random choice of the value
-                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-            else:
-                # Choosing the fixed value
-                m[var_count] = v
-            var_count += 1
-
-    for x in range(generations):
-        print("Generation " + str(x))
 
-        # 1. Mutation:
-        # No mutation for the 0 generation.
-        if x != 0:
-            for m in members_matrix:
-                var_count = 0
-                for v in var:
-                    if type(v) is list:
-                        # With a fixed probability this condition will be entered:
-                        if random.randint(1, 100) <= probability * 100:
-                            # This is necessary to avoid mutating into the same value:
-                            mutated = m[var_count]
-                            while mutated is m[var_count]:
-                                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-                            # After the while loop the mutated value is for sure different from the previous one
-                    var_count += 1
+def genetic_algorithm_soo(population, probability, generations,
 
-        # 2. Evaluation - calculating efficiencies of members, according to which the members are going to be compared:
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-
-        # 3. Sorting members and saving the better half of them regarding the efficiency:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-
-        # Saving some values for analysis:
-        best_members.append(members_matrix[members_matrix.__len__()-1][28])
-        best_members_temp_cond.append(members_matrix[members_matrix.__len__()-1][4])
-        best_members_turb_eff.append(members_matrix[members_matrix.__len__() - 1][21])
-        best_members_comp_eff.append(members_matrix[members_matrix.__len__() - 1][24])
-        best_members_pump_eff.append(members_matrix[members_matrix.__len__() - 1][22])
-        best_members_boil_eff.append(members_matrix[members_matrix.__len__() - 1][25])
+                          q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap,
 
-        # In the last loop round it is unnecessary to proceed the instruction below:
-        if x == generations - 1:
-            break
+                          t_cond, overc_cond, t_evap, overh_evap,
 
-        # Having members sorted, the better half of them is going to be saved to become parents of next generation:
-        if members_matrix.__len__() % 2 == 0:
-            members_matrix = members_matrix[int(members_matrix.__len__() / 2)::]
-        else:
-            members_matrix = members_matrix[int((members_matrix.__len__() - 1) / 2)::]
-
-        # 4. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. Firstly
-        # two randomly chosen parents are removed from the list of members. From their gens the child is going to be
-        # created. This procedure is repeated until there's no parent left, or there's one last parent left without
-        # pair. In this case for this exact parent, some random parent is going to be chosen from the initiatory
-        # collection of parents.
-        children_matrix = [[0 for i in range(var.__len__() + 1)] for j in range(population)]
-        child_count = 0
-        # This loop is going to be repeated until the number of required members of new population is reached.
-        # First while loop:
-        while child_count + 1 <= population:
-
-            # initiatory_members_matrix is created for the purpose of making children. It's made every time when there's
-            # no parents left to make children. It's necessary, because every time the child is made, both of his
-            # parents are removed from the initiatory_members_matrix. This ensures a proper variety of pairs of parents
-            # mixing each other's gens in order to make children. With such an approach the diversity of gens among next
-            # generation will be possibly increased, which makes the genetic algorithm more efficient.
-            initiatory_members_matrix = members_matrix[:]
-
-            # Second while loop:
-            while initiatory_members_matrix.__len__() > 0 and child_count + 1 <= population:
-
-                # Random chose of the first parent:
-                parent1 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-
-                # It can happen that there's only one parent left (if there's no parents left the "while" loop will be
-                # ended anyway). This case must be managed:
-                if initiatory_members_matrix.__len__() == 1:
-                    initiatory_members_matrix.remove(parent1)
-                    parent2 = parent1
-                    # This is necessary to avoid choosing the same parent:
-                    while_count = 0
-                    while parent1 == parent2:
-                        parent2 = members_matrix[random.randint(0, members_matrix.__len__() - 1)]
-                        while_count += 1
-                        # In case all members of population are the same, or at least, there's a suspicion of it, it'd
-                        # be good to make sure the loop is not going to run forever:
-                        are_all_equal = True
-                        if while_count > population:
-                            for m in members_matrix:
-                                if parent1 != m:
-                                    are_all_equal = False
-                        if are_all_equal:
-                            break
-
-                    # Now it's ensured parents are different, except from the case in which all members of
-                    # population are the same.
-
-                # For the case, in which there're at least two parents in the initiatory_members_matrix:
-                else:
-                    initiatory_members_matrix.remove(parent1)
-                    parent2 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-                    initiatory_members_matrix.remove(parent2)
-
-                # In this moment there're 2 parents chosen, so it's possible to make a child:
-                var_count = 0
-                for v in parent1:
-                    # Random choice of the chromosomes for child:
-                    if random.randint(1, 2) == 1:
-                        children_matrix[child_count][var_count] = v
-                    else:
-                        children_matrix[child_count][var_count] = parent2[var_count]
-                    var_count += 1
-
-                # Because the child has been made:
-                child_count += 1
-
-        # 5. Children become now members of the new generation.
-        members_matrix = children_matrix
-
-    return [best_members_temp_cond, best_members_turb_eff, best_members_comp_eff, best_members_pump_eff,
-            best_members_boil_eff, best_members]
-
-
-def genetic_algorithm_basic_alpha_not_mutating(population, probability, generations,
-
-                                               q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                                               t_cond, overc_cond, t_evap, overh_evap,
-
-                                               press_bef_turb, temp_bef_turb,
-
-                                               pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-
-                                               amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-                                               amb_p_cond_out,
-
-                                               isent_eff_turb,
-                                               isent_eff_pump, elec_eff_pump,
-                                               isent_eff_comp,
-                                               eff_boil, fuel_heat_val,
-                                               eff_turboeq):
-
-    # Adding all function variables to one list.
-    var = [q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
-           press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond,
-           pr_boil, amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-           amb_p_cond_out, isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil,
-           fuel_heat_val, eff_turboeq]
-
-    # Size of matrix with members must take into consideration the efficiency which will be stored on the last index
-    # in every member.
-    members_matrix = [[0 for x in range(var.__len__() + 1)] for y in range(population)]
+                          press_bef_turb, temp_bef_turb,
 
-    # There's a need of a list containing the best members of particular generations:
-    best_members = ['efficiency']
-    best_members_turb_eff = ['turb_eff']
-    best_members_temp_cond = ['temp_cond']
-
-    # Number of members of population is set by the client. Values are being ascribed to members:
-    for m in members_matrix:
-        var_count = 0
-        for v in var:
-            if type(v) is list:
-                # Random chose of the value
-                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-            else:
-                # Choosing the precise value
-                m[var_count] = v
-            var_count += 1
-
-    for x in range(generations):
-        print("Generation " + str(x))
+                          pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
 
-        # In this function the mutation of the best member of the population is avoided, therefore evaluation is
-        # necessary to be done before mutation to find the two alpha members, which are going to reproduce with
-        # each other.
+                          amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
+                          amb_p_evap_out, amb_p_cond_out,
 
-        # 0. Calculating efficiencies of members (evaluation):
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-        # Sorting members:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-        members_matrix.reverse()
+                          isent_eff_turb,
+                          isent_eff_pump, elec_eff_pump,
+                          isent_eff_comp,
+                          eff_boil, fuel_heat_val,
+                          eff_turboeq, fitness_cache=None, evaluator=None, rng=None,
+                          selection=better_half, pairing=permutation_pairs, elitism=0, mutation=mutate_members,
+                          recorded_genes=((4, 'temp_cond'), (21, 'turb_eff')), checkpoint=None):
 
-        # 1. Mutation:
-        # No mutation for the 0 generation.
-        if x != 0:
-            member_counter = 0
-            for m in members_matrix:
-
-                # Avoiding mutation of the alpha member:
-                if member_counter == 0:
-                    member_counter += 1
-                    continue
-
-                var_count = 0
-                for v in var:
-                    if type(v) is list:
-                        # With a fixed probability this condition will be entered:
-                        if random.randint(1, 100) <= probability * 100:
-                            # This is necessary to avoid mutating into the same value:
-                            mutated = m[var_count]
-                            while mutated is m[var_count]:
-                                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-                            # After the while loop the mutated value is for sure different from the previous one
-                    var_count += 1
-
-        # 2. Calculating efficiencies of members, in terms of which the members are going to be compared:
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-
-        # 3. Sorting members and saving the better half of them regarding the efficiency:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-
-        # Saving some values for analysis:
-        best_members.append(members_matrix[members_matrix.__len__()-1][28])
-        best_members_temp_cond.append(members_matrix[members_matrix.__len__()-1][4])
-        best_members_turb_eff.append(members_matrix[members_matrix.__len__() - 1][21])
-
-        # In the last loop round it is unnecessary to proceed the instruction below:
-        if x == generations - 1:
-            break
-
-        # Having members sorted, the better half of them is going to be saved to become parents of next generation:
-        if members_matrix.__len__() % 2 == 0:
-            members_matrix = members_matrix[int(members_matrix.__len__() / 2)::]
-        else:
-            members_matrix = members_matrix[int((members_matrix.__len__() - 1) / 2)::]
-
-        # 4. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. Firstly
-        # two randomly chosen parents are removed from the list of members. From their gens the child is going to be
-        # made. This procedure is repeated until there's no parent left, or there's one last parent left without
-        # pair. In this case for this exact parent, some random parent is going to be chosen from the initiatory
-        # collection of parents.
-        children_matrix = [[0 for i in range(var.__len__() + 1)] for j in range(population)]
-        child_count = 0
-        # This loop is going to be repeated until the number of required members of new population is reached
-        while child_count + 1 <= population:
-
-            # initiatory_members_matrix is created for the purpose of making children. It's made every time when there's
-            # no parents left to make children. It's necessary, because every time the child is made, both of his
-            # parents are removed from the initiatory_members_matrix. This ensures a proper variety of pairs of parents
-            # mixing each others gens in order to make children. With such an approach the diversity of gens among next
-            # generation will be possibly increased, which makes the genetic algorithm more efficient.
-            initiatory_members_matrix = members_matrix[:]
-
-            while initiatory_members_matrix.__len__() > 0 and child_count + 1 <= population:
-
-                # Random chose of the first parent:
-                parent1 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-
-                # It can happen that there's only one parent left (if there's no parents left the "while" loop will be
-                # ended anyway). This case must be managed:
-                if initiatory_members_matrix.__len__() == 1:
-                    initiatory_members_matrix.remove(parent1)
-                    parent2 = parent1
-                    # This is necessary to avoid choosing the same parent:
-                    while_count = 0
-                    while parent1 == parent2:
-                        parent2 = members_matrix[random.randint(0, members_matrix.__len__() - 1)]
-                        while_count += 1
-                        # In case all members of population are the same, or at least, there's a suspicion of it, it'd
-                        # be good to make sure the loop is not going to run forever:
-                        are_all_equal = True
-                        if while_count > population:
-                            for m in members_matrix:
-                                if parent1 != m:
-                                    are_all_equal = False
-                        if are_all_equal:
-                            break
-
-                    # Now it's ensured parents are different, except from the case in which all members of
-                    # population are the same.
-
-                # For the case, in which there're at least two parents in the initiatory_members_matrix:
-                else:
-                    initiatory_members_matrix.remove(parent1)
-                    parent2 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-                    initiatory_members_matrix.remove(parent2)
-
-                # In this moment there're 2 parents chosen, so it's possible to make a child:
-                var_count = 0
-                for v in parent1:
-                    # Random chose of the chromosomes for child:
-                    if random.randint(1, 2) == 1:
-                        children_matrix[child_count][var_count] = v
-                    else:
-                        children_matrix[child_count][var_count] = parent2[var_count]
-                    var_count += 1
-
-                # Because the child has been made:
-                child_count += 1
-
-        # 5. Children become now members of the new generation.
-        members_matrix = children_matrix
-
-    return [best_members_temp_cond, best_members_turb_eff, best_members]
-
-
-def genetic_algorithm_alpha_favor_all_mutating(population, probability, generations,
-
-                                               q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                                               t_cond, overc_cond, t_evap, overh_evap,
-
-                                               press_bef_turb, temp_bef_turb,
-
-                                               pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-
-                                               amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
-                                               amb_p_evap_out, amb_p_cond_out,
-
-                                               isent_eff_turb,
-                                               isent_eff_pump, elec_eff_pump,
-                                               isent_eff_comp,
-                                               eff_boil, fuel_heat_val,
-                                               eff_turboeq):
+    # The single-objective genetic algorithm with pluggable strategies - all genetic_algorithm_* functions below run
+    # this function with their own strategies:
+    # - selection(members) returns the parents (population sorted from the best member) from the members sorted from
+    #   the worst one,
+    # - pairing(number_of_parents, number_of_children, rng) returns two arrays of indexes of parents of every child
+    #   (permutation_pairs(), alpha_favor_pairs(), alpha_with_each_pairs()),
+    # - elitism is the number of best members which aren't mutated. Then the children are evaluated before mutation
+    #   to find the best ones,
+    # - mutation(members, probability, first_member) mutates the members from first_member on.
+    # The values of genes of the best member of every generation given in recorded_genes (pairs of index of gene and
+    # its name) are returned as the lists (the first element is the name) followed by the list of best efficiencies.
 
     # Adding all function variables to one matrix.
     var = [q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
@@ -386,717 +93,117 @@ def genetic_algorithm_alpha_favor_all_mutating(population, probability, generati
            amb_p_cond_out, isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil,
            fuel_heat_val, eff_turboeq]
 
-    # Size of this matrix must take into consideration the efficiency which will be stored on the last index in every
-    # member.
-    members_matrix = [[0 for x in range(var.__len__() + 1)] for y in range(population)]
+    # The results of members which have been already evaluated are reused. If the cache of fitness hasn't been given,
+    # it's created only for this run of the algorithm:
+    if fitness_cache is None:
+        fitness_cache = FitnessCache(calculate_eff, var.__len__())
+    # Members are calculated one after another, unless an evaluator distributing them between processes is given:
+    if evaluator is None:
+        evaluator = SerialEvaluator()
+    # Generator of random numbers for all random operations of the algorithm - rng can be a generator or a seed, runs
+    # with the same seed give the same results:
+    rng = make_rng(rng)
+
+    # Number of members of population is set by the client. Values are being ascribed to members at random, the
+    # efficiency is stored as the objective of population:
+    members = Population(var, population, ('efficiency',), rng)
+    members.randomize()
 
-    # There's a need of a list containing the best members of particular generations:
+    # There's a need of a list containing the best members of particular generations. This is only for the purpose
+    # of evaluation of the algorithm:
     best_members = ['efficiency']
-    best_members_turb_eff = ['turb_eff']
-    best_members_temp_cond = ['temp_cond']
-
-    # Number of members of population is set by the client. Values are being ascribed to members:
-    for m in members_matrix:
-        var_count = 0
-        for v in var:
-            if type(v) is list:
-                # Random chose of the value
-                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-            else:
-                # Choosing the precise value
-                m[var_count] = v
-            var_count += 1
-
-    for x in range(generations):
+    best_members_genes = [[name] for gene, name in recorded_genes]
+
+    # If the checkpoint has been saved by the previous (interrupted) run, the run is continued from the saved
+    # generation. The finished run returns its saved results:
+    first_generation = 0
+    state = None if checkpoint is None else checkpoint.load(fitness_cache)
+    if state is not None:
+        if state['finished']:
+            return state['results']
+        first_generation = state['generation']
+        members = state['members']
+        best_members, best_members_genes = state['variables']
+
+    for x in range(first_generation, generations):
         print("Generation " + str(x))
 
         # 1. Mutation:
         # No mutation for the 0 generation.
         if x != 0:
-            for m in members_matrix:
-                var_count = 0
-                for v in var:
-                    if type(v) is list:
-                        # With a fixed probability this condition will be entered:
-                        if random.randint(1, 100) <= probability * 100:
-                            # This is necessary to avoid mutating into the same value:
-                            mutated = m[var_count]
-                            while mutated is m[var_count]:
-                                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-                            # After the while loop the mutated value is for sure different from the previous one
-                    var_count += 1
-
-        # 2. Calculating efficiencies of members, in terms of which the members are going to be compared:
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-
-        # 3. Sorting members and saving the better half of them regarding the efficiency:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-
-        # Saving some values for analysis:
-        best_members.append(members_matrix[members_matrix.__len__()-1][28])
-        best_members_temp_cond.append(members_matrix[members_matrix.__len__()-1][4])
-        best_members_turb_eff.append(members_matrix[members_matrix.__len__() - 1][21])
-
-        # In the last loop round it is unnecessary to proceed the instruction below:
-        if x == generations - 1:
-            break
-
-        # Having members sorted, the better half of them is going to be saved to become parents of next generation:
-        if members_matrix.__len__() % 2 == 0:
-            members_matrix = members_matrix[int(members_matrix.__len__() / 2)::]
-        else:
-            members_matrix = members_matrix[int((members_matrix.__len__() - 1) / 2)::]
-        members_matrix.reverse()
-        # 4. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. Firstly
-        # two best parents are matched together to make a child. Afterwards they're removed from the list of
-        # parents. Secondly two random parents are chosen from the remaining collections of parents and than they
-        # are removed from this. This procedure is repeated until there's no parent left, or there's one last parent
-        # left without pair. In this case for this exact parent, some random parent is going to be chosen from the
-        # initiatory collection of parents.
-        children_matrix = [[0 for i in range(var.__len__() + 1)] for j in range(population)]
-        child_count = 0
-        # First while loop
-        # This loop is going to be repeated until the number of required members of new population is reached
-        while child_count + 1 <= population:
-
-            # initiatory_members_matrix is created for the purpose of making children. It's made every time when there's
-            # no parents left to make children. It's necessary, because every time the child is made, both of his
-            # parents are removed from the initiatory_members_matrix. This ensures a proper variety of pairs of parents
-            # mixing each others gens in order to make children. With such an approach the diversity of gens among next
-            # generation will be possibly increased, which should make the genetic algorithm more efficient.
-            initiatory_members_matrix = members_matrix[:]
-
-            # Second while loop:
-            while initiatory_members_matrix.__len__() > 0 and child_count + 1 <= population:
-
-                # In this particular function, which favors alphas, it's necessary to firstly exchange the gens
-                # between two best members of population:
-                if initiatory_members_matrix.__len__() == members_matrix.__len__():
-
-                    parent1 = initiatory_members_matrix[0]
-                    parent2 = initiatory_members_matrix[1]
-                    initiatory_members_matrix.remove(parent1)
-                    initiatory_members_matrix.remove(parent2)
-
-                # For the rest of population, the algorithm applies solution of random matching:
-                else:
-
-                    # Random chose of the first parent:
-                    parent1 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-
-                    # It can happen that there's only one parent left:
-                    if initiatory_members_matrix.__len__() == 1:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = parent1
-                        # This is necessary to avoid choosing the same parent:
-                        while_count = 0
-                        while parent1 == parent2:
-                            parent2 = members_matrix[random.randint(0, members_matrix.__len__() - 1)]
-                            while_count += 1
-                            # In case all members of population are the same, or at least, there's a suspicion of it,
-                            # it'd be good to make sure the loop is not going to run forever:
-                            are_all_equal = True
-                            if while_count > population:
-                                for m in members_matrix:
-                                    if parent1 != m:
-                                        are_all_equal = False
-                            if are_all_equal:
-                                break
-
-                        # Now it's ensured parents are different, except from the case in which all members of
-                        # population are the same.
-
-                    # For the case, in which there're at least two parents in the initiatory_members_matrix:
-                    else:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-                        initiatory_members_matrix.remove(parent2)
-
-                # In this moment there're 2 parents chosen, so it's possible to make a child:
-                var_count = 0
-                for v in parent1:
-                    # Random chose of the chromosomes for child:
-                    if random.randint(1, 2) == 1:
-                        children_matrix[child_count][var_count] = v
-                    else:
-                        children_matrix[child_count][var_count] = parent2[var_count]
-                    var_count += 1
-
-                # Because the child has been made:
-                child_count += 1
-
-        # 5. Children become now members of the new generation.
-        members_matrix = children_matrix
-
-    return [best_members_temp_cond, best_members_turb_eff, best_members]
-
-
-def genetic_algorithm_alpha_favor_alpha_not_mutating(population, probability, generations,
-
-                                                     q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                                                     t_cond, overc_cond, t_evap, overh_evap,
-
-                                                     press_bef_turb, temp_bef_turb,
-
-                                                     pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-
-                                                     amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
-                                                     amb_p_evap_out,
-                                                     amb_p_cond_out,
-
-                                                     isent_eff_turb,
-                                                     isent_eff_pump, elec_eff_pump,
-                                                     isent_eff_comp,
-                                                     eff_boil, fuel_heat_val,
-                                                     eff_turboeq):
-    # Adding all function variables to one matrix.
-    var = [q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
-           press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond,
-           pr_boil, amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-           amb_p_cond_out, isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil,
-           fuel_heat_val, eff_turboeq]
-
-    # Size of this matrix must take into consideration the efficiency which will be stored on the last index in every
-    # member.
-    members_matrix = [[0 for x in range(var.__len__() + 1)] for y in range(population)]
+            if elitism > 0:
+                # The best members are found by evaluation of children before the mutation:
+                members.set_objectives(fitness_cache.evaluate_members(members.list_of_genes(), evaluator))
+                members.sort('efficiency', reverse=True)
+            mutation(members, probability, elitism)
 
-    # There's a need of a list containing the best members of particular generations:
-    best_members = ['efficiency']
-    best_members_turb_eff = ['turb_eff']
-    best_members_temp_cond = ['temp_cond']
-
-    # Number of members of population is set by the client. Values are being ascribed to members:
-    for m in members_matrix:
-        var_count = 0
-        for v in var:
-            if type(v) is list:
-                # Random chose of the value
-                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-            else:
-                # Choosing the precise value
-                m[var_count] = v
-            var_count += 1
-
-    for x in range(generations):
-        print("Generation " + str(x))
+        # 2. Evaluation - calculating efficiencies of members, according to which the members are going to be compared:
+        members.set_objectives(fitness_cache.evaluate_members(members.list_of_genes(), evaluator))
 
-        # In this function the mutation of the best member of the population is avoided, therefore evaluation is
-        # necessary to be done before mutation to find the two alpha members, which are going to reproduce with
-        # each other.
+        fitness_cache.close_generation()
 
-        # 0. Calculating efficiencies of members (evaluation):
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-        # Sorting members:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-        members_matrix.reverse()
+        # 3. Sorting members regarding the efficiency:
+        members.sort('efficiency')
 
-        # 1. Mutation:
-        # No mutation for the 0 generation.
-        if x != 0:
-            member_counter = 0
-            for m in members_matrix:
-
-                # Avoiding mutation of the alpha member:
-                if member_counter == 0:
-                    member_counter += 1
-                    continue
-
-                # Mutating the rest of population:
-                var_count = 0
-                for v in var:
-                    if type(v) is list:
-                        # With a fixed probability this condition will be entered:
-                        if random.randint(1, 100) <= probability * 100:
-                            # This is necessary to avoid mutating into the same value:
-                            mutated = m[var_count]
-                            while mutated is m[var_count]:
-                                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-                            # After the while loop the mutated value is for sure different from the previous one
-                    var_count += 1
-
-        # 2. Calculating efficiencies of members, in terms of which the members are going to be compared:
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-
-        # 3. Sorting members and saving the better half of them regarding the efficiency:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-
-        # Saving some values for analysis:
-        best_members.append(members_matrix[members_matrix.__len__() - 1][28])
-        best_members_temp_cond.append(members_matrix[members_matrix.__len__() - 1][4])
-        best_members_turb_eff.append(members_matrix[members_matrix.__len__() - 1][21])
+        # Saving some values for analysis, the best member is on the last index after sorting:
+        best_member = members.values(len(members) - 1)
+        best_members.append(float(members.objectives['efficiency'][-1]))
+        for (gene, name), best_members_gene in zip(recorded_genes, best_members_genes):
+            best_members_gene.append(best_member[gene])
 
         # In the last loop round it is unnecessary to proceed the instruction below:
         if x == generations - 1:
             break
 
-        # Having members sorted, the better half of them is going to be saved to become parents of next generation:
-        if members_matrix.__len__() % 2 == 0:
-            members_matrix = members_matrix[int(members_matrix.__len__() / 2)::]
-        else:
-            members_matrix = members_matrix[int((members_matrix.__len__() - 1) / 2)::]
-        members_matrix.reverse()
-        # 4. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. Firstly
-        # two best parents are matched together to make a child. Afterwards they're removed from the list of
-        # parents. Secondly two random parents are chosen from the remaining collections of parents and than they
-        # are removed from this. This procedure is repeated until there's no parent left, or there's one last parent
-        # left without pair. In this case for this exact parent, some random parent is going to be chosen from the
-        # initiatory collection of parents.
-        children_matrix = [[0 for i in range(var.__len__() + 1)] for j in range(population)]
-        child_count = 0
-        # This loop is going to be repeated until the number of required members of new population is reached
-        while child_count + 1 <= population:
-
-            # initiatory_members_matrix is created for the purpose of making children. It's made every time when there's
-            # no parents left to make children. It's necessary, because every time the child is made, both of his
-            # parents are removed from the initiatory_members_matrix. This ensures a proper variety of pairs of parents
-            # mixing each others gens in order to make children. With such an approach the diversity of gens among next
-            # generation will be possibly increased, which should make the genetic algorithm more efficient.
-            initiatory_members_matrix = members_matrix[:]
-
-            while initiatory_members_matrix.__len__() > 0 and child_count + 1 <= population:
-
-                # In this particular function, which favors alphas, it's necessary to firstly exchange the gens
-                # between two best members of population:
-
-                if initiatory_members_matrix.__len__() == members_matrix.__len__():
-
-                    parent1 = initiatory_members_matrix[0]
-                    parent2 = initiatory_members_matrix[1]
-                    initiatory_members_matrix.remove(parent1)
-                    initiatory_members_matrix.remove(parent2)
-
-                # For the rest of population, the algorithm applies solution of random matching:
-                else:
-
-                    # Random chose of the first parent:
-                    parent1 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-
-                    # It can happen that there's only one parent left:
-                    if initiatory_members_matrix.__len__() == 1:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = parent1
-                        # This is necessary to avoid choosing the same parent:
-                        while_count = 0
-                        while parent1 == parent2:
-                            parent2 = members_matrix[random.randint(0, members_matrix.__len__() - 1)]
-                            while_count += 1
-                            # In case all members of population are the same, or at least, there's a suspicion of it,
-                            # it'd be good to make sure the loop is not going to run forever:
-                            are_all_equal = True
-                            if while_count > population:
-                                for m in members_matrix:
-                                    if parent1 != m:
-                                        are_all_equal = False
-                            if are_all_equal:
-                                break
-
-                        # Now it's ensured parents are different, except from the case in which all members of
-                        # population are the same.
-
-                    # For the case, in which there're at least two parents in the initiatory_members_matrix:
-                    else:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-                        initiatory_members_matrix.remove(parent2)
-
-                # In this moment there're 2 parents chosen, so it's possible to make a child:
-                var_count = 0
-                for v in parent1:
-                    # Random chose of the chromosomes for child:
-                    if random.randint(1, 2) == 1:
-                        children_matrix[child_count][var_count] = v
-                    else:
-                        children_matrix[child_count][var_count] = parent2[var_count]
-                    var_count += 1
-
-                # Because the child has been made:
-                child_count += 1
-
-        # 5. Children become now members of the new generation.
-        members_matrix = children_matrix
-
-    return [best_members_temp_cond, best_members_turb_eff, best_members]
-
-
-def genetic_algorithm_alpha_with_each_all_mutating(population, probability, generations,
-
-                                                   q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                                                   t_cond, overc_cond, t_evap, overh_evap,
-
-                                                   press_bef_turb, temp_bef_turb,
-
-                                                   pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-
-                                                   amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
-                                                   amb_p_evap_out, amb_p_cond_out,
-
-                                                   isent_eff_turb,
-                                                   isent_eff_pump, elec_eff_pump,
-                                                   isent_eff_comp,
-                                                   eff_boil, fuel_heat_val,
-                                                   eff_turboeq):
+        # 4. Selection of parents of the next generation:
+        members = selection(members)
 
-    # Adding all function variables to one matrix.
-    var = [q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
-           press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond,
-           pr_boil, amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-           amb_p_cond_out, isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil,
-           fuel_heat_val, eff_turboeq]
+        # 5. Making children from the parents gens. It's assumed, that there's always 2 parents for one child.
+        parents1, parents2 = pairing(len(members), population, members.rng)
 
-    # Size of this matrix must take into consideration the efficiency which will be stored on the last index in every
-    # member.
-    members_matrix = [[0 for x in range(var.__len__() + 1)] for y in range(population)]
+        # 6. Children become now members of the new generation.
+        members = members.crossover(parents1, parents2)
 
-    # There's a need of a list containing the best members of particular generations:
-    best_members = ['efficiency']
-    best_members_turb_eff = ['turb_eff']
-    best_members_temp_cond = ['temp_cond']
-
-    # Number of members of population is set by the client. Values are being ascribed to members:
-    for m in members_matrix:
-        var_count = 0
-        for v in var:
-            if type(v) is list:
-                # Random chose of the value
-                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-            else:
-                # Choosing the precise value
-                m[var_count] = v
-            var_count += 1
-
-    for x in range(generations):
-        print("Generation " + str(x))
+        # Saving the state of the algorithm before the next generation:
+        if checkpoint is not None and checkpoint.is_due(x):
+            checkpoint.save({'finished': False, 'generation': x + 1, 'members': members,
+                             'variables': [best_members, best_members_genes]}, fitness_cache)
 
-        # 1. Mutation:
-        # No mutation for the 0 generation.
-        if x != 0:
-            for m in members_matrix:
-                var_count = 0
-                for v in var:
-                    if type(v) is list:
-                        # With a fixed probability this condition will be entered:
-                        if random.randint(1, 100) <= probability * 100:
-                            # This is necessary to avoid mutating into the same value:
-                            mutated = m[var_count]
-                            while mutated is m[var_count]:
-                                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-                            # After the while loop the mutated value is for sure different from the previous one
-                    var_count += 1
-
-        # 2. Calculating efficiencies of members, in terms of which the members are going to be compared:
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-
-        # 3. Sorting members and saving the better half of them regarding the efficiency:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-
-        # Saving some values for analysis:
-        best_members.append(members_matrix[members_matrix.__len__()-1][28])
-        best_members_temp_cond.append(members_matrix[members_matrix.__len__()-1][4])
-        best_members_turb_eff.append(members_matrix[members_matrix.__len__() - 1][21])
+    if fitness_cache.file_name != '':
+        fitness_cache.save()
 
-        # In the last loop round it is unnecessary to proceed the instruction below:
-        if x == generations - 1:
-            break
+    results = best_members_genes + [best_members]
+    if checkpoint is not None:
+        checkpoint.save_finished(results, fitness_cache)
+    return results
 
-        # Having members sorted, the better half of them is going to be saved to become parents of next generation:
-        if members_matrix.__len__() % 2 == 0:
-            members_matrix = members_matrix[int(members_matrix.__len__() / 2)::]
-        else:
-            members_matrix = members_matrix[int((members_matrix.__len__() - 1) / 2)::]
-        members_matrix.reverse()
-
-        # 4. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. In this
-        # particular function alpha member is firstly reproducing with all other members. Afterwards the other members
-        # are reproducing randomly with each other.
-        alpha_reproduction_done = False
-        children_matrix = [[0 for i in range(var.__len__() + 1)] for j in range(population)]
-        child_count = 0
-        # First while loop
-        # This loop is going to be repeated until the number of required members of new population is reached
-        while child_count + 1 <= population:
-
-            # initiatory_members_matrix is created for the purpose of making children. It's made every time when there's
-            # no parents left to make children. It's necessary, because every time the child is made, both of his
-            # parents are removed from the initiatory_members_matrix.
-            initiatory_members_matrix = members_matrix[:]
-
-            # Second while loop
-            while initiatory_members_matrix.__len__() > 0 and child_count + 1 <= population:
-
-                # In this particular function, firstly the alpha member is reproducing with all other members:
-
-                if not alpha_reproduction_done:
-
-                    parent1 = initiatory_members_matrix[0]
-                    parent2 = initiatory_members_matrix[1]
-                    initiatory_members_matrix.remove(parent2)
-                    if initiatory_members_matrix.__len__() == 1:
-                        initiatory_members_matrix.remove(parent1)
-
-                # For the rest of population, the algorithm applies solution of random matching:
-                else:
-
-                    # Random chose of the first parent:
-                    parent1 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-
-                    # It can happen that there's only one parent left:
-                    if initiatory_members_matrix.__len__() == 1:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = parent1
-                        # This is necessary to avoid choosing the same parent:
-                        while_count = 0
-                        while parent1 == parent2:
-                            parent2 = members_matrix[random.randint(0, members_matrix.__len__() - 1)]
-                            while_count += 1
-                            # In case all members of population are the same, or at least, there's a suspicion of it,
-                            # it'd be good to make sure the loop is not going to run forever:
-                            are_all_equal = True
-                            if while_count > population:
-                                for m in members_matrix:
-                                    if parent1 != m:
-                                        are_all_equal = False
-                            if are_all_equal:
-                                break
-
-                        # Now it's ensured parents are different, except from the case in which all members of
-                        # population are the same.
-
-                    # For the case, in which there're at least two parents in the initiatory_members_matrix:
-                    else:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-                        initiatory_members_matrix.remove(parent2)
-
-                # In this moment there're 2 parents chosen, so it's possible to make a child:
-                var_count = 0
-                for v in parent1:
-                    # Random chose of the chromosomes for child:
-                    if random.randint(1, 2) == 1:
-                        children_matrix[child_count][var_count] = v
-                    else:
-                        children_matrix[child_count][var_count] = parent2[var_count]
-                    var_count += 1
-
-                # Because the child has been made:
-                child_count += 1
-
-            # After finishing the second while loop, the program is supposed to make the second part of reproduction,
-            # which is matching parents randomly. In order to do this the program needs an information, that the first
-            # part was done:
-            alpha_reproduction_done = True
-
-        # 5. Children become now members of the new generation.
-        members_matrix = children_matrix
-
-    return [best_members_temp_cond, best_members_turb_eff, best_members]
-
-
-def genetic_algorithm_alpha_with_each_alpha_not_mutating(population, probability, generations,
-
-                                                         q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                                                         t_cond, overc_cond, t_evap, overh_evap,
-
-                                                         press_bef_turb, temp_bef_turb,
-
-                                                         pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-
-                                                         amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
-                                                         amb_p_evap_out, amb_p_cond_out,
-
-                                                         isent_eff_turb,
-                                                         isent_eff_pump, elec_eff_pump,
-                                                         isent_eff_comp,
-                                                         eff_boil, fuel_heat_val,
-                                                         eff_turboeq):
-    # Adding all function variables to one matrix.
-    var = [q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
-           press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond,
-           pr_boil, amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-           amb_p_cond_out, isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil,
-           fuel_heat_val, eff_turboeq]
 
-    # Size of this matrix must take into consideration the efficiency which will be stored on the last index in every
-    # member.
-    members_matrix = [[0 for x in range(var.__len__() + 1)] for y in range(population)]
+# All members are mutated and the parents are matched at random.
+genetic_algorithm_basic_all_mutating = partial(
+    genetic_algorithm_soo, pairing=permutation_pairs, elitism=0,
+    recorded_genes=((4, 'temp_cond'), (21, 'turb_eff'), (24, 'comp_eff'), (22, 'pump_eff'), (25, 'boil_eff')))
 
-    # There's a need of a list containing the best members of particular generations:
-    best_members = ['efficiency']
-    best_members_turb_eff = ['turb_eff']
-    best_members_temp_cond = ['temp_cond']
-    best_members_press_bef_turb = ['press_bef_turb']
-    best_members_temp_bef_turb = ['temp_bef_turb']
-
-    # Number of members of population is set by the client. Values are being ascribed to members:
-    for m in members_matrix:
-        var_count = 0
-        for v in var:
-            if type(v) is list:
-                # Random chose of the value
-                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-            else:
-                # Choosing the precise value
-                m[var_count] = v
-            var_count += 1
-
-    for x in range(generations):
-        print("Generation " + str(x))
-
-        # 0. Calculating efficiencies of members (evaluation):
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23],
-                                  m[24], m[25], m[26], m[27])
-        # Sorting members:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
-        members_matrix.reverse()
+# The best member isn't mutated and the parents are matched at random.
+genetic_algorithm_basic_alpha_not_mutating = partial(genetic_algorithm_soo, pairing=permutation_pairs, elitism=1)
 
-        # 1. Mutation:
-        # No mutation for the 0 generation.
-        if x != 0:
-            member_counter = 0
-            for m in members_matrix:
-                var_count = 0
-
-                # Avoiding mutation of the two alpha members:
-                if member_counter == 0:
-                    member_counter += 1
-                    continue
-
-                for v in var:
-                    if type(v) is list:
-                        # With a fixed probability this condition will be entered:
-                        if random.randint(1, 100) <= probability * 100:
-                            # This is necessary to avoid mutating into the same value:
-                            mutated = m[var_count]
-                            while mutated is m[var_count]:
-                                m[var_count] = v[random.randint(0, v.__len__() - 1)]
-                            # After the while loop the mutated value is for sure different from the previous one
-                    var_count += 1
-
-        # 2. Calculating efficiencies of members, in terms of which the members are going to be compared:
-        for m in members_matrix:
-            m[28] = calculate_eff(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11], m[12],
-                                  m[13], m[14], m[15], m[16], m[17], m[18], m[19], m[20], m[21], m[22], m[23], m[24],
-                                  m[25], m[26], m[27])
-
-        # 3. Sorting members and saving the better half of them regarding the efficiency:
-        members_matrix = sorted(members_matrix, key=lambda member: member[28])
+# This version of genetic algorithm function favors the best members in case of reproduction - two the best members
+# of population always reproduce with each other. For the rest of members the match is random. All members are
+# mutated.
+genetic_algorithm_alpha_favor_all_mutating = partial(genetic_algorithm_soo, pairing=alpha_favor_pairs, elitism=0)
 
-        # Saving some values for analysis, the best member is on the last index after sorting:
-        best_members.append(members_matrix[members_matrix.__len__() - 1][28])
-        best_members_temp_cond.append(members_matrix[members_matrix.__len__() - 1][4])
-        best_members_turb_eff.append(members_matrix[members_matrix.__len__() - 1][21])
-        best_members_press_bef_turb.append(members_matrix[members_matrix.__len__()-1][8])
-        best_members_temp_bef_turb.append(members_matrix[members_matrix.__len__() - 1][9])
+# Two the best members of population always reproduce with each other, for the rest of members the match is random.
+# The best member isn't mutated.
+genetic_algorithm_alpha_favor_alpha_not_mutating = partial(genetic_algorithm_soo, pairing=alpha_favor_pairs, elitism=1)
 
-        # In the last loop round it is unnecessary to proceed the instruction below:
-        if x == generations - 1:
-            break
+# The best member firstly reproduces with all other members, afterwards the members are matched at random. All members
+# are mutated.
+genetic_algorithm_alpha_with_each_all_mutating = partial(genetic_algorithm_soo, pairing=alpha_with_each_pairs,
+                                                         elitism=0)
 
-        # Having members sorted, the better half of them is going to be saved to become parents of next generation:
-        if members_matrix.__len__() % 2 == 0:
-            members_matrix = members_matrix[int(members_matrix.__len__() / 2)::]
-        else:
-            members_matrix = members_matrix[int((members_matrix.__len__() - 1) / 2)::]
-        members_matrix.reverse()
-
-        # 4. Making children from the parents gens. It's assumed, that there's always 2 parents for one child. In this
-        # particular function alpha member is firstly reproducing with all other members. Afterwards the other members
-        # are reproducing randomly with each other.
-        alpha_reproduction_done = False
-        children_matrix = [[0 for i in range(var.__len__() + 1)] for j in range(population)]
-        child_count = 0
-        # This loop is going to be repeated until the number of required members of new population is reached
-        while child_count + 1 <= population:
-
-            # initiatory_members_matrix is created for the purpose of making children. It's made every time when there's
-            # no parents left to make children. It's necessary, because every time the child is made, both of his
-            # parents are removed from the initiatory_members_matrix.
-            initiatory_members_matrix = members_matrix[:]
-
-            while initiatory_members_matrix.__len__() > 0 and child_count + 1 <= population:
-
-                # In this particular function, firstly the alpha member is reproducing with all other members:
-
-                if not alpha_reproduction_done:
-
-                    parent1 = initiatory_members_matrix[0]
-                    parent2 = initiatory_members_matrix[1]
-                    initiatory_members_matrix.remove(parent2)
-                    if initiatory_members_matrix.__len__() == 1:
-                        initiatory_members_matrix.remove(parent1)
-
-                # For the rest of population, the algorithm applies solution of random matching:
-                else:
-
-                    # Random chose of the first parent:
-                    parent1 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-
-                    # It can happen that there's only one parent left:
-                    if initiatory_members_matrix.__len__() == 1:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = parent1
-                        # This is necessary to avoid choosing the same parent:
-                        while_count = 0
-                        while parent1 == parent2:
-                            parent2 = members_matrix[random.randint(0, members_matrix.__len__() - 1)]
-                            while_count += 1
-                            # In case all members of population are the same, or at least, there's a suspicion of it,
-                            # it'd be good to make sure the loop is not going to run forever:
-                            are_all_equal = True
-                            if while_count > population:
-                                for m in members_matrix:
-                                    if parent1 != m:
-                                        are_all_equal = False
-                            if are_all_equal:
-                                break
-
-                        # Now it's ensured parents are different, except from the case in which all members of
-                        # population are the same.
-
-                    # For the case, in which there're at least two parents in the initiatory_members_matrix:
-                    else:
-                        initiatory_members_matrix.remove(parent1)
-                        parent2 = initiatory_members_matrix[random.randint(0, initiatory_members_matrix.__len__() - 1)]
-                        initiatory_members_matrix.remove(parent2)
-
-                # In this moment there're 2 parents chosen, so it's possible to make a child:
-                var_count = 0
-                for v in parent1:
-                    # Random chose of the chromosomes for child:
-                    if random.randint(1, 2) == 1:
-                        children_matrix[child_count][var_count] = v
-                    else:
-                        children_matrix[child_count][var_count] = parent2[var_count]
-                    var_count += 1
-
-                # Because the child has been made:
-                child_count += 1
-
-            # After finishing the while loop above, the program is supposed to make the second part of reproduction,
-            # which is matching parents randomly. In order to do this the program needs an information, that the first
-            # part was done:
-            alpha_reproduction_done = True
-
-        # 5. Children become now members of the new generation.
-        members_matrix = children_matrix
-
-    return [best_members_temp_cond, best_members_turb_eff, best_members]
+# The best member firstly reproduces with all other members, afterwards the members are matched at random. The best
+# member isn't mutated.
+genetic_algorithm_alpha_with_each_alpha_not_mutating = partial(genetic_algorithm_soo, pairing=alpha_with_each_pairs,
+                                                               elitism=1)
 
 
 def test_genetic_algorithm(genetic_algorithm, name_of_pop_file, name_of_mut_file, name_of_gen_file,
@@ -1114,7 +221,29 @@ def test_genetic_algorithm(genetic_algorithm, name_of_pop_file, name_of_mut_file
                            isent_eff_pump, elec_eff_pump,
                            isent_eff_comp,
                            eff_boil, fuel_heat_val,
-                           eff_turboeq):
+                           eff_turboeq, seed=None, max_workers=None):
+
+    # The cases of all three tests are independent jobs, which are executed in parallel by max_workers processes (see
+    # run_study()). Every case is run with its own seed made from the given one, so the cases don't depend on each
+    # other and the whole test can be repeated with the same seed:
+    cases = ([{'population': p, 'probability': mutation_prob, 'generations': generations} for p in population_test]
+             + [{'population': population, 'probability': m, 'generations': generations} for m in mutation_prob_test]
+             + [{'population': population, 'probability': mutation_prob, 'generations': g} for g in generations_test])
+    arguments = dict(q_cap=q_cap, work_fl=work_fl, amb_work_fl_cond=amb_work_fl_cond, amb_work_fl_evap=amb_work_fl_evap,
+                     t_cond=t_cond, overc_cond=overc_cond, t_evap=t_evap, overh_evap=overh_evap,
+                     press_bef_turb=press_bef_turb, temp_bef_turb=temp_bef_turb,
+                     pr_evap=pr_evap, amb_pr_evap=amb_pr_evap, pr_cond=pr_cond, amb_pr_cond=amb_pr_cond,
+                     pr_boil=pr_boil, amb_t_evap_in=amb_t_evap_in, amb_t_evap_out=amb_t_evap_out,
+                     amb_t_cond_in=amb_t_cond_in, amb_t_cond_out=amb_t_cond_out, amb_p_evap_out=amb_p_evap_out,
+                     amb_p_cond_out=amb_p_cond_out, isent_eff_turb=isent_eff_turb, isent_eff_pump=isent_eff_pump,
+                     elec_eff_pump=elec_eff_pump, isent_eff_comp=isent_eff_comp, eff_boil=eff_boil,
+                     fuel_heat_val=fuel_heat_val, eff_turboeq=eff_turboeq)
+    rows, all_results = run_study(genetic_algorithm, cases, arguments, 1, best_efficiency_metrics, seed, max_workers,
+                                  keep_results=True, warm_up_fluids=[work_fl, amb_work_fl_cond, amb_work_fl_evap])
+    # Every case has been run once:
+    all_results = [case_results[0] for case_results in all_results]
+    first_mut_case = len(population_test)
+    first_gen_case = len(population_test) + len(mutation_prob_test)
 
     # Preparing an xlsx files to save calculation data:
     workbook_pop_numb = xlsxwriter.Workbook(name_of_pop_file + '.xlsx')
@@ -1125,23 +254,7 @@ def test_genetic_algorithm(genetic_algorithm, name_of_pop_file, name_of_mut_file
     worksheet_gen_numb = workbook_gen_numb.add_worksheet()
 
     # 1. Testing the influence of population number:
-    results = []
-    for p in population_test:
-        results.append(genetic_algorithm(p, mutation_prob, generations,
-                                         q_cap,
-                                         work_fl, amb_work_fl_cond, amb_work_fl_evap,
-                                         t_cond, overc_cond, t_evap, overh_evap,
-                                         press_bef_turb, temp_bef_turb,
-                                         pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-                                         amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-                                         amb_p_cond_out,
-                                         isent_eff_turb,
-                                         isent_eff_pump, elec_eff_pump,
-                                         isent_eff_comp,
-                                         eff_boil, fuel_heat_val,
-                                         eff_turboeq))
-        print("Case for population = " + str(p) + ", mutation_prob = " + str(mutation_prob) + ", generations = " +
-              str(generations) + " has been calculated.")
+    results = all_results[0:first_mut_case]
 
     # Starting row for each population:
     r_count = 0
@@ -1160,27 +273,12 @@ def test_genetic_algorithm(genetic_algorithm, name_of_pop_file, name_of_mut_file
             bests_count += 1
         r_count += 1
         start_row = start_row + 2 + r.__len__()
+    write_study_table(workbook_pop_numb.add_worksheet("study"), rows[0:first_mut_case])
     workbook_pop_numb.close()
     print("MILESTONE! Testing the influence of population number has been accomplished.")
 
     # 2. Testing the influence of mutation probability:
-    results = []
-    for m in mutation_prob_test:
-        results.append(genetic_algorithm(population, m, generations,
-                                         q_cap,
-                                         work_fl, amb_work_fl_cond, amb_work_fl_evap,
-                                         t_cond, overc_cond, t_evap, overh_evap,
-                                         press_bef_turb, temp_bef_turb,
-                                         pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-                                         amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-                                         amb_p_cond_out,
-                                         isent_eff_turb,
-                                         isent_eff_pump, elec_eff_pump,
-                                         isent_eff_comp,
-                                         eff_boil, fuel_heat_val,
-                                         eff_turboeq))
-        print("Case for population = " + str(population) + ", mutation_prob = " + str(m) + ", generations = " +
-              str(generations) + " has been calculated.")
+    results = all_results[first_mut_case:first_gen_case]
 
     r_count = 0
     # Starting row for each population:
@@ -1199,27 +297,12 @@ def test_genetic_algorithm(genetic_algorithm, name_of_pop_file, name_of_mut_file
             bests_count += 1
         r_count += 1
         start_row = start_row + 2 + r.__len__()
+    write_study_table(workbook_mut_prob.add_worksheet("study"), rows[first_mut_case:first_gen_case])
     workbook_mut_prob.close()
     print("MILESTONE! Testing the influence of mutation probability has been accomplished.")
 
     # 3. Testing the influence of number of generations:
-    results = []
-    for g in generations_test:
-        results.append(genetic_algorithm(population, mutation_prob, g,
-                                         q_cap,
-                                         work_fl, amb_work_fl_cond, amb_work_fl_evap,
-                                         t_cond, overc_cond, t_evap, overh_evap,
-                                         press_bef_turb, temp_bef_turb,
-                                         pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
-                                         amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-                                         amb_p_cond_out,
-                                         isent_eff_turb,
-                                         isent_eff_pump, elec_eff_pump,
-                                         isent_eff_comp,
-                                         eff_boil, fuel_heat_val,
-                                         eff_turboeq))
-        print("Case for population = " + str(population) + ", mutation_prob = " + str(mutation_prob) +
-              ", generations = " + str(g) + " has been calculated.")
+    results = all_results[first_gen_case:]
 
     r_count = 0
     # Starting row for each population:
@@ -1240,53 +323,58 @@ def test_genetic_algorithm(genetic_algorithm, name_of_pop_file, name_of_mut_file
             bests_count += 1
         r_count += 1
         start_row = start_row + 2 + r.__len__()
+    write_study_table(workbook_gen_numb.add_worksheet("study"), rows[first_gen_case:])
     workbook_gen_numb.close()
     print("MILESTONE! Testing the influence of generations number has been accomplished.")
 
 
-# Input data:
-q_cap = 1e5
-work_fl = 'ammonia'
-amb_work_fl_cond = 'air'
-amb_work_fl_evap = 'air'
-t_cond = 35 + 273.15          # K
-overc_cond = 2                  # K
-t_evap = -12 + 273.15           # K
-overh_evap = 2                  # K
-# press_bef_turb = [40e5, 50e5, 60e5, 70e5, 80e5, 90e5]           # Pa
-# temp_bef_turb = [393, 413, 433, 453, 483, 523]    # K
-press_bef_turb = 60e5           # Pa
-temp_bef_turb = 180 + 273.15    # K
-pr_evap = 0.99
-amb_pr_evap = 0.99
-pr_cond = 0.99
-amb_pr_cond = 0.99
-pr_boil = 0.99
-
-amb_t_evap_in = -4 + 273.15     # K
-amb_t_evap_out = -8 + 273.15    # K
-amb_t_cond_in = 20 + 273.15     # K
-amb_t_cond_out = 30 + 273.15    # K
-amb_p_evap_out = 1e5            # Pa
-amb_p_cond_out = 1e5            # Pa
-
-isent_eff_turb = 0.7
-isent_eff_pump = 0.9
-elec_eff_pump = 0.9
-isent_eff_comp = 0.7
-eff_boil = 0.9
-fuel_heat_val = 26e6            # J/kg
-eff_turboeq = 0.99
-
-iset = 0.6
-isent_eff_turb = []
-while iset <= 0.9:
-    isent_eff_turb.append(iset)
-    iset += 0.01
-
-# For the genetic algorithm:
-# Standard values:
-mutation_prob = 0.2
-generations = 30
-population = 30
+def best_efficiency_metrics(results):
+    # The efficiency of the best member of the last generation of one run, averaged by run_study():
+    return {'best_efficiency': results[-1][-1]}
+
+
+# The input data below is prepared only when this file is run directly, so the functions can be imported without
+# any side effects.
+if __name__ == "__main__":
+    # Input data:
+    q_cap = 1e5
+    work_fl = 'ammonia'
+    amb_work_fl_cond = 'air'
+    amb_work_fl_evap = 'air'
+    t_cond = 35 + 273.15          # K
+    overc_cond = 2                  # K
+    t_evap = -12 + 273.15           # K
+    overh_evap = 2                  # K
+    # press_bef_turb = [40e5, 50e5, 60e5, 70e5, 80e5, 90e5]           # Pa
+    # temp_bef_turb = [393, 413, 433, 453, 483, 523]    # K
+    press_bef_turb = 60e5           # Pa
+    temp_bef_turb = 180 + 273.15    # K
+    pr_evap = 0.99
+    amb_pr_evap = 0.99
+    pr_cond = 0.99
+    amb_pr_cond = 0.99
+    pr_boil = 0.99
+
+    amb_t_evap_in = -4 + 273.15     # K
+    amb_t_evap_out = -8 + 273.15    # K
+    amb_t_cond_in = 20 + 273.15     # K
+    amb_t_cond_out = 30 + 273.15    # K
+    amb_p_evap_out = 1e5            # Pa
+    amb_p_cond_out = 1e5            # Pa
+
+    isent_eff_turb = 0.7
+    isent_eff_pump = 0.9
+    elec_eff_pump = 0.9
+    isent_eff_comp = 0.7
+    eff_boil = 0.9
+    fuel_heat_val = 26e6            # J/kg
+    eff_turboeq = 0.99
+
+    isent_eff_turb = ContinuousDomain(0.6, 0.9, 0.01)
+
+    # For the genetic algorithm:
+    # Standard values:
+    mutation_prob = 0.2
+    generations = 30
+    population = 30
 
@@ -1,4 +1,4 @@
-from CoolProp.CoolProp import PropsSI
+from PropertyService import property_service
 from Component import Component
 
 
@@ -47,12 +47,13 @@ class Boiler(Component):
             # The function is based on the assumption, that the parameters before the turbine (after the boiler)
             # are known. The major goal of the function is to calculate the demand for fuel.
             self.press_in = self.press_out / self.pr
-            self.enth_in = PropsSI('H', 'P', self.press_in, 'T', self.temp_in, self.work_fl)
-            self.enth_out = PropsSI('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
-            self.temp_in = PropsSI('T', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
-            self.temp_out = PropsSI('T', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            self.enth_in = property_service.props_si('H', 'P', self.press_in, 'T', self.temp_in, self.work_fl)
+            self.enth_out = property_service.props_si('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
+            # Temperature and entropy of inlet and outlet are read from one state of the fluid each:
+            self.temp_in, self.entr_in = property_service.props_si_multi(['T', 'S'], 'H', self.enth_in, 'P',
+                                                                         self.press_in, self.work_fl)
+            self.temp_out, self.entr_out = property_service.props_si_multi(['T', 'S'], 'H', self.enth_out, 'P',
+                                                                           self.press_out, self.work_fl)
 
             # Having the specific enthalpies calculated, it's possible to calculate the fuel demand:
             self.fuel_dem = self.mass_fl * (self.enth_out - self.enth_in) / self.fuel_heat_val / self.eff
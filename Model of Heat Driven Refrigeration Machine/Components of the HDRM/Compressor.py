@@ -1,4 +1,4 @@
-from CoolProp.CoolProp import PropsSI
+from PropertyService import property_service
 from Component import Component
 
 
@@ -44,8 +44,8 @@ class Compressor(Component):
             # Compressor is very susceptible to damage, when there is even a little bit of humidity in the gas
             # in inlet. The function won't refuse to initialize such instance of Compressor class, but it's advisable
             # to warn the user:
-            temp_sat = PropsSI('T', 'P', self.press_in, 'Q', 1, self.work_fl)
-            self.temp_in = PropsSI('T', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+            temp_sat = property_service.props_si('T', 'P', self.press_in, 'Q', 1, self.work_fl)
+            self.temp_in = property_service.props_si('T', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
             if self.temp_in < temp_sat:
                 print("Compressor.__init__(): Warning! Temperature of inlet in compressor is below the temperature of "
                       "saturation, which means there's some humidity in the gas entering the compressor!\n"
@@ -79,18 +79,19 @@ class Compressor(Component):
 
             # Using the isentropic efficiency equations to solve the parameters after the compressor:
             entr_aft_isent_transf = self.entr_in
-            enth_after_isent_transform = PropsSI('H', 'S', entr_aft_isent_transf, 'P', self.press_out, self.work_fl)
+            enth_after_isent_transform = property_service.props_si('H', 'S', entr_aft_isent_transf, 'P',
+                                                                   self.press_out, self.work_fl)
             self.enth_out = (enth_after_isent_transform - self.enth_in) / self.isent_eff + self.enth_in
-            self.temp_out = PropsSI('T', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.temp_in = PropsSI('T', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+            self.temp_out, self.entr_out = property_service.props_si_multi(['T', 'S'], 'H', self.enth_out, 'P',
+                                                                           self.press_out, self.work_fl)
+            self.temp_in = property_service.props_si('T', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
 
             # There is a possibility, that the compression process will end in saturation area. It's necessary to
             # prove such an occurrence. The actions taken here will be useful for GA in investigation of
             # working fluids.
-            enth_sat = PropsSI('H', 'P', self.press_out, 'Q', 1, self.work_fl)
+            enth_sat = property_service.props_si('H', 'P', self.press_out, 'Q', 1, self.work_fl)
             if self.enth_out < enth_sat:
-                vap_q = PropsSI('Q', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+                vap_q = property_service.props_si('Q', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
                 print("Compressor.calculate(): Warning! Vapor quality of outlet in compressor is below 1 "
                       ", which means there's some humidity in the gas at the end of compressor!\n"
                       "Vapor quality of outlet: " + str(vap_q) + ".")
@@ -1,8 +1,8 @@
+import numpy as np
 import xlsxwriter
 
 from Component import Component
-from tespy import cmp, con, nwk
-from CoolProp.CoolProp import PropsSI
+from PropertyService import property_service
 
 
 class Condenser(Component):
@@ -50,6 +50,29 @@ class Condenser(Component):
         # For checking if the values are appropriate in function set_attr_pow_cyc():
         self.approved = False
 
+        # The TESPy model of the condenser is built only when one of the TESPy functions is really used. The function
+        # calculate_combined_cyc() doesn't need it, so in such case creating the network would be a waste of time,
+        # especially in the genetic algorithm, which creates a new condenser for every member.
+        self.nw = None
+
+        # Profiles of enthalpies and temperatures calculated for particular values of accuracy, together with the
+        # values of attributes they were calculated for (see generate_enthalpies_data()):
+        self.enth_profiles = {}
+        self.temp_profiles = {}
+
+    def build_tespy_model(self):
+
+        # The network is built only once for the instance of class:
+        if self.nw is not None:
+            return True
+
+        if self.work_fl == '' or self.amb_work_fl == '':
+            print("Working fluid or the ambient working fluid hasn't been set, so creating the TESPy network model"
+                  "can't be completed.\n")
+            return False
+
+        from tespy import cmp, con, nwk
+
         # Applying the condenser model using TESPy. Firstly the components and connections must be set, afterwards
         # the function will set the attributes and TESPy solver will calculate the demanded result.
         # Setting components:
@@ -65,25 +88,24 @@ class Condenser(Component):
         self.cycle_cond = con.connection(self.cycle_outlet, 'out1', self.condenser, 'in1')
         self.cond_cycle = con.connection(self.condenser, 'out1', self.cycle_inlet, 'in1')
 
-        if self.work_fl == '' or self.amb_work_fl == '':
-            print("Working fluid or the ambient working fluid hasn't been set, so creating the TESPy network model"
-                  "can't be completed.\n")
+        # Putting the connections into the network (TESPy):
+        # Because TESPy isn't smart enough and it throws error when the working fluid in the cycle
+        # is the same as the one in ambient,
+        # it is necessary to make a division of initialization of network basic attributes:
+        if self.work_fl == self.amb_work_fl:
+            self.nw = nwk.network(fluids=[self.work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
         else:
-            # Putting the connections into the network (TESPy):
-            # Because TESPy isn't smart enough and it throws error when the working fluid in the cycle
-            # is the same as the one in ambient,
-            # it is necessary to make a division of initialization of network basic attributes:
-            if self.work_fl == self.amb_work_fl:
-                self.nw = nwk.network(fluids=[self.work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
-            else:
-                self.nw = nwk.network(fluids=[self.work_fl, self.amb_work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
+            self.nw = nwk.network(fluids=[self.work_fl, self.amb_work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
 
-            self.nw.set_printoptions(print_level='none')
-            self.nw.add_conns(self.amb_cond, self.cond_amb, self.cycle_cond, self.cond_cycle)
+        self.nw.set_printoptions(print_level='none')
+        self.nw.add_conns(self.amb_cond, self.cond_amb, self.cycle_cond, self.cond_cycle)
+        return True
 
     # function setting attributes of TESPy's condenser model in refrigeration cycle:
     def set_attr_refr_cyc(self):
 
+        # The attributes of the TESPy model are set in function calculate_refr_cyc(), so the network is built only if
+        # the TESPy model is really used. Here the attributes are only checked.
         # Checking if all required attributes are included:
         if (self.enth_out == 0 or self.temp_in == 0 or self.press_in == 0 or self.mass_fl == 0
                 or self.work_fl == '' or self.amb_work_fl == 0
@@ -108,22 +130,22 @@ class Condenser(Component):
                   "to solve the equation in the TESPy's heat exchanger model. \nNumber of attributes missing: " +
                   str(count_miss) + ", out of " + str(count_need) + " needed.\n")
 
-        else:
+    def set_tespy_attr_refr_cyc(self):
 
-            # setting attributes in the refrigeration cycle condenser:
-            if self.work_fl != self.amb_work_fl:
-                self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
-                self.cycle_cond.set_attr(p=self.press_in, T=self.temp_in, m=self.mass_fl)
-                self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1, self.amb_work_fl: 0})
-                self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
-                self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1, self.work_fl: 0})
-            else:
-                # Working fluids of cycle and ambient are the same:
-                self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
-                self.cycle_cond.set_attr(p=self.press_in, T=self.temp_in, m=self.mass_fl)
-                self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1})
-                self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
-                self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1})
+        # setting attributes in the refrigeration cycle condenser:
+        if self.work_fl != self.amb_work_fl:
+            self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
+            self.cycle_cond.set_attr(p=self.press_in, T=self.temp_in, m=self.mass_fl)
+            self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1, self.amb_work_fl: 0})
+            self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
+            self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1, self.work_fl: 0})
+        else:
+            # Working fluids of cycle and ambient are the same:
+            self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
+            self.cycle_cond.set_attr(p=self.press_in, T=self.temp_in, m=self.mass_fl)
+            self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1})
+            self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
+            self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1})
 
     # function setting attributes of TESPy condenser in power cycle:
     def set_attr_pow_cyc(self):
@@ -154,8 +176,8 @@ class Condenser(Component):
         else:
             # Checking if values of inlet and outlet are not setting the outlet fluid in two-phase zone:
             self.press_in = self.press_out / self.pr
-            temp_sat_in = PropsSI('T', 'P', self.press_in, 'Q', 1, self.work_fl)
-            temp_sat_out = PropsSI('T', 'P', self.press_out, 'Q', 1, self.work_fl)
+            temp_sat_in = property_service.props_si('T', 'P', self.press_in, 'Q', 1, self.work_fl)
+            temp_sat_out = property_service.props_si('T', 'P', self.press_out, 'Q', 1, self.work_fl)
             if self.temp_out > temp_sat_out:
                 print("Condenser.__set_attr_pow_cyc__(): Value of temperature of outlet in the condenser "
                       "is too high - the fluid on the outlet is in two phase zone. "
@@ -166,21 +188,26 @@ class Condenser(Component):
                       "The function hasn't been executed.\n")
             else:
 
+                # The attributes of the TESPy model are set in function calculate_pow_cyc(), so the network is built
+                # only if the TESPy model is really used.
                 self.approved = True
-                # setting attributes in the power cycle condenser:
-                if self.work_fl != self.amb_work_fl:
-                    self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr, design=['pr1', 'pr2'])
-                    self.cycle_cond.set_attr(T=self.temp_in, m=self.mass_fl, fluid={self.work_fl: 1, self.amb_work_fl: 0})
-                    self.cond_cycle.set_attr(T=self.temp_out, p=self.press_out, )
-                    self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
-                    self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1, self.work_fl: 0})
-                else:
-                    # Working fluids of cycle and ambient are the same
-                    self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
-                    self.cycle_cond.set_attr(T=self.temp_in, m=self.mass_fl, fluid={self.work_fl: 1})
-                    self.cond_cycle.set_attr(T=self.temp_out, p=self.press_out)
-                    self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out, fluid={self.work_fl: 1})
-                    self.amb_cond.set_attr(T=self.amb_temp_in)
+
+    def set_tespy_attr_pow_cyc(self):
+
+        # setting attributes in the power cycle condenser:
+        if self.work_fl != self.amb_work_fl:
+            self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr, design=['pr1', 'pr2'])
+            self.cycle_cond.set_attr(T=self.temp_in, m=self.mass_fl, fluid={self.work_fl: 1, self.amb_work_fl: 0})
+            self.cond_cycle.set_attr(T=self.temp_out, p=self.press_out, )
+            self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
+            self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1, self.work_fl: 0})
+        else:
+            # Working fluids of cycle and ambient are the same
+            self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
+            self.cycle_cond.set_attr(T=self.temp_in, m=self.mass_fl, fluid={self.work_fl: 1})
+            self.cond_cycle.set_attr(T=self.temp_out, p=self.press_out)
+            self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out, fluid={self.work_fl: 1})
+            self.amb_cond.set_attr(T=self.amb_temp_in)
 
     def set_attr_combined_cycle(self):
 
@@ -212,29 +239,34 @@ class Condenser(Component):
 
             # Checking if values of outlet are not setting the outlet fluid in two-phase zone:
             self.press_out = self.press_in * self.pr
-            temp_sat = PropsSI('T', 'P', self.press_out, 'Q', 1, self.work_fl)
-            self.temp_out = PropsSI('T', 'P', self.press_out, 'H', self.enth_out, self.work_fl)
+            temp_sat = property_service.props_si('T', 'P', self.press_out, 'Q', 1, self.work_fl)
+            self.temp_out = property_service.props_si('T', 'P', self.press_out, 'H', self.enth_out, self.work_fl)
             if self.temp_out > temp_sat:
                 print("Condenser.__set_attr_combined_cyc__(): Value of temperature of outlet in the condenser "
                       "is too high - the fluid on the outlet is in two phase zone. "
                       "The function hasn't been executed.\n")
             else:
 
+                # The attributes of the TESPy model are set in function calculate_combined_cyc_tespy(), so the network
+                # is built only if the TESPy model is really used.
                 self.approved = True
-                # setting attributes in the refrigeration cycle condenser:
-                if self.work_fl != self.amb_work_fl:
-                    self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
-                    self.cycle_cond.set_attr(p=self.press_in, h=self.enth_in, m=self.mass_fl)
-                    self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1, self.amb_work_fl: 0})
-                    self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
-                    self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1, self.work_fl: 0})
-                else:
-                    # Working fluids of cycle and ambient are the same:
-                    self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
-                    self.cycle_cond.set_attr(p=self.press_in, h=self.enth_in, m=self.mass_fl)
-                    self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1})
-                    self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
-                    self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1})
+
+    def set_tespy_attr_combined_cyc(self):
+
+        # setting attributes in the refrigeration cycle condenser:
+        if self.work_fl != self.amb_work_fl:
+            self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
+            self.cycle_cond.set_attr(p=self.press_in, h=self.enth_in, m=self.mass_fl)
+            self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1, self.amb_work_fl: 0})
+            self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
+            self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1, self.work_fl: 0})
+        else:
+            # Working fluids of cycle and ambient are the same:
+            self.condenser.set_attr(pr1=self.pr, pr2=self.amb_pr)
+            self.cycle_cond.set_attr(p=self.press_in, h=self.enth_in, m=self.mass_fl)
+            self.cond_cycle.set_attr(h=self.enth_out, fluid={self.work_fl: 1})
+            self.cond_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out)
+            self.amb_cond.set_attr(T=self.amb_temp_in, fluid={self.amb_work_fl: 1})
 
     def calculate_refr_cyc(self):
 
@@ -246,7 +278,9 @@ class Condenser(Component):
             print("Condenser.calculate_refr_cyc(): There's not enough set attributes "
                   "to solve the equation in the TESPy's heat exchanger model.\n")
 
-        else:
+        elif self.build_tespy_model():
+
+            self.set_tespy_attr_refr_cyc()
 
             # With set values of attributes it's possible to solve the TESPy's equation and obtain required results.
             # Solving the TESPy's equation:
@@ -257,8 +291,8 @@ class Condenser(Component):
             self.enth_in = self.cycle_cond.h.val
             self.temp_out = self.cond_cycle.T.val
             self.press_out = self.cond_cycle.p.val
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+            self.entr_out = property_service.props_si('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            self.entr_in = property_service.props_si('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
             self.heat_val = abs(self.condenser.Q.val)
             self.amb_press_out = self.cond_amb.p.val
             self.amb_press_in = self.amb_cond.p.val
@@ -277,7 +311,8 @@ class Condenser(Component):
 
         else:
 
-            if self.approved:
+            if self.approved and self.build_tespy_model():
+                self.set_tespy_attr_pow_cyc()
                 # With set values of attributes it's possible to solve the TESPy's equation and obtain required results.
                 # Solving the TESPy's equation:
                 self.nw.solve('design')
@@ -288,8 +323,8 @@ class Condenser(Component):
                 self.heat_val = abs(self.condenser.Q.val)
                 self.enth_in = self.cycle_cond.h.val
                 self.enth_out = self.cond_cycle.h.val
-                self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-                self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+                self.entr_out = property_service.props_si('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+                self.entr_in = property_service.props_si('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
                 self.amb_press_out = self.cond_amb.p.val
                 self.amb_press_in = self.amb_cond.p.val
                 self.amb_mass_fl = abs(self.cond_amb.m.val)
@@ -308,7 +343,8 @@ class Condenser(Component):
             print("Condenser.calculate_combined_cyc(): There's not enough set attributes "
                   "to solve the equation in the TESPy's heat exchanger model\n")
         else:
-            if self.approved:
+            if self.approved and self.build_tespy_model():
+                self.set_tespy_attr_combined_cyc()
                 # With set values of attributes it's possible to solve the TESPy's equation and obtain required results.
                 # Solving the TESPy's equation:
                 self.nw.solve('design')
@@ -318,8 +354,8 @@ class Condenser(Component):
                 self.heat_val = abs(self.condenser.Q.val)
                 self.temp_in = self.cycle_cond.T.val
                 self.press_out = self.cond_cycle.p.val
-                self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-                self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+                self.entr_out = property_service.props_si('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+                self.entr_in = property_service.props_si('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
                 self.amb_press_out = self.cond_amb.p.val
                 self.amb_press_in = self.amb_cond.p.val
                 self.amb_mass_fl = abs(self.cond_amb.m.val)
@@ -332,145 +368,110 @@ class Condenser(Component):
     def calculate_combined_cyc(self):
         # this function doesn't use TESPy:
         self.press_out = self.press_in * self.pr
-        self.temp_in = PropsSI("T", "P", self.press_in, "H", self.enth_in, self.work_fl)
-        self.temp_out = PropsSI("T", "P", self.press_out, "H", self.enth_out, self.work_fl)
-        self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-        self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+        self.temp_in, self.entr_in = property_service.props_si_multi(['T', 'S'], 'P', self.press_in, 'H', self.enth_in,
+                                                                     self.work_fl)
+        self.temp_out, self.entr_out = property_service.props_si_multi(['T', 'S'], 'P', self.press_out, 'H',
+                                                                       self.enth_out, self.work_fl)
         self.heat_val = self.mass_fl * (self.enth_in - self.enth_out)
         self.amb_press_in = self.amb_press_out / self.amb_pr
-        self.amb_enth_in = PropsSI("H", "T", self.amb_temp_in, "P", self.amb_press_in, self.amb_work_fl)
-        self.amb_enth_out = PropsSI("H", "T", self.amb_temp_out, "P", self.amb_press_out, self.amb_work_fl)
+        self.amb_enth_in = property_service.props_si("H", "T", self.amb_temp_in, "P", self.amb_press_in,
+                                                     self.amb_work_fl)
+        self.amb_enth_out = property_service.props_si("H", "T", self.amb_temp_out, "P", self.amb_press_out,
+                                                      self.amb_work_fl)
         self.amb_mass_fl = self.heat_val / (self.amb_enth_out - self.amb_enth_in)
 
+    def profile_attributes(self):
+        # Values of attributes, which the profiles of enthalpies and temperatures depend on:
+        return (self.press_in, self.press_out, self.temp_in, self.enth_in, self.enth_out, self.mass_fl,
+                self.amb_press_in, self.amb_press_out, self.amb_enth_out, self.amb_mass_fl, self.work_fl,
+                self.amb_work_fl)
+
     def generate_enthalpies_data(self, accuracy=100):
 
-        # The matrices below are going to be filled with both values of working fluid enthalpies.
-        enth_liq = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        enth_sat = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        enth_vap = [[0 for x in range(accuracy + 1)] for y in range(2)]
+        # The profiles are calculated only once for every value of accuracy - calculate_cost() needs the enthalpies
+        # both directly and for the temperatures. They're calculated again only if the attributes have changed.
+        attributes = self.profile_attributes()
+        if accuracy not in self.enth_profiles or self.enth_profiles[accuracy][0] != attributes:
+            self.enth_profiles[accuracy] = (attributes, self.calculate_enthalpies_data(accuracy=accuracy))
+        return self.enth_profiles[accuracy][1]
+
+    def generate_temperature_data(self, accuracy=100):
+
+        attributes = self.profile_attributes()
+        if accuracy not in self.temp_profiles or self.temp_profiles[accuracy][0] != attributes:
+            self.temp_profiles[accuracy] = (attributes, self.calculate_temperature_data(accuracy=accuracy))
+        return self.temp_profiles[accuracy][1]
+
+    def calculate_enthalpies_data(self, accuracy=100):
+
+        # Every zone of the condenser (vapor, saturation and liquid) is described by an array with 2 rows and
+        # accuracy + 1 columns - the first row contains enthalpies of working fluid and the second one enthalpies of
+        # ambient.
 
         # Firstly it's necessary to get enthalpy of the point of saturation line on the liquid side
         # and on the vapor side:
-        enth_sat_liq = PropsSI("H", "Q", 0, "P", self.press_out, self.work_fl)
-        enth_sat_vap = PropsSI("H", "Q", 1, "P", self.press_in, self.work_fl)
+        enth_sat_liq = property_service.props_si("H", "Q", 0, "P", self.press_out, self.work_fl)
+        enth_sat_vap = property_service.props_si("H", "Q", 1, "P", self.press_in, self.work_fl)
 
         # Generating enthalpy points of working fluid:
+        steps = np.arange(accuracy + 1)
         delta_enth_vap = (self.enth_in - enth_sat_vap) / accuracy
         delta_enth_sat = (enth_sat_vap - enth_sat_liq) / accuracy
         delta_enth_liq = (enth_sat_liq - self.enth_out) / accuracy
-        for a in range(accuracy + 1):
-            # working fluid:
-            enth_vap[0][a] = self.enth_in - a * delta_enth_vap
-            enth_sat[0][a] = enth_sat_vap - a * delta_enth_sat
-            enth_liq[0][a] = enth_sat_liq - a * delta_enth_liq
-
-            # ambient, from energy balance:
-            if a == 0:
-                enth_vap[1][a] = self.amb_enth_out
-                enth_sat[1][a] = - (self.mass_fl * (self.enth_in - enth_sat_vap) - self.amb_mass_fl * self.amb_enth_out) \
-                                 / self.amb_mass_fl
-                enth_liq[1][a] = - (self.mass_fl * (self.enth_in - enth_sat_liq) - self.amb_mass_fl * self.amb_enth_out) \
-                                 / self.amb_mass_fl
-            else:
-                enth_vap[1][a] = - (self.mass_fl * delta_enth_vap - self.amb_mass_fl * enth_vap[1][a - 1]) \
-                                 / self.amb_mass_fl
-                enth_sat[1][a] = - (self.mass_fl * delta_enth_sat - self.amb_mass_fl * enth_sat[1][a - 1]) \
-                                 / self.amb_mass_fl
-                enth_liq[1][a] = - (self.mass_fl * delta_enth_liq - self.amb_mass_fl * enth_liq[1][a - 1]) \
-                                 / self.amb_mass_fl
+        enth_wfl = [self.enth_in - steps * delta_enth_vap,
+                    enth_sat_vap - steps * delta_enth_sat,
+                    enth_sat_liq - steps * delta_enth_liq]
 
-        return [enth_vap, enth_sat, enth_liq]
+        # ambient, from energy balance between the inlet of working fluid and every point:
+        enth_data = []
+        for enth in enth_wfl:
+            enth_amb = - (self.mass_fl * (self.enth_in - enth) - self.amb_mass_fl * self.amb_enth_out) \
+                       / self.amb_mass_fl
+            enth_data.append(np.array([enth, enth_amb]))
+        return enth_data
 
-    def generate_temperature_data(self, accuracy=100):
+    def calculate_temperature_data(self, accuracy=100):
 
         # The parameter of "accuracy" indicates number of temperature points, which will be generated for particular
         # zones - liquid, saturation and vapor.
 
-        # The matrices below are going to be filled with both values of working fluid and ambient temperatures.
-        temp_liq = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        temp_sat = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        temp_vap = [[0 for x in range(accuracy + 1)] for y in range(2)]
-
-        enth_results = self.generate_enthalpies_data(accuracy=accuracy)
-        enth_vap = enth_results[0]
-        enth_sat = enth_results[1]
-        enth_liq = enth_results[2]
-
-        # basing on the enthalpy points from above, temperatures of working fluid and ambient fluid will be generated:
-        for a in range(accuracy + 1):
-            # working fluid:
-            temp_vap[0][a] = PropsSI("T", "P", self.press_in, "H", enth_vap[0][a], self.work_fl)
-            temp_sat[0][a] = PropsSI("T", "P", self.press_in, "H", enth_sat[0][a], self.work_fl)
-            temp_liq[0][a] = PropsSI("T", "P", self.press_out, "H", enth_liq[0][a], self.work_fl)
-            # ambient:
-            temp_vap[1][a] = PropsSI("T", "P", self.amb_press_out, "H", enth_vap[1][a], self.amb_work_fl)
-            temp_sat[1][a] = PropsSI("T", "P", self.amb_press_in, "H", enth_sat[1][a], self.amb_work_fl)
-            temp_liq[1][a] = PropsSI("T", "P", self.amb_press_in, "H", enth_liq[1][a], self.amb_work_fl)
-
-        return [temp_vap, temp_sat, temp_liq]
+        # Basing on the enthalpy points, temperatures of working fluid and ambient fluid are calculated for whole
+        # zones at once. The arrays have the same layout as the ones of function generate_enthalpies_data().
+        enth_data = self.generate_enthalpies_data(accuracy=accuracy)
+        # Pressures of working fluid and ambient in the vapor, saturation and liquid zone:
+        pressures = [[self.press_in, self.amb_press_out], [self.press_in, self.amb_press_in],
+                     [self.press_out, self.amb_press_in]]
+
+        temp_data = []
+        for enth, press in zip(enth_data, pressures):
+            temp_data.append(np.array([
+                property_service.temperatures_at_pressure(press[0], enth[0], self.work_fl),
+                property_service.temperatures_at_pressure(press[1], enth[1], self.amb_work_fl)]))
+            if np.isnan(temp_data[-1]).any():
+                raise ValueError("Condenser.generate_temperature_data(): Temperatures of fluids can't be calculated "
+                                 "for all points of the condenser.")
+        return temp_data
 
     def calculate_cost(self, accuracy=100, heat_transf_coeff_sat=300, heat_transf_coeff_vap=70,
                        surf_cost=150):
 
         enth_data = self.generate_enthalpies_data(accuracy=accuracy)
         temp_data = self.generate_temperature_data(accuracy=accuracy)
-        aver_temp_wfl_vap = [0 for x in range(accuracy)]
-        aver_temp_amb_vap = [0 for x in range(accuracy)]
-        aver_temp_wfl_sat = [0 for x in range(accuracy)]
-        aver_temp_amb_sat = [0 for x in range(accuracy)]
-        aver_temp_wfl_liq = [0 for x in range(accuracy)]
-        aver_temp_amb_liq = [0 for x in range(accuracy)]
-        surf_vap = [0 for x in range(accuracy)]
-        surf_sat = [0 for x in range(accuracy)]
-        surf_liq = [0 for x in range(accuracy)]
-
-        # Calculating surfaces needed for particular parts of condenser.
-        # Firstly - vapor part:
-        for index in range(len(temp_data[0][0])):
-            if index == 0:
-                continue
-            else:
-                aver_temp_wfl_vap[index - 1] = (temp_data[0][0][index] + temp_data[0][0][index - 1]) / 2
-                aver_temp_amb_vap[index - 1] = (temp_data[0][1][index] + temp_data[0][1][index - 1]) / 2
-                surf_vap[index - 1] = self.mass_fl * (enth_data[0][0][index - 1] - enth_data[0][0][index]) \
-                           / (heat_transf_coeff_vap * (aver_temp_wfl_vap[index - 1] - aver_temp_amb_vap[index - 1]))
-        # Secondly - saturation part:
-        for index in range(len(temp_data[1][0])):
-            if index == 0:
-                continue
-            else:
-                aver_temp_wfl_sat[index - 1] = (temp_data[1][0][index] + temp_data[1][0][index - 1]) / 2
-                aver_temp_amb_sat[index - 1] = (temp_data[1][1][index] + temp_data[1][1][index - 1]) / 2
-                surf_sat[index - 1] = self.mass_fl * (enth_data[1][0][index - 1] - enth_data[1][0][index]) \
-                           / (heat_transf_coeff_sat * (aver_temp_wfl_sat[index - 1] - aver_temp_amb_sat[index - 1]))
-        # Thirdly - liquid part:
-        for index in range(len(temp_data[2][0])):
-            if index == 0:
-                continue
-            else:
-                aver_temp_wfl_liq[index - 1] = (temp_data[2][0][index] + temp_data[2][0][index - 1]) / 2
-                aver_temp_amb_liq[index - 1] = (temp_data[2][1][index] + temp_data[2][1][index - 1]) / 2
-                surf_liq[index - 1] = self.mass_fl * (enth_data[2][0][index - 1] - enth_data[2][0][index]) \
-                           / (heat_transf_coeff_sat * (aver_temp_wfl_liq[index - 1] - aver_temp_amb_liq[index - 1]))
+        # Heat transfer coefficients of vapor, saturation and liquid part:
+        heat_transf_coeffs = [heat_transf_coeff_vap, heat_transf_coeff_sat, heat_transf_coeff_sat]
 
-        # Now the surfaces can be summed up and the overall cost of condenser can be obtained.
-        # Firstly for vapor part:
-        surf_vap_sum = 0
-        for surface in surf_vap:
-            surf_vap_sum += surface
-        # Secondly the saturation part:
-        surf_sat_sum = 0
-        for surface in surf_sat:
-            surf_sat_sum += surface
-        # Thirdly the liquid part:
-        surf_liq_sum = 0
-        for surface in surf_liq:
-            surf_liq_sum += surface
+        # Calculating surfaces needed for particular segments of every zone of the condenser:
+        surf = []
+        for enth, temp, heat_transf_coeff in zip(enth_data, temp_data, heat_transf_coeffs):
+            aver_temp_wfl = (temp[0][1:] + temp[0][:-1]) / 2
+            aver_temp_amb = (temp[1][1:] + temp[1][:-1]) / 2
+            surf.append(self.mass_fl * -np.diff(enth[0]) / (heat_transf_coeff * (aver_temp_wfl - aver_temp_amb)))
 
         # Generating file with results:
-        # self.generate_file_with_data(temp_data=temp_data, surf_vap=surf_vap, surf_sat=surf_sat, surf_liq=surf_liq)
+        # self.generate_file_with_data(temp_data, *surf)
 
-        return (surf_vap_sum + surf_sat_sum + surf_liq_sum) * surf_cost
+        # Now the surfaces can be summed up and the overall cost of condenser can be obtained:
+        return sum(np.sum(surf_zone) for surf_zone in surf) * surf_cost
 
     def generate_file_with_data(self, temp_data, surf_vap, surf_sat, surf_liq):
 
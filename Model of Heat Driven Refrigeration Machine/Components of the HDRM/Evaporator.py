@@ -1,6 +1,6 @@
+import numpy as np
 import xlsxwriter
-from CoolProp.CoolProp import PropsSI
-from tespy import cmp, con, nwk
+from PropertyService import property_service
 from Component import Component
 
 
@@ -14,8 +14,8 @@ class Evaporator(Component):
     Evaporator class needs certain established set of attributes set in the __init__() function. These attributes
     are mentioned in the first conditional statement of the function set_attr_refr_cyc().
     The function set_attr_refr_cyc is responsible only for checking if all required arguments were received by the
-    __init__() function and for setting proper values in attributes of the TESPy model. The calculation is done in
-    function calculate().
+    __init__() function and for calculating the parameters of outlet. The calculation is done in function calculate().
+    The TESPy model itself is built and provided with attributes only in function calculate_tespy().
     """
 
     # Override init function:
@@ -51,7 +51,30 @@ class Evaporator(Component):
         self.amb_exer_in = amb_exer_in
         self.amb_exer_out = amb_exer_out
 
-        # Applying the condenser model using TESPy. Firstly the components and connections must be set, afterwards
+        # The TESPy model of the evaporator is built only when one of the TESPy functions is really used. The functions
+        # calculate() and calculate_hot_side() don't need it, so in such case creating the network would be a waste
+        # of time, especially in the genetic algorithm, which creates a new evaporator for every member.
+        self.nw = None
+
+        # Profiles of enthalpies and temperatures calculated for particular values of accuracy, together with the
+        # values of attributes they were calculated for (see generate_enthalpies_data()):
+        self.enth_profiles = {}
+        self.temp_profiles = {}
+
+    def build_tespy_model(self):
+
+        # The network is built only once for the instance of class:
+        if self.nw is not None:
+            return True
+
+        if self.work_fl == '' or self.amb_work_fl == '':
+            print("Working fluid or the ambient working fluid hasn't been set, so creating the TESPy network model"
+                  "can't be completed.\n")
+            return False
+
+        from tespy import cmp, con, nwk
+
+        # Applying the evaporator model using TESPy. Firstly the components and connections must be set, afterwards
         # the function will set the attributes and TESPy engine will calculate the demanded result.
         # Setting components:
         self.amb_inlet = cmp.sink('inlet of ambient')
@@ -66,20 +89,17 @@ class Evaporator(Component):
         self.cycle_evap = con.connection(self.cycle_outlet, 'out1', self.evaporator, 'in2')
         self.evap_cycle = con.connection(self.evaporator, 'out2', self.cycle_inlet, 'in1')
 
-        if self.work_fl == '' or self.amb_work_fl == '':
-            print("Working fluid or the ambient working fluid hasn't been set, so creating the TESPy network model"
-                  "can't be completed.\n")
+        # Putting the connections into the network (TESPy):
+        # Because TESPy isn't smart enough and it throws error when the working fluid in the cycle
+        # is the same as the one in ambient,
+        # it is necessary to make a division of initialization of network basic attributes:
+        if self.work_fl == self.amb_work_fl:
+            self.nw = nwk.network(fluids=[self.work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
         else:
-            # Putting the connections into the network (TESPy):
-            # Because TESPy isn't smart enough and it throws error when the working fluid in the cycle
-            # is the same as the one in ambient,
-            # it is necessary to make a division of initialization of network basic attributes:
-            if self.work_fl == self.amb_work_fl:
-                self.nw = nwk.network(fluids=[self.work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
-            else:
-                self.nw = nwk.network(fluids=[self.work_fl, self.amb_work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
-            self.nw.set_printoptions(print_level='none')
-            self.nw.add_conns(self.amb_evap, self.evap_amb, self.cycle_evap, self.evap_cycle)
+            self.nw = nwk.network(fluids=[self.work_fl, self.amb_work_fl], T_unit='K', p_unit='Pa', h_unit='J / kg')
+        self.nw.set_printoptions(print_level='none')
+        self.nw.add_conns(self.amb_evap, self.evap_amb, self.cycle_evap, self.evap_cycle)
+        return True
 
     # function setting attributes of TESPy condenser in refrigeration cycle:
     def set_attr_refr_cyc(self):
@@ -138,20 +158,20 @@ class Evaporator(Component):
                 The approximated temperature we're looking for is T = T(F) + T_overh.
                 """
 
-                self.press_in = PropsSI('P', 'T', self.temp_in, 'Q', 1, self.work_fl)
+                self.press_in = property_service.props_si('P', 'T', self.temp_in, 'Q', 1, self.work_fl)
                 p_A = self.press_in
                 h_A = self.enth_in
 
                 self.press_out = self.press_in * self.pr
                 p_B = self.press_out
-                t_B = PropsSI('T', 'P', p_B, 'Q', 1, self.work_fl) + self.overh
-                h_B = PropsSI('H', 'T', t_B, 'P', p_B, self.work_fl)
+                t_B = property_service.props_si('T', 'P', p_B, 'Q', 1, self.work_fl) + self.overh
+                h_B = property_service.props_si('H', 'T', t_B, 'P', p_B, self.work_fl)
 
                 p_C = self.press_in
-                h_C = PropsSI('H', 'P', p_C, 'Q', 1, self.work_fl)
+                h_C = property_service.props_si('H', 'P', p_C, 'Q', 1, self.work_fl)
 
                 p_D = self.press_out
-                h_D = PropsSI('H', 'P', p_D, 'Q', 1, self.work_fl)
+                h_D = property_service.props_si('H', 'P', p_D, 'Q', 1, self.work_fl)
 
                 # Equations for the constants of straights AB and CD (y = ax + b):
                 a_AB = (p_A - p_B)/(h_A - h_B)
@@ -166,12 +186,12 @@ class Evaporator(Component):
 
                 # The cross point is a point, in which the end of the two-phase zone in evaporator is assumed to be.
                 # From this point the gas should be overheated for a certain established value:
-                temp_end_two_ph = PropsSI('T', 'P', p_cp, 'Q', 1, self.work_fl)
+                temp_end_two_ph = property_service.props_si('T', 'P', p_cp, 'Q', 1, self.work_fl)
                 self.temp_out = temp_end_two_ph + self.overh
 
                 # Now it's possible to obtain the approximated value of enthalpy of the fluid at the output of
                 # evaporator.
-                self.enth_out = PropsSI('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
+                self.enth_out = property_service.props_si('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
 
                 """print("Evaporator.__set_attr_refr_cyc__(): attributes:\n"
                       "pressures: " + (str)(p_A) + ", " + (str)(p_B) + ", " + (str)(p_C) + ", " + (str)(p_D) + " \n"
@@ -181,30 +201,35 @@ class Evaporator(Component):
 
             # If, on the other hand, client decided to fix the pressure as constant in evaporator:
             else:
-                self.press_in = PropsSI('P', 'T', self.temp_in, 'Q', 1, self.work_fl)
+                self.press_in = property_service.props_si('P', 'T', self.temp_in, 'Q', 1, self.work_fl)
                 self.press_out = self.press_in
-                self.temp_in = PropsSI('T', 'P', self.press_in, 'Q', 1, self.work_fl)
+                self.temp_in = property_service.props_si('T', 'P', self.press_in, 'Q', 1, self.work_fl)
                 self.temp_out = self.temp_in + self.overh
-                self.enth_out = PropsSI('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
+                self.enth_out = property_service.props_si('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
 
-            # setting attributes in the evaporator:
-            if self.work_fl != self.amb_work_fl:
+            # The attributes of the TESPy model are set in function calculate_tespy(), so the network is built only
+            # if the TESPy model is really used.
 
-                self.evaporator.set_attr(pr1=self.pr, pr2=self.amb_pr, Q=self.q_cap, design=['pr1', 'pr2'])
-                self.cycle_evap.set_attr(h=self.enth_in, p=self.press_in, fluid={self.work_fl: 1, self.amb_work_fl: 0})
-                self.evap_cycle.set_attr(h=self.enth_out)
-                self.evap_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out,
-                                       fluid={self.amb_work_fl: 1, self.work_fl: 0})
-                self.amb_evap.set_attr(T=self.amb_temp_in)
+    def set_tespy_attr_refr_cyc(self):
 
-            else:
-                # If working fluids of the cycle and ambient are the same:
-                self.evaporator.set_attr(pr1=self.pr, pr2=self.amb_pr, Q=self.q_cap, design=['pr1', 'pr2'])
-                self.cycle_evap.set_attr(h=self.enth_in, p=self.press_in, fluid={self.work_fl: 1})
-                self.evap_cycle.set_attr(h=self.enth_out)
-                self.evap_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out,
-                                       fluid={self.amb_work_fl: 1})
-                self.amb_evap.set_attr(T=self.amb_temp_in)
+        # setting attributes in the evaporator:
+        if self.work_fl != self.amb_work_fl:
+
+            self.evaporator.set_attr(pr1=self.pr, pr2=self.amb_pr, Q=self.q_cap, design=['pr1', 'pr2'])
+            self.cycle_evap.set_attr(h=self.enth_in, p=self.press_in, fluid={self.work_fl: 1, self.amb_work_fl: 0})
+            self.evap_cycle.set_attr(h=self.enth_out)
+            self.evap_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out,
+                                   fluid={self.amb_work_fl: 1, self.work_fl: 0})
+            self.amb_evap.set_attr(T=self.amb_temp_in)
+
+        else:
+            # If working fluids of the cycle and ambient are the same:
+            self.evaporator.set_attr(pr1=self.pr, pr2=self.amb_pr, Q=self.q_cap, design=['pr1', 'pr2'])
+            self.cycle_evap.set_attr(h=self.enth_in, p=self.press_in, fluid={self.work_fl: 1})
+            self.evap_cycle.set_attr(h=self.enth_out)
+            self.evap_amb.set_attr(T=self.amb_temp_out, p=self.amb_press_out,
+                                   fluid={self.amb_work_fl: 1})
+            self.amb_evap.set_attr(T=self.amb_temp_in)
 
     def calculate_tespy(self):
 
@@ -218,7 +243,9 @@ class Evaporator(Component):
 
             print("Evaporator.calculate(): There's not enough attributes set for the TESPy equation to be solved.\n")
 
-        else:
+        elif self.build_tespy_model():
+
+            self.set_tespy_attr_refr_cyc()
 
             # With set values of attributes it's possible to solve the TESPy's equation and obtain required results.
             # Solving the equation:
@@ -231,8 +258,8 @@ class Evaporator(Component):
             self.temp_out = self.evap_cycle.T.val
             self.mass_fl = abs(self.evap_cycle.m.val)
             self.enth_out = self.evap_cycle.h.val
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+            self.entr_out = property_service.props_si('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            self.entr_in = property_service.props_si('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
             self.amb_press_out = self.evap_amb.p.val
             self.amb_press_in = self.amb_evap.p.val
             self.amb_mass_fl = self.evap_amb.m.val
@@ -249,15 +276,17 @@ class Evaporator(Component):
             print("Evaporator.calculate(): There's not enough attributes set to solve the model of evaporator.\n")
 
         else:
-            self.temp_in = PropsSI("T", "P", self.press_in, "H", self.enth_in, self.work_fl)
+            self.temp_in = property_service.props_si("T", "P", self.press_in, "H", self.enth_in, self.work_fl)
             self.press_out = self.press_in * self.pr
-            self.enth_out = PropsSI("H", "T", self.temp_out, "P", self.press_out, self.work_fl)
+            self.enth_out = property_service.props_si("H", "T", self.temp_out, "P", self.press_out, self.work_fl)
             self.mass_fl = self.q_cap / (self.enth_out - self.enth_in)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+            self.entr_out = property_service.props_si('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            self.entr_in = property_service.props_si('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
             self.amb_press_in = self.amb_press_out / self.amb_pr
-            self.amb_enth_in = PropsSI("H", "T", self.amb_temp_in, "P", self.amb_press_in, self.amb_work_fl)
-            self.amb_enth_out = PropsSI("H", "T", self.amb_temp_out, "P", self.amb_press_out, self.amb_work_fl)
+            self.amb_enth_in = property_service.props_si("H", "T", self.amb_temp_in, "P", self.amb_press_in,
+                                                         self.amb_work_fl)
+            self.amb_enth_out = property_service.props_si("H", "T", self.amb_temp_out, "P", self.amb_press_out,
+                                                          self.amb_work_fl)
             self.amb_mass_fl = self.q_cap / (self.amb_enth_in - self.amb_enth_out)
             self.check_evaporator()
 
@@ -299,11 +328,11 @@ class Evaporator(Component):
             # Firstly the working fluid:
             self.press_in = self.press_out / self.pr
 
-            self.enth_in = PropsSI('H', 'P', self.press_in, 'T', self.temp_in, self.work_fl)
-            self.enth_out = PropsSI('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
+            self.enth_in = property_service.props_si('H', 'P', self.press_in, 'T', self.temp_in, self.work_fl)
+            self.enth_out = property_service.props_si('H', 'P', self.press_out, 'T', self.temp_out, self.work_fl)
 
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            self.entr_in = property_service.props_si('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+            self.entr_out = property_service.props_si('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
 
             # Secondly the secondary working fluid (ambient working fluid):
             self.amb_press_in = self.amb_press_out / self.amb_pr
@@ -340,8 +369,10 @@ class Evaporator(Component):
                     self.amb_entr_in = 0
                     self.amb_entr_out = 0
                     self.amb_mass_fl = 0
-                    self.amb_enth_in = PropsSI('H', 'S', self.amb_entr_in, 'P', self.amb_press_in, self.amb_work_fl)
-                    self.amb_enth_out = PropsSI('H', 'S', self.amb_entr_out, 'P', self.amb_press_out, self.amb_work_fl)
+                    self.amb_enth_in = property_service.props_si('H', 'S', self.amb_entr_in, 'P', self.amb_press_in,
+                                                                 self.amb_work_fl)
+                    self.amb_enth_out = property_service.props_si('H', 'S', self.amb_entr_out, 'P',
+                                                                  self.amb_press_out, self.amb_work_fl)
 
                 # TODO: Specify the type of error below:
                 except ValueError:
@@ -354,16 +385,19 @@ class Evaporator(Component):
             else:
 
                 # Ambient parameters, unlike in evaporator on the cold side, are calculated regarding the pinch point:
-                sat_temp_liquid = PropsSI("T", "P", self.press_in, "Q", 0, self.work_fl)
+                sat_temp_liquid = property_service.props_si("T", "P", self.press_in, "Q", 0, self.work_fl)
                 amb_temp_pinch_point = sat_temp_liquid + self.pinch_point
                 # From energy balance equation:
-                amb_enth_pp = PropsSI("H", "T", amb_temp_pinch_point, "P", self.amb_press_out, self.amb_work_fl)
-                self.amb_enth_in = PropsSI("H", "P", self.amb_press_in, "T", self.amb_temp_in, self.amb_work_fl)
-                enth_pp = PropsSI("H", "P", self.press_in, "Q", 0, self.work_fl)
+                amb_enth_pp = property_service.props_si("H", "T", amb_temp_pinch_point, "P", self.amb_press_out,
+                                                        self.amb_work_fl)
+                self.amb_enth_in = property_service.props_si("H", "P", self.amb_press_in, "T", self.amb_temp_in,
+                                                             self.amb_work_fl)
+                enth_pp = property_service.props_si("H", "P", self.press_in, "Q", 0, self.work_fl)
                 self.amb_mass_fl = self.mass_fl * (self.enth_out - enth_pp) / (self.amb_enth_in - amb_enth_pp)
                 self.amb_enth_out = - self.mass_fl / self.amb_mass_fl * (self.enth_out - self.enth_in) + self.amb_enth_in
                 try:
-                    self.amb_temp_out = PropsSI("T", "P", self.amb_press_out, "H", self.amb_enth_out, self.amb_work_fl)
+                    self.amb_temp_out = property_service.props_si("T", "P", self.amb_press_out, "H",
+                                                                  self.amb_enth_out, self.amb_work_fl)
                     self.heat_cap = self.mass_fl * (self.enth_out - self.enth_in)
                     self.check_evaporator()
                 except ValueError:
@@ -371,182 +405,111 @@ class Evaporator(Component):
                     self.is_model_correct = False
 
     def calculate_exergies(self, t0, p0, wf0):
-        enth_t0 = PropsSI('H', 'P', p0, 'T', t0, wf0)
-        entr_t0 = PropsSI('S', 'P', p0, 'T', t0, wf0)
+        enth_t0, entr_t0 = property_service.props_si_multi(['H', 'S'], 'P', p0, 'T', t0, wf0)
         self.exer_in = self.mass_fl * ((self.enth_in - enth_t0) - t0 * (self.entr_in - entr_t0))
         self.exer_out = self.mass_fl * ((self.enth_out - enth_t0) - t0 * (self.entr_out - entr_t0))
         self.amb_exer_in = self.amb_mass_fl * ((self.amb_enth_in - enth_t0) - t0 * (self.amb_entr_in - entr_t0))
         self.amb_exer_out = self.amb_mass_fl * ((self.amb_enth_out - enth_t0) - t0 * (self.amb_entr_out - entr_t0))
 
+    def profile_attributes(self):
+        # Values of attributes, which the profiles of enthalpies and temperatures depend on:
+        return (self.press_in, self.press_out, self.temp_in, self.enth_in, self.enth_out, self.mass_fl,
+                self.amb_press_in, self.amb_press_out, self.amb_enth_out, self.amb_mass_fl, self.work_fl,
+                self.amb_work_fl)
+
     def generate_enthalpies_data(self, accuracy=10):
 
-        # The matrices below are going to be filled with both values of working fluid enthalpies.
-        enth_sat = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        enth_vap = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        # It may happen that the evaporator is used to heat the working fluid in power cycle:
-        used_in_power_cyc = False
-        saturation_temp = PropsSI("T", "P", self.press_in, "Q", 0, self.work_fl)
-        if self.temp_in < saturation_temp:
-            enth_liq = [[0 for x in range(accuracy + 1)] for y in range(2)]
-            used_in_power_cyc = True
+        # The profiles are calculated only once for every value of accuracy - the check of evaporator and its cost
+        # use the same profiles. They're calculated again only if the attributes have changed in the meantime.
+        attributes = self.profile_attributes()
+        if accuracy not in self.enth_profiles or self.enth_profiles[accuracy][0] != attributes:
+            self.enth_profiles[accuracy] = (attributes, self.calculate_enthalpies_data(accuracy=accuracy))
+        return self.enth_profiles[accuracy][1]
+
+    def generate_temperature_data(self, accuracy=10):
+
+        attributes = self.profile_attributes()
+        if accuracy not in self.temp_profiles or self.temp_profiles[accuracy][0] != attributes:
+            self.temp_profiles[accuracy] = (attributes, self.calculate_temperature_data(accuracy=accuracy))
+        return self.temp_profiles[accuracy][1]
+
+    def calculate_enthalpies_data(self, accuracy=10):
+
+        # Every zone of the evaporator (saturation and vapor) is described by an array with 2 rows and accuracy + 1
+        # columns - the first row contains enthalpies of working fluid and the second one enthalpies of ambient.
+        # It may happen that the evaporator is used to heat the working fluid in power cycle, then there's an
+        # additional liquid zone at the beginning:
+        saturation_temp = property_service.props_si("T", "P", self.press_in, "Q", 0, self.work_fl)
+        used_in_power_cyc = self.temp_in < saturation_temp
 
         # Firstly it's necessary to get enthalpy of the point of saturation line:
-        enth_sat_vap = PropsSI("H", "Q", 1, "P", self.press_in, self.work_fl)
-        # and, in case it concerns power cycle:
-        if used_in_power_cyc:
-            enth_sat_liq = PropsSI("H", "Q", 0, "P", self.press_in, self.work_fl)
+        enth_sat_vap = property_service.props_si("H", "Q", 1, "P", self.press_in, self.work_fl)
 
         # Generating enthalpy points of working fluid:
-        delta_enth_sat = (enth_sat_vap - self.enth_in) / accuracy
-        delta_enth_vap = (self.enth_out - enth_sat_vap) / accuracy
+        steps = np.arange(accuracy + 1)
         if used_in_power_cyc:
-            delta_enth_sat = (enth_sat_vap - enth_sat_liq) / accuracy
+            enth_sat_liq = property_service.props_si("H", "Q", 0, "P", self.press_in, self.work_fl)
             delta_enth_liq = (enth_sat_liq - self.enth_in) / accuracy
-        for a in range(accuracy + 1):
-            # working fluid:
-            enth_sat[0][a] = self.enth_in + a * delta_enth_sat
-            enth_vap[0][a] = enth_sat_vap + a * delta_enth_vap
-            if used_in_power_cyc:
-                enth_sat[0][a] = enth_sat_liq + a * delta_enth_sat
-                enth_liq[0][a] = self.enth_in + a * delta_enth_liq
-
-            # ambient, from energy balance:
-            if a == 0:
-                enth_sat[1][a] = self.amb_enth_out
-                enth_vap[1][a] = (self.mass_fl * (enth_sat_vap - self.enth_in)
-                                  + self.amb_mass_fl * self.amb_enth_out) / self.amb_mass_fl
-                if used_in_power_cyc:
-                    enth_liq[1][a] = self.amb_enth_out
-                    enth_sat[1][a] = (self.mass_fl * (enth_sat_liq - self.enth_in)
-                                      + self.amb_mass_fl * self.amb_enth_out) / self.amb_mass_fl
-            else:
-                enth_sat[1][a] = (self.mass_fl * delta_enth_sat
-                                  + self.amb_mass_fl * enth_sat[1][a - 1]) / self.amb_mass_fl
-                enth_vap[1][a] = (self.mass_fl * delta_enth_vap
-                                  + self.amb_mass_fl * enth_vap[1][a - 1]) / self.amb_mass_fl
-                if used_in_power_cyc:
-                    enth_liq[1][a] = (self.mass_fl * delta_enth_liq
-                                      + self.amb_mass_fl * enth_liq[1][a - 1]) / self.amb_mass_fl
-
-        if used_in_power_cyc:
-            return [enth_liq, enth_sat, enth_vap]
+            delta_enth_sat = (enth_sat_vap - enth_sat_liq) / accuracy
+            enth_wfl = [self.enth_in + steps * delta_enth_liq, enth_sat_liq + steps * delta_enth_sat]
         else:
-            return [enth_sat, enth_vap]
+            delta_enth_sat = (enth_sat_vap - self.enth_in) / accuracy
+            enth_wfl = [self.enth_in + steps * delta_enth_sat]
+        delta_enth_vap = (self.enth_out - enth_sat_vap) / accuracy
+        enth_wfl.append(enth_sat_vap + steps * delta_enth_vap)
 
-    def generate_temperature_data(self, accuracy=10):
+        # ambient, from energy balance between the inlet of working fluid and every point:
+        enth_data = []
+        for enth in enth_wfl:
+            enth_amb = (self.mass_fl * (enth - self.enth_in) + self.amb_mass_fl * self.amb_enth_out) / self.amb_mass_fl
+            enth_data.append(np.array([enth, enth_amb]))
+        return enth_data
+
+    def calculate_temperature_data(self, accuracy=10):
 
         # The parameter of "accuracy" indicates number of temperature points, which will be generated for particular
         # zones - liquid and saturation
 
-        # The matrices below are going to be filled with both values of working fluid and ambient temperatures.
-        temp_vap = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        temp_sat = [[0 for x in range(accuracy + 1)] for y in range(2)]
-        temp_liq = []
-        # It may happen that the evaporator is used to heat the working fluid in power cycle:
-        used_in_power_cyc = False
-        saturation_temp = PropsSI("T", "P", self.press_in, "Q", 0, self.work_fl)
-        if self.temp_in < saturation_temp:
-            temp_liq = [[0 for x in range(accuracy + 1)] for y in range(2)]
-            used_in_power_cyc = True
-
-        enth_results = self.generate_enthalpies_data(accuracy=accuracy)
-        enth_sat = enth_results[0]
-        enth_vap = enth_results[1]
-        # For power cycle the function "generate_enthalpies_data()" will automatically generate an additional
-        # list with data of enthalpies in the liquid zone.
-        if used_in_power_cyc:
-            enth_liq = enth_results[0]
-            enth_sat = enth_results[1]
-            enth_vap = enth_results[2]
-
-        # basing on the enthalpy points from above, temperatures of working fluid and ambient fluid will be generated:
-        for a in range(accuracy + 1):
-            # working fluid:
-            temp_sat[0][a] = PropsSI("T", "P", self.press_in, "H", enth_sat[0][a], self.work_fl)
-            temp_vap[0][a] = PropsSI("T", "P", self.press_out, "H", enth_vap[0][a], self.work_fl)
-            if used_in_power_cyc:
-                temp_liq[0][a] = PropsSI("T", "P", self.press_in, "H", enth_liq[0][a], self.work_fl)
-            # ambient:
-            temp_sat[1][a] = PropsSI("T", "P", self.amb_press_out, "H", enth_sat[1][a], self.amb_work_fl)
-            temp_vap[1][a] = PropsSI("T", "P", self.amb_press_in, "H", enth_vap[1][a], self.amb_work_fl)
-            if used_in_power_cyc:
-                temp_liq[1][a] = PropsSI("T", "P", self.amb_press_in, "H", enth_liq[1][a], self.amb_work_fl)
-        if used_in_power_cyc:
-            return [temp_liq, temp_sat, temp_vap]
-        else:
-            return [temp_sat, temp_vap]
+        # Basing on the enthalpy points, temperatures of working fluid and ambient fluid are calculated for whole
+        # zones at once. The arrays have the same layout as the ones of function generate_enthalpies_data().
+        enth_data = self.generate_enthalpies_data(accuracy=accuracy)
+        # Pressures of working fluid and ambient in the saturation and vapor zone:
+        pressures = [[self.press_in, self.amb_press_out], [self.press_out, self.amb_press_in]]
+        # For power cycle the function "generate_enthalpies_data()" generates an additional array with data of
+        # enthalpies in the liquid zone.
+        if len(enth_data) == 3:
+            pressures.insert(0, [self.press_in, self.amb_press_in])
+
+        temp_data = []
+        for enth, press in zip(enth_data, pressures):
+            temp_data.append(np.array([
+                property_service.temperatures_at_pressure(press[0], enth[0], self.work_fl),
+                property_service.temperatures_at_pressure(press[1], enth[1], self.amb_work_fl)]))
+            if np.isnan(temp_data[-1]).any():
+                raise ValueError("Evaporator.generate_temperature_data(): Temperatures of fluids can't be calculated "
+                                 "for all points of the evaporator.")
+        return temp_data
 
     def calculate_cost(self, accuracy=10, heat_transf_coeff_sat=300, heat_transf_coeff_vap=70, surf_cost=20):
 
         enth_data = self.generate_enthalpies_data(accuracy=accuracy)
         temp_data = self.generate_temperature_data(accuracy=accuracy)
-        aver_temp_wfl_sat = [0 for x in range(accuracy)]
-        aver_temp_amb_sat = [0 for x in range(accuracy)]
-        aver_temp_wfl_vap = [0 for x in range(accuracy)]
-        aver_temp_amb_vap = [0 for x in range(accuracy)]
-        surf_sat = [0 for x in range(accuracy)]
-        surf_vap = [0 for x in range(accuracy)]
-        # It may happen that the evaporator is used to heat the working fluid in power cycle:
-        if len(enth_data) == 3:
-            aver_temp_wfl_liq = [0 for x in range(accuracy)]
-            aver_temp_amb_liq = [0 for x in range(accuracy)]
-            surf_liq = [0 for x in range(accuracy)]
-
-        # Calculating surfaces needed for particular parts of condenser.
-        # Firstly - saturation part:
-        for index in range(len(temp_data[0][0])):
-            if index == 0:
-                continue
-            else:
-                aver_temp_wfl_sat[index - 1] = (temp_data[0][0][index] + temp_data[0][0][index - 1]) / 2
-                aver_temp_amb_sat[index - 1] = (temp_data[0][1][index] + temp_data[0][1][index - 1]) / 2
-                surf_sat[index - 1] = self.mass_fl * (enth_data[0][0][index] - enth_data[0][0][index - 1]) \
-                                      / (heat_transf_coeff_sat * (
-                                      aver_temp_amb_sat[index - 1] - aver_temp_wfl_sat[index - 1]))
-        # Secondly - vapor part:
-        for index in range(len(temp_data[1][0])):
-            if index == 0:
-                continue
-            else:
-                aver_temp_wfl_vap[index - 1] = (temp_data[1][0][index] + temp_data[1][0][index - 1]) / 2
-                aver_temp_amb_vap[index - 1] = (temp_data[1][1][index] + temp_data[1][1][index - 1]) / 2
-                surf_vap[index - 1] = self.mass_fl * (enth_data[1][0][index] - enth_data[1][0][index - 1]) \
-                                      / (heat_transf_coeff_vap * (
-                                      aver_temp_amb_vap[index - 1] - aver_temp_wfl_vap[index - 1]))
-        # Thirdly - liquid part, only for power cycle case:
-        if len(enth_data) == 3:
-            for index in range(len(temp_data[2][0])):
-                if index == 0:
-                    continue
-                else:
-                    aver_temp_wfl_liq[index - 1] = (temp_data[2][0][index] + temp_data[2][0][index - 1]) / 2
-                    aver_temp_amb_liq[index - 1] = (temp_data[2][1][index] + temp_data[2][1][index - 1]) / 2
-                    surf_liq[index - 1] = self.mass_fl * (enth_data[2][0][index] - enth_data[2][0][index - 1]) /\
-                                          (heat_transf_coeff_sat * (
-                                          aver_temp_amb_liq[index - 1] - aver_temp_wfl_liq[index - 1]))
-
-        # Now the surfaces can be summed up and the overall cost of condenser can be obtained.
-        # Firstly the saturation part:
-        surf_sat_sum = 0
-        for surface in surf_sat:
-            surf_sat_sum += surface
-        # Secondly the vapor part:
-        surf_vap_sum = 0
-        for surface in surf_vap:
-            surf_vap_sum += surface
-        # Optionally the liquid part:
-        if len(enth_data) == 3:
-            surf_liq_sum = 0
-            for surface in surf_liq:
-                surf_liq_sum += surface
+        # Heat transfer coefficients of the following zones - the first zone is saturation part and the second one
+        # vapor part. For power cycle the third zone is calculated with the coefficient of saturation part:
+        heat_transf_coeffs = [heat_transf_coeff_sat, heat_transf_coeff_vap, heat_transf_coeff_sat]
+
+        # Calculating surfaces needed for particular segments of every zone of the evaporator:
+        surf = []
+        for enth, temp, heat_transf_coeff in zip(enth_data, temp_data, heat_transf_coeffs):
+            aver_temp_wfl = (temp[0][1:] + temp[0][:-1]) / 2
+            aver_temp_amb = (temp[1][1:] + temp[1][:-1]) / 2
+            surf.append(self.mass_fl * np.diff(enth[0]) / (heat_transf_coeff * (aver_temp_amb - aver_temp_wfl)))
 
         # Generating file with results:
-        if len(enth_data) == 3:
-            # self.generate_file_with_data(temp_data=temp_data, surf_sat=surf_sat, surf_vap=surf_vap, surf_liq=surf_liq)
-            return (surf_sat_sum + surf_vap_sum + surf_liq_sum) * surf_cost
-        else:
-            # self.generate_file_with_data(temp_data=temp_data, surf_sat=surf_sat, surf_vap=surf_vap)
-            return (surf_sat_sum + surf_vap_sum) * surf_cost
+        # self.generate_file_with_data(temp_data, *surf)
+
+        # Now the surfaces can be summed up and the overall cost of evaporator can be obtained:
+        return sum(np.sum(surf_zone) for surf_zone in surf) * surf_cost
 
     def generate_file_with_data(self, temp_data, surf_sat, surf_vap, surf_liq=[]):
 
@@ -622,9 +585,8 @@ class Evaporator(Component):
         temp_data = self.generate_temperature_data()
         for fluid_zone in temp_data:
             # Checking respectively liquid, saturation and vapor zone:
-            for index in range(len(fluid_zone[0])):
-                if fluid_zone[0][index] >= fluid_zone[1][index]:
-                    self.is_model_correct = False
+            if np.any(fluid_zone[0] >= fluid_zone[1]):
+                self.is_model_correct = False
         # If in any point of the evaporator the difference of temperatures is incorrect, the notification will
         # be printed out.
         if not self.is_model_correct:
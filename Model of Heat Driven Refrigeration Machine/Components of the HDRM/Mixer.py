@@ -1,4 +1,4 @@
-from CoolProp.CoolProp import PropsSI
+from PropertyService import property_service
 
 
 class Mixer:
@@ -29,12 +29,12 @@ class Mixer:
         else:
             self.mass_fl_out = self.mass_fl_in_1 + self.mass_fl_in_2
             self.enth_out = (self.enth_in_1 * self.mass_fl_in_1 + self.enth_in_2 * self.mass_fl_in_2) / self.mass_fl_out
-            self.temp_in_1 = PropsSI('T', 'H', self.enth_in_1, 'P', self.press_in, self.work_fl)
-            self.temp_in_2 = PropsSI('T', 'H', self.enth_in_2, 'P', self.press_in, self.work_fl)
-            self.entr_in_1 = PropsSI('S', 'H', self.enth_in_1, 'P', self.press_in, self.work_fl)
-            self.entr_in_2 = PropsSI('S', 'H', self.enth_in_2, 'P', self.press_in, self.work_fl)
-            self.temp_out = PropsSI('T', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            self.temp_in_1, self.entr_in_1 = property_service.props_si_multi(['T', 'S'], 'H', self.enth_in_1, 'P',
+                                                                             self.press_in, self.work_fl)
+            self.temp_in_2, self.entr_in_2 = property_service.props_si_multi(['T', 'S'], 'H', self.enth_in_2, 'P',
+                                                                             self.press_in, self.work_fl)
+            self.temp_out, self.entr_out = property_service.props_si_multi(['T', 'S'], 'H', self.enth_out, 'P',
+                                                                           self.press_out, self.work_fl)
 
     def calculate_cost(self):
         return 50
\ No newline at end of file
@@ -0,0 +1,77 @@
+import sys
+
+import xlsxwriter
+
+
+class PropertyProfiler:
+
+    """
+    Collects statistics of properties asked for from the property service, grouped by the function which asked for
+    them - for the methods of components the name of the class and of the method is used (e.g.
+    'Evaporator.calculate_temperature_data', 'Condenser.set_attr_combined_cycle'), for other functions only their name
+    (e.g. 'calculate_cycle_batch'). The property is ascribed to the innermost of these functions, so the statistics of
+    all functions sum up to the statistics of the whole run.
+
+    For every function there's the number of lookups, the number of them calculated by CoolProp (misses of the cache),
+    the hit rate and the cumulative wall time of the lookups, including the calculations of CoolProp.
+
+    Profiling is switched on with property_service.start_profiling() and off with property_service.stop_profiling(),
+    e.g. before and after the run of genetic algorithm. When it's switched off, the property service doesn't check
+    the callers at all. Only the properties calculated in the current process are collected, so the members should be
+    evaluated with SerialEvaluator (or BatchEvaluator) during profiling.
+    """
+
+    # Modules, whose functions are never the callers:
+    internal_modules = ('PropertyService', 'PropertyProfiler')
+
+    def __init__(self):
+        # For every caller: [lookups, CoolProp calls, wall time]
+        self.stats = {}
+
+    def caller(self):
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_globals.get('__name__') in self.internal_modules:
+            frame = frame.f_back
+        if frame is None:
+            return '<unknown>'
+        instance = frame.f_locals.get('self')
+        if instance is not None:
+            return instance.__class__.__name__ + '.' + frame.f_code.co_name
+        return frame.f_code.co_name
+
+    def record(self, lookups, coolprop_calls, wall_time):
+        stats = self.stats.setdefault(self.caller(), [0, 0, 0.0])
+        stats[0] += lookups
+        stats[1] += coolprop_calls
+        stats[2] += wall_time
+
+    def clear(self):
+        self.stats = {}
+
+    def report(self):
+        # Rows [caller, lookups, CoolProp calls, hit rate, wall time] sorted from the longest wall time:
+        rows = []
+        for name, (lookups, coolprop_calls, wall_time) in self.stats.items():
+            hit_rate = 0 if lookups == 0 else (lookups - coolprop_calls) / lookups
+            rows.append([name, lookups, coolprop_calls, hit_rate, wall_time])
+        rows.sort(key=lambda row: -row[4])
+        return rows
+
+    def print_report(self):
+        rows = self.report()
+        total_time = sum(row[4] for row in rows)
+        print("Properties asked for by function: lookups, CoolProp calls, hit rate, wall time")
+        for name, lookups, coolprop_calls, hit_rate, wall_time in rows:
+            share = 0 if total_time == 0 else wall_time / total_time
+            print(name + ": " + str(lookups) + ", " + str(coolprop_calls) + ", " + str(round(hit_rate * 100, 1))
+                  + " %, " + str(round(wall_time, 4)) + " s (" + str(round(share * 100, 1)) + " %)")
+
+    def save(self, file_name):
+        workbook = xlsxwriter.Workbook(file_name)
+        worksheet = workbook.add_worksheet("properties")
+        for column, title in enumerate(["function", "lookups", "CoolProp calls", "hit rate", "wall time, s"]):
+            worksheet.write(0, column, title)
+        for row, values in enumerate(self.report()):
+            for column, value in enumerate(values):
+                worksheet.write(row + 1, column, value)
+        workbook.close()
@@ -0,0 +1,360 @@
+import time
+from collections import OrderedDict
+
+import numpy as np
+from CoolProp.CoolProp import AbstractState, generate_update_pair, get_parameter_index
+
+from PropertyProfiler import PropertyProfiler
+from PropertyTable import PropertyTable
+from SaturationTable import SaturationTable
+
+
+class PropertyService:
+
+    """
+    Every component of the HDRM obtains the thermodynamic properties of fluids through this class instead of calling
+    CoolProp directly. One evaluation of the whole HDRM model asks many times for exactly the same property, for
+    example the enthalpy of saturated vapor at the pressure of evaporation is needed in Evaporator, Compressor and
+    Turbine. Therefore the results of CoolProp are stored in a bounded LRU cache, so repeated lookups, also between
+    different members evaluated by the genetic algorithm, don't have to be calculated again.
+
+    The key of the cache is made of the demanded output, the pair of input parameters and the fluid. The pair of
+    inputs is sorted by the names of parameters, so ('P', p, 'H', h) and ('H', h, 'P', p) refer to the same entry.
+    Values of attributes hits and misses allow to check how efficient the cache is.
+
+    Properties are calculated with the low-level AbstractState of CoolProp. There's one AbstractState built for every
+    fluid (working fluid, air, water...) and it's reused by all components, so the name of fluid and parameters aren't
+    parsed at every call like in PropsSI. Function props_si_multi() updates the state once and reads several outputs
+    from it, e.g. temperature and entropy at the same point given by pressure and enthalpy.
+
+    By default the properties are calculated with the HEOS backend. Function set_backend() allows to calculate chosen
+    fluids with the tabulated backends ('BICUBIC&HEOS', 'TTSE&HEOS'), which are much faster, but less accurate. The
+    tables are generated by CoolProp at the first use of fluid and saved in the home directory, so next runs only load
+    them.
+
+    Function props_si_array() calculates one property for whole arrays of inputs, which is used by the batch
+    evaluation of the model (e.g. the whole population of the genetic algorithm at once) and by the profiles of
+    temperatures in heat exchangers.
+
+    Function set_ambient_tables() builds the tables of enthalpies of the ambient fluids of heat exchangers (see
+    PropertyTable) over the given ranges of temperatures and pressures. Then the enthalpies h(T, p) and temperatures
+    T(h, p) of these fluids inside the ranges are interpolated from the tables instead of being calculated by CoolProp,
+    the values out of the tables and all other properties are still calculated by CoolProp. Value of attribute
+    table_lookups is the number of properties taken from the tables.
+
+    Function set_saturation_tables() builds the tables of saturation curves of the working fluids (see
+    SaturationTable). Then the properties of saturated liquid and vapor (inputs 'Q', 0 or 1 with pressure or
+    temperature) are interpolated from them, e.g. the pressure of evaporation, or the enthalpy of saturated vapor.
+
+    Function start_profiling() switches on the PropertyProfiler, which collects the numbers of lookups, calculations of
+    CoolProp and the wall time separately for every method of components asking for properties.
+    """
+
+    def __init__(self, max_size=200000):
+        self.max_size = max_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # AbstractStates of fluids calculated with HEOS:
+        self.heos_states = {}
+        # Fluids calculated with other backend than HEOS, e.g. {'ammonia': 'BICUBIC&HEOS'}, and their AbstractStates:
+        self.backends = {}
+        self.states = {}
+        self.parameter_indexes = {}
+        self.backend_fallbacks = 0
+        # Tables of the ambient fluids, e.g. {'air': [PropertyTable]}, and the ranges they have been built for:
+        self.tables = {}
+        self.table_bounds = {}
+        self.table_lookups = 0
+        # Saturation tables of the working fluids, e.g. {'ammonia': SaturationTable}, None for the fluids which can't
+        # be tabulated:
+        self.saturation_tables = {}
+        # PropertyProfiler, when the profiling is switched on:
+        self.profiler = None
+
+    def set_backend(self, backend, fluids):
+        changed = False
+        for fluid in fluids:
+            if backend == 'HEOS':
+                if fluid in self.backends:
+                    del self.backends[fluid]
+                    del self.states[fluid]
+                    changed = True
+            elif self.backends.get(fluid) != backend:
+                self.states[fluid] = AbstractState(backend, fluid)
+                self.backends[fluid] = backend
+                changed = True
+        # The results of the previous backend can't be mixed with the new ones:
+        if changed:
+            self.cache.clear()
+
+    def set_ambient_tables(self, ranges, temp_margin=1, temp_step=0.5, press_points=5, tolerance=1e-3):
+
+        # The ranges are given as the list of [fluid, temperatures, pressures] - e.g. the temperatures of ambient on
+        # the inlet and outlet of heat exchanger and the pressures on both sides - the fluid can be repeated for every
+        # heat exchanger. The tables of every fluid are built over all its ranges extended by temp_margin, so the
+        # temperatures calculated from the enthalpies on the outlet are inside the tables too. The tables are built
+        # only once, the next calls with the ranges covered by them don't change anything.
+        bounds = {}
+        for fluid, temps, presses in ranges:
+            temps = [float(np.min(temps)) - temp_margin, float(np.max(temps)) + temp_margin]
+            presses = [float(np.min(presses)), float(np.max(presses))]
+            if fluid in bounds:
+                temps = [min(temps[0], bounds[fluid][0][0]), max(temps[1], bounds[fluid][0][1])]
+                presses = [min(presses[0], bounds[fluid][1][0]), max(presses[1], bounds[fluid][1][1])]
+            bounds[fluid] = [temps, presses]
+
+        for fluid, (temps, presses) in bounds.items():
+            if fluid in self.table_bounds:
+                old_temps, old_presses = self.table_bounds[fluid]
+                if (old_temps[0] <= temps[0] and temps[1] <= old_temps[1]
+                        and old_presses[0] <= presses[0] and presses[1] <= old_presses[1]):
+                    continue
+                # The tables which don't cover the new ranges are replaced by the ones covering both:
+                temps = [min(temps[0], old_temps[0]), max(temps[1], old_temps[1])]
+                presses = [min(presses[0], old_presses[0]), max(presses[1], old_presses[1])]
+            self.table_bounds[fluid] = [temps, presses]
+
+            state = self.heos_state(fluid)
+            tables = []
+            for phase_temps in self.single_phase_ranges(state, temps, presses, temp_step):
+                table = PropertyTable(fluid, phase_temps[0], phase_temps[1], presses[0], presses[1], temp_step,
+                                      press_points, tolerance)
+                if table.build(lambda press, temp: self.read_state(state, ['H'], 'P', press, 'T', temp)[0]):
+                    tables.append(table)
+            if tables:
+                self.tables[fluid] = tables
+            elif fluid in self.tables:
+                del self.tables[fluid]
+            # The results of CoolProp can't be mixed with the ones of the tables:
+            self.cache.clear()
+
+    def single_phase_ranges(self, state, temps, presses, margin):
+
+        # The fluid which boils in the range of temperatures (e.g. water heating the working fluid, which is cooled
+        # down from steam to the saturation) is described by two tables - of liquid below the saturation temperature
+        # at the lowest pressure and of vapor above the one at the highest pressure. The two-phase states are still
+        # calculated by CoolProp.
+        try:
+            temp_sat_liq = self.read_state(state, ['T'], 'P', presses[0], 'Q', 0)[0]
+            temp_sat_vap = self.read_state(state, ['T'], 'P', presses[1], 'Q', 1)[0]
+        except ValueError:
+            # There's no saturation state, e.g. above the critical pressure.
+            return [temps]
+        phase_ranges = []
+        if temps[0] < temp_sat_liq - margin:
+            phase_ranges.append([temps[0], min(temps[1], temp_sat_liq - margin)])
+        if temps[1] > temp_sat_vap + margin:
+            phase_ranges.append([max(temps[0], temp_sat_vap + margin), temps[1]])
+        return phase_ranges
+
+    def set_saturation_tables(self, fluids, number_of_points=200, near_critical=1, tolerance=1e-6):
+        # The table of every fluid is built only once:
+        for fluid in fluids:
+            if fluid in self.saturation_tables:
+                continue
+            table = SaturationTable(fluid, number_of_points, near_critical, tolerance)
+            if table.build(self.heos_state(fluid)):
+                self.saturation_tables[fluid] = table
+                self.cache.clear()
+            else:
+                self.saturation_tables[fluid] = None
+
+    def remove_ambient_tables(self):
+        # Removes the tables of ambient fluids, so the properties are calculated by CoolProp again:
+        self.table_bounds = {}
+        if self.tables:
+            self.tables = {}
+            self.cache.clear()
+
+    def remove_saturation_tables(self):
+        # Removes the saturation tables, so the saturation states are calculated by CoolProp again:
+        if self.saturation_tables:
+            self.saturation_tables = {}
+            self.cache.clear()
+
+    def remove_tables(self):
+        # Removes the tables of ambient fluids and the saturation tables:
+        self.remove_ambient_tables()
+        self.remove_saturation_tables()
+
+    def fluid_tables(self, fluid):
+        tables = self.tables.get(fluid, [])
+        if self.saturation_tables.get(fluid) is not None:
+            tables = tables + [self.saturation_tables[fluid]]
+        return tables
+
+    def parameter_index(self, name):
+        if name not in self.parameter_indexes:
+            self.parameter_indexes[name] = get_parameter_index(name)
+        return self.parameter_indexes[name]
+
+    def heos_state(self, fluid):
+        if fluid not in self.heos_states:
+            self.heos_states[fluid] = AbstractState('HEOS', fluid)
+        return self.heos_states[fluid]
+
+    def read_state(self, state, outputs, name_1, value_1, name_2, value_2):
+        input_pair, value_1, value_2 = generate_update_pair(self.parameter_index(name_1), value_1,
+                                                            self.parameter_index(name_2), value_2)
+        state.update(input_pair, value_1, value_2)
+        return [state.keyed_output(self.parameter_index(output)) for output in outputs]
+
+    def calculate(self, outputs, name_1, value_1, name_2, value_2, fluid):
+
+        # Inputs P, T are always calculated with HEOS - many states of the model given by P, T lie exactly on the
+        # saturation curve (e.g. the inlet of pump), where the tables can silently return the wrong phase.
+        if fluid in self.backends and (name_1, name_2) != ('P', 'T'):
+            try:
+                return self.read_state(self.states[fluid], outputs, name_1, value_1, name_2, value_2)
+            except ValueError:
+                # Tabulated backends can't solve some of the states which HEOS can. Such properties are calculated
+                # with HEOS:
+                self.backend_fallbacks += 1
+        return self.read_state(self.heos_state(fluid), outputs, name_1, value_1, name_2, value_2)
+
+    def props_si(self, output, name_1, value_1, name_2, value_2, fluid):
+        return self.props_si_multi([output], name_1, value_1, name_2, value_2, fluid)[0]
+
+    def props_si_multi(self, outputs, name_1, value_1, name_2, value_2, fluid):
+        if self.profiler is None:
+            return self.lookup(outputs, name_1, value_1, name_2, value_2, fluid)
+
+        lookups = self.hits + self.misses + self.table_lookups
+        misses = self.misses
+        start = time.perf_counter()
+        try:
+            return self.lookup(outputs, name_1, value_1, name_2, value_2, fluid)
+        finally:
+            self.profiler.record(self.hits + self.misses + self.table_lookups - lookups, self.misses - misses,
+                                 time.perf_counter() - start)
+
+    def lookup(self, outputs, name_1, value_1, name_2, value_2, fluid):
+
+        # The input pair is ordered, so the same state point is always stored under the same key:
+        if name_1 > name_2:
+            name_1, value_1, name_2, value_2 = name_2, value_2, name_1, value_1
+
+        results = []
+        for output in outputs:
+            result = self.cache.get((output, name_1, value_1, name_2, value_2, fluid))
+            if result is None:
+                break
+            results.append(result)
+        if len(results) == len(outputs):
+            self.hits += len(outputs)
+            for output in outputs:
+                self.cache.move_to_end((output, name_1, value_1, name_2, value_2, fluid))
+            return results
+
+        # CoolProp raises ValueError for the states it can't solve. Such results are not cached - the exception is
+        # passed to the component, which decides what to do with it.
+        results = self.table_lookup(outputs, name_1, value_1, name_2, value_2, fluid)
+        if results is not None:
+            self.table_lookups += len(outputs)
+        else:
+            self.misses += len(outputs)
+            results = self.calculate(outputs, name_1, value_1, name_2, value_2, fluid)
+        for output, result in zip(outputs, results):
+            self.cache[(output, name_1, value_1, name_2, value_2, fluid)] = result
+        while len(self.cache) > self.max_size:
+            # Removing the least recently used entry:
+            self.cache.popitem(last=False)
+        return results
+
+    def table_lookup(self, outputs, name_1, values_1, name_2, values_2, fluid):
+        # Properties interpolated from the tables of fluid, or None, if any of them can't be taken from the tables:
+        for table in self.fluid_tables(fluid):
+            results = []
+            for output in outputs:
+                result = table.lookup(output, name_1, values_1, name_2, values_2)
+                if result is None:
+                    break
+                results.append(result if isinstance(result, np.ndarray) and result.ndim else float(result))
+            if len(results) == len(outputs):
+                return results
+        return None
+
+    def props_si_array(self, output, name_1, values_1, name_2, values_2, fluid):
+
+        # The inputs can be arrays or scalars, they're broadcast to the same shape. States which can't be solved get
+        # the value nan, instead of raising ValueError like in props_si(), so one wrong member doesn't stop the
+        # calculation of the whole batch.
+        if name_1 > name_2:
+            name_1, values_1, name_2, values_2 = name_2, values_2, name_1, values_1
+        values_1, values_2 = np.asarray(values_1, dtype=float), np.asarray(values_2, dtype=float)
+
+        # For the fluids with tables all points at one pressure (or on the saturation curve) are interpolated at once:
+        if self.fluid_tables(fluid) and values_1.size and values_2.size:
+            start = time.perf_counter()
+            results = self.table_lookup([output], name_1, values_1, name_2, values_2, fluid)
+            if results is not None:
+                results = np.broadcast_to(results[0], np.broadcast_shapes(values_1.shape, values_2.shape)).copy()
+                self.table_lookups += results.size
+                if self.profiler is not None:
+                    self.profiler.record(results.size, 0, time.perf_counter() - start)
+                return results
+        values_1, values_2 = np.broadcast_arrays(values_1, values_2)
+
+        # Every point is calculated with props_si(), so it's stored in the cache like the scalar properties. PropsSI
+        # accepts arrays too, but it builds a new state at every call, which for air and water takes longer than
+        # solving all points of the array.
+        results = np.empty(values_1.shape)
+        for index in np.ndindex(values_1.shape):
+            try:
+                results[index] = self.props_si(output, name_1, float(values_1[index]), name_2,
+                                               float(values_2[index]), fluid)
+            except ValueError:
+                results[index] = np.nan
+        return results
+
+    def temperatures_at_pressure(self, press, enths, fluid):
+
+        # Temperatures of fluid at one pressure for the array of enthalpies, e.g. along the zones of heat exchangers.
+        # In the two-phase zone the temperature of a pure fluid depends only on pressure, so it's taken from the
+        # saturation state instead of solving every point - CoolProp gives exactly the same value for these points.
+        enths = np.asarray(enths, dtype=float)
+        temps = np.empty(enths.shape)
+        two_phase = np.zeros(enths.shape, dtype=bool)
+        try:
+            temp_sat_liq, enth_sat_liq = self.props_si_multi(['T', 'H'], 'P', press, 'Q', 0, fluid)
+            temp_sat_vap, enth_sat_vap = self.props_si_multi(['T', 'H'], 'P', press, 'Q', 1, fluid)
+            # For mixtures like air the temperature changes in the two-phase zone:
+            if temp_sat_liq == temp_sat_vap:
+                two_phase = (enths > enth_sat_liq) & (enths < enth_sat_vap)
+                temps[two_phase] = temp_sat_liq
+        except ValueError:
+            # There's no saturation state, e.g. above the critical pressure.
+            pass
+        temps[~two_phase] = self.props_si_array('T', 'P', press, 'H', enths[~two_phase], fluid)
+        return temps
+
+    def hit_rate(self):
+        if self.hits + self.misses == 0:
+            return 0
+        return self.hits / (self.hits + self.misses)
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.table_lookups = 0
+
+    def start_profiling(self):
+        # Returns the profiler, which collects the statistics from now on:
+        if self.profiler is None:
+            self.profiler = PropertyProfiler()
+        return self.profiler
+
+    def stop_profiling(self):
+        # Returns the profiler with collected statistics:
+        profiler = self.profiler
+        self.profiler = None
+        return profiler
+
+    def clear_cache(self):
+        self.cache.clear()
+        self.reset_counters()
+
+
+# The instance shared by all components of the HDRM:
+property_service = PropertyService()
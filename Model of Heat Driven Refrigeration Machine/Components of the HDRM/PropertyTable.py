@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class PropertyTable:
+
+    """
+    Table of enthalpies of one fluid on the grid of temperatures and pressures, which replaces CoolProp for the ambient
+    fluids of heat exchangers (air, water). The ambient fluids are calculated at nearly fixed pressures (the pressure
+    on the outlet and the one on the inlet, which differs only by the pressure ratio) and in a narrow range of
+    temperatures, so a small table calculated once gives these properties much faster than solving every state:
+    - the enthalpy at the given temperature and pressure, h(T, p),
+    - the temperature at the given enthalpy and pressure, T(h, p) - the inverse of h(T, p).
+
+    The enthalpies are interpolated linearly between the temperatures of the grid (step temp_step) and between the
+    pressures (press_points values between press_min and press_max). Function build() is given the function, which
+    calculates the enthalpy of fluid with CoolProp, it fills the grid and checks it - the table is accepted only
+    if the fluid doesn't change the phase in the range (the enthalpy grows with the temperature) and the interpolated
+    values in the middle of every cell of the grid don't differ from CoolProp more than the tolerance, given as the
+    error of temperature in K (the error of enthalpy is divided by the specific heat).
+    """
+
+    def __init__(self, fluid, temp_min, temp_max, press_min, press_max, temp_step=0.5, press_points=5, tolerance=1e-3):
+        self.fluid = fluid
+        number_of_temps = max(int(np.ceil((temp_max - temp_min) / temp_step)), 1) + 1
+        self.temps = temp_min + temp_step * np.arange(number_of_temps)
+        if press_max > press_min:
+            self.presses = np.linspace(press_min, press_max, press_points)
+        else:
+            self.presses = np.array([press_min])
+        self.tolerance = tolerance
+        # Enthalpies of the grid, one row for every pressure:
+        self.enths = None
+
+    def covers(self, temps, presses):
+        return (np.min(temps) >= self.temps[0] and np.max(temps) <= self.temps[-1]
+                and np.min(presses) >= self.presses[0] and np.max(presses) <= self.presses[-1])
+
+    def build(self, calculate_enth):
+
+        # Returns True, if the table has been built. calculate_enth(press, temp) is the enthalpy calculated by CoolProp,
+        # it may raise ValueError (e.g. below the melting temperature of water).
+        try:
+            enths = np.array([[calculate_enth(float(press), float(temp)) for temp in self.temps]
+                              for press in self.presses])
+        except ValueError as error:
+            print("PropertyTable.build(): The table of " + self.fluid + " can't be calculated: " + str(error))
+            return False
+        if (np.diff(enths, axis=1) <= 0).any():
+            print("PropertyTable.build(): The fluid " + self.fluid + " changes its phase in the range of the table.")
+            return False
+        self.enths = enths
+
+        # Checking the values in the middle of every cell of the grid:
+        middle_temps = (self.temps[:-1] + self.temps[1:]) / 2
+        if len(self.presses) > 1:
+            middle_presses = (self.presses[:-1] + self.presses[1:]) / 2
+        else:
+            middle_presses = self.presses
+        error = 0
+        for press in middle_presses:
+            try:
+                exact_enths = np.array([calculate_enth(float(press), float(temp)) for temp in middle_temps])
+            except ValueError as exception:
+                print("PropertyTable.build(): The table of " + self.fluid + " can't be checked: " + str(exception))
+                self.enths = None
+                return False
+            spec_heats = np.diff(self.enthalpies_at_pressure(press)) / np.diff(self.temps)
+            error = max(error, np.max(np.abs(self.enthalpies(middle_temps, press) - exact_enths) / spec_heats))
+        if error > self.tolerance:
+            print("PropertyTable.build(): The table of " + self.fluid + " differs from CoolProp by " + str(error) +
+                  " K, which is more than the tolerance " + str(self.tolerance) + " K.")
+            self.enths = None
+            return False
+        return True
+
+    def enthalpies_at_pressure(self, press):
+        # Row of enthalpies of the grid interpolated to the given pressure:
+        if len(self.presses) == 1:
+            return self.enths[0]
+        row = min(np.searchsorted(self.presses, press, side='right'), len(self.presses) - 1)
+        weight = (press - self.presses[row - 1]) / (self.presses[row] - self.presses[row - 1])
+        return self.enths[row - 1] + weight * (self.enths[row] - self.enths[row - 1])
+
+    def enthalpies(self, temps, press):
+        return np.interp(temps, self.temps, self.enthalpies_at_pressure(press))
+
+    def lookup(self, output, name_1, values_1, name_2, values_2):
+
+        # Property given by the pair of inputs ordered by names like in PropertyService, ('P', 'T') or ('H', 'P').
+        # Returns None for other properties and for the states out of the table, which have to be calculated by
+        # CoolProp. The pressure has to be the same for all values (a scalar).
+        if np.ndim(values_1 if name_1 == 'P' else values_2) != 0:
+            return None
+        if (output, name_1, name_2) == ('H', 'P', 'T'):
+            if not self.covers(values_2, values_1):
+                return None
+            return self.enthalpies(values_2, values_1)
+        if (output, name_1, name_2) == ('T', 'H', 'P'):
+            if not self.covers(self.temps[0], values_2):
+                return None
+            # The enthalpies of the row grow with the temperature, so the row can be interpolated the other way round:
+            row = self.enthalpies_at_pressure(values_2)
+            if np.min(values_1) < row[0] or np.max(values_1) > row[-1]:
+                return None
+            return np.interp(values_1, row, self.temps)
+        return None
@@ -1,4 +1,4 @@
-from CoolProp.CoolProp import PropsSI
+from PropertyService import property_service
 from Component import Component
 
 
@@ -48,15 +48,17 @@ class Pump(Component):
         else:
 
             # Using the isentropic efficiency equations to solve the parameters of pump's outlet:
-            self.entr_in = PropsSI('S', 'T', self.temp_in, 'P', self.press_in, self.work_fl)
-            self.enth_in = PropsSI('H', 'T', self.temp_in, 'P', self.press_in, self.work_fl)
+            self.entr_in, self.enth_in = property_service.props_si_multi(['S', 'H'], 'T', self.temp_in, 'P',
+                                                                         self.press_in, self.work_fl)
             entr_after_isent_transf = self.entr_in
-            enth_after_isent_transf = PropsSI('H', 'S', entr_after_isent_transf, 'P', self.press_out, self.work_fl)
+            enth_after_isent_transf = property_service.props_si('H', 'S', entr_after_isent_transf, 'P',
+                                                                self.press_out, self.work_fl)
             self.enth_out = (enth_after_isent_transf - self.enth_in) / self.isent_eff + self.enth_in
-            self.temp_in = PropsSI('T', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
-            self.temp_out = PropsSI('T', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            # Temperature and entropy of inlet and outlet are read from one state of the fluid each:
+            self.temp_in, self.entr_in = property_service.props_si_multi(['T', 'S'], 'H', self.enth_in, 'P',
+                                                                         self.press_in, self.work_fl)
+            self.temp_out, self.entr_out = property_service.props_si_multi(['T', 'S'], 'H', self.enth_out, 'P',
+                                                                           self.press_out, self.work_fl)
 
             # For some reason mass flow value might have not been initialized.
             # Then the values of powers can't be calculated.
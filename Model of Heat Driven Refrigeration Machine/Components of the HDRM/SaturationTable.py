@@ -0,0 +1,178 @@
+import bisect
+import math
+
+import numpy as np
+from CoolProp.CoolProp import QT_INPUTS, iHmass, iP, iSmass, iT
+
+
+class HermiteSpline:
+
+    """
+    Cubic Hermite spline through the points (xs, ys) with the given derivatives in the points. It's evaluated for
+    a number or an array of values between xs[0] and xs[-1]. Single numbers are calculated on the lists of floats,
+    which is several times faster than NumPy for one value.
+    """
+
+    def __init__(self, xs, ys, slopes):
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        self.slopes = np.asarray(slopes, dtype=float)
+        self.xs_list = self.xs.tolist()
+        self.ys_list = self.ys.tolist()
+        self.slopes_list = self.slopes.tolist()
+
+    def __call__(self, x):
+        if isinstance(x, (int, float)):
+            xs, ys, slopes = self.xs_list, self.ys_list, self.slopes_list
+            i = min(max(bisect.bisect_right(xs, x) - 1, 0), len(xs) - 2)
+        else:
+            xs, ys, slopes = self.xs, self.ys, self.slopes
+            i = np.clip(np.searchsorted(xs, x, side='right') - 1, 0, len(xs) - 2)
+        step = xs[i + 1] - xs[i]
+        t = (x - xs[i]) / step
+        return ((1 + 2 * t) * (1 - t) ** 2 * ys[i] + t * (1 - t) ** 2 * step * slopes[i]
+                + t ** 2 * (3 - 2 * t) * ys[i + 1] + t ** 2 * (t - 1) * step * slopes[i + 1])
+
+
+class SaturationTable:
+
+    """
+    Saturation curve of the working fluid - pressure, enthalpies and entropies of saturated liquid and vapor - tabulated
+    once between the triple point and near_critical K below the critical temperature. The components of the HDRM ask
+    many times for the states on the boundary of two-phase zone (e.g. the pressure of evaporation for the temperature
+    of evaporation, the enthalpy of saturated vapor at the pressure of condensation), which are read from the table
+    instead of solving the saturation state by CoolProp.
+
+    The properties are interpolated by cubic Hermite splines. In every point of the table CoolProp gives not only the
+    values, but also their derivatives along the saturation curve, so the splines pass through the exact values with
+    the exact slopes. The properties at the given temperature are interpolated in temperature, the ones at the given
+    pressure (the temperature of saturation as well) in logarithm of pressure. The points are closer to each other
+    near the critical point, where the properties change the fastest.
+
+    Function build() accepts the table only if the values interpolated in the middle between the points don't differ
+    from CoolProp more than the relative tolerance (for enthalpies and entropies relative to the largest heat and
+    entropy of evaporation in the table). Only pure fluids are tabulated - for mixtures the temperatures of bubble
+    and dew point differ.
+    """
+
+    def __init__(self, fluid, number_of_points=200, near_critical=1, tolerance=1e-6):
+        self.fluid = fluid
+        self.number_of_points = number_of_points
+        self.near_critical = near_critical
+        self.tolerance = tolerance
+        self.temp_min = None
+        self.temp_max = None
+        self.press_min = None
+        self.press_max = None
+        # Splines of logarithm of pressure ('P') and of the enthalpies and entropies of saturated liquid ('H0', 'S0')
+        # and vapor ('H1', 'S1') in temperature, and of temperature ('T') and the same enthalpies and entropies in
+        # logarithm of pressure:
+        self.by_temp_splines = {}
+        self.by_press_splines = {}
+
+    @staticmethod
+    def saturation_states(state, temps):
+
+        # Values and their derivatives with respect to temperature along the saturation curve, as the arrays in the
+        # dictionary - e.g. 'H1' is the enthalpy of saturated vapor and 'dH1' its derivative:
+        columns = {}
+        for quality in (0, 1):
+            for name in ('P', 'H', 'S'):
+                columns[name + str(quality)] = []
+                columns['d' + name + str(quality)] = []
+            for temp in temps:
+                state.update(QT_INPUTS, quality, float(temp))
+                for name, parameter in (('P', iP), ('H', iHmass), ('S', iSmass)):
+                    columns[name + str(quality)].append(state.keyed_output(parameter))
+                    columns['d' + name + str(quality)].append(state.first_saturation_deriv(parameter, iT))
+        return {name: np.array(values) for name, values in columns.items()}
+
+    def build(self, state):
+
+        # Returns True, if the table has been built. state is the AbstractState of the fluid calculated with HEOS.
+        temp_min = state.Ttriple()
+        temp_max = state.T_critical() - self.near_critical
+        steps = np.linspace(0, 1, self.number_of_points)
+        temps = temp_max - (temp_max - temp_min) * (1 - steps) ** 2
+        middle_temps = (temps[:-1] + temps[1:]) / 2
+        try:
+            columns = self.saturation_states(state, temps)
+            exact = self.saturation_states(state, middle_temps)
+        except ValueError as error:
+            print("SaturationTable.build(): The saturation curve of " + self.fluid + " can't be calculated: "
+                  + str(error))
+            return False
+        if not np.allclose(columns['P0'], columns['P1'], rtol=1e-9, atol=0):
+            print("SaturationTable.build(): The fluid " + self.fluid + " isn't a pure fluid, the saturation curve "
+                  "isn't tabulated.")
+            return False
+
+        log_presses = np.log(columns['P1'])
+        log_press_slopes = columns['dP1'] / columns['P1']
+        self.by_temp_splines['P'] = HermiteSpline(temps, log_presses, log_press_slopes)
+        self.by_press_splines['T'] = HermiteSpline(log_presses, temps, 1 / log_press_slopes)
+        for name in ('H0', 'S0', 'H1', 'S1'):
+            self.by_temp_splines[name] = HermiteSpline(temps, columns[name], columns['d' + name])
+            self.by_press_splines[name] = HermiteSpline(log_presses, columns[name],
+                                                        columns['d' + name] / log_press_slopes)
+        self.temp_min, self.temp_max = temps[0], temps[-1]
+        self.press_min, self.press_max = columns['P1'][0], columns['P1'][-1]
+
+        # Checking the values in the middle between the points, both interpolated in temperature and in pressure:
+        errors = [np.abs(self.by_temperature('P', middle_temps) / exact['P1'] - 1),
+                  np.abs(self.by_pressure('T', exact['P1']) / middle_temps - 1)]
+        for name in ('H', 'S'):
+            scale = np.max(columns[name + '1'] - columns[name + '0'])
+            for quality in ('0', '1'):
+                errors.append(np.abs(self.by_temperature(name + quality, middle_temps) - exact[name + quality]) / scale)
+                errors.append(np.abs(self.by_pressure(name + quality, exact['P1']) - exact[name + quality]) / scale)
+        error = max(np.max(e) for e in errors)
+        if error > self.tolerance:
+            print("SaturationTable.build(): The saturation table of " + self.fluid + " differs from CoolProp by "
+                  + str(error) + ", which is more than the tolerance " + str(self.tolerance) + ".")
+            self.temp_min = None
+            return False
+        return True
+
+    def by_temperature(self, name, temps):
+        # 'P' or one of the enthalpies and entropies of saturated liquid and vapor ('H0', 'S1'...) at the temperatures:
+        if name == 'P':
+            log_presses = self.by_temp_splines['P'](temps)
+            return math.exp(log_presses) if isinstance(log_presses, float) else np.exp(log_presses)
+        return self.by_temp_splines[name](temps)
+
+    def by_pressure(self, name, presses):
+        # 'T' or one of the enthalpies and entropies of saturated liquid and vapor at the pressures:
+        log_presses = math.log(presses) if isinstance(presses, (int, float)) else np.log(presses)
+        return self.by_press_splines[name](log_presses)
+
+    def lookup(self, output, name_1, values_1, name_2, values_2):
+
+        # Property of saturated liquid (quality 0) or vapor (quality 1) given by the pair of inputs ordered by names
+        # like in PropertyService, ('P', 'Q') or ('Q', 'T'). Returns None for other properties and for the states out of
+        # the table, which have to be calculated by CoolProp.
+        if self.temp_min is None:
+            return None
+        if (name_1, name_2) == ('P', 'Q') and output in ('T', 'H', 'S'):
+            quality, values, minimum, maximum = values_2, values_1, self.press_min, self.press_max
+        elif (name_1, name_2) == ('Q', 'T') and output in ('P', 'H', 'S'):
+            quality, values, minimum, maximum = values_1, values_2, self.temp_min, self.temp_max
+        else:
+            return None
+        # The numbers are checked without NumPy, which would take longer than the interpolation itself:
+        if not isinstance(quality, (int, float)):
+            if np.ndim(quality) != 0:
+                return None
+            quality = float(quality)
+        if quality not in (0, 1):
+            return None
+        if isinstance(values, (int, float)):
+            if not minimum <= values <= maximum:
+                return None
+        elif np.min(values) < minimum or np.max(values) > maximum:
+            return None
+
+        name = output if output in ('P', 'T') else output + str(int(quality))
+        if name_2 == 'T':
+            return self.by_temperature(name, values)
+        return self.by_pressure(name, values)
@@ -1,4 +1,4 @@
-from CoolProp.CoolProp import PropsSI
+from PropertyService import property_service
 
 from Component import Component
 
@@ -35,14 +35,14 @@ class ThrottlingValve(Component):
 
         else:
 
-            self.press_in = PropsSI('P', 'T', self.temp_in + self.overc_cond, 'Q', 0, self.work_fl)
-            self.press_out = PropsSI('P', 'T', self.temp_out, 'Q', 1, self.work_fl)
+            self.press_in = property_service.props_si('P', 'T', self.temp_in + self.overc_cond, 'Q', 0, self.work_fl)
+            self.press_out = property_service.props_si('P', 'T', self.temp_out, 'Q', 1, self.work_fl)
 
             # This function either sets both enthalpies or the enthalpy at the point of the Throttling valve,
             # which has not been initialized. It also checks, if there's no some mistake done during initialization of
             # instance, during which somebody could have set two different values of enthalpies.
             if self.enth_in == 0 and self.enth_in == 0:
-                self.enth_in = PropsSI('H', 'T', self.temp_in, 'P', self.press_in, self.work_fl)
+                self.enth_in = property_service.props_si('H', 'T', self.temp_in, 'P', self.press_in, self.work_fl)
                 self.enth_out = self.enth_in
             elif self.enth_in == 0 and self.enth_out != 0:
                 self.enth_in = self.enth_out
@@ -52,8 +52,8 @@ class ThrottlingValve(Component):
                 print("ThrottlingValve.calculate(): The values of enth_in and enth_out have already been set "
                       "and they're different: \n"
                       "enth_in = " + self.enth_in + " \n" + "enth_out = " + self.enth_out)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
+            self.entr_out = property_service.props_si('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            self.entr_in = property_service.props_si('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
 
     def calculate_cost(self):
         return 50
@@ -1,4 +1,4 @@
-from CoolProp.CoolProp import PropsSI
+from PropertyService import property_service
 from Component import Component
 
 
@@ -51,22 +51,24 @@ class Turbine(Component):
         else:
 
             # Using the isentropic efficiency equations to solve the parameters after the compressor:
-            self.entr_in = PropsSI('S', 'T', self.temp_in, 'P', self.press_in, self.work_fl)
-            self.enth_in = PropsSI('H', 'T', self.temp_in, 'P', self.press_in, self.work_fl)
+            self.entr_in, self.enth_in = property_service.props_si_multi(['S', 'H'], 'T', self.temp_in, 'P',
+                                                                         self.press_in, self.work_fl)
             entr_after_isent_transform = self.entr_in
-            enth_after_isent_transform = PropsSI('H', 'S', entr_after_isent_transform, 'P', self.press_out, self.work_fl)
+            enth_after_isent_transform = property_service.props_si('H', 'S', entr_after_isent_transform, 'P',
+                                                                   self.press_out, self.work_fl)
             self.enth_out = self.enth_in - self.isent_eff * (self.enth_in - enth_after_isent_transform)
-            self.temp_in = PropsSI('T', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
-            self.temp_out = PropsSI('T', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
-            self.entr_in = PropsSI('S', 'H', self.enth_in, 'P', self.press_in, self.work_fl)
-            self.entr_out = PropsSI('S', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+            # Temperature and entropy of inlet and outlet are read from one state of the fluid each:
+            self.temp_in, self.entr_in = property_service.props_si_multi(['T', 'S'], 'H', self.enth_in, 'P',
+                                                                         self.press_in, self.work_fl)
+            self.temp_out, self.entr_out = property_service.props_si_multi(['T', 'S'], 'H', self.enth_out, 'P',
+                                                                           self.press_out, self.work_fl)
 
             # Turbine is very susceptible to damage, when there is even a little bit of humidity in the gas
             # at outlet. The function won't refuse to save the results of calculation in the instance of class, but
             # it's advisable to warn the user:
-            enth_sat = PropsSI('H', 'P', self.press_out, 'Q', 1, self.work_fl)
+            enth_sat = property_service.props_si('H', 'P', self.press_out, 'Q', 1, self.work_fl)
             if self.enth_out < enth_sat:
-                vap_q = PropsSI('Q', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
+                vap_q = property_service.props_si('Q', 'H', self.enth_out, 'P', self.press_out, self.work_fl)
                 print("Turbine.calculate(): Warning! Vapor quality of outlet in turbine is below 1 "
                       ", which means there's some humidity in the gas at the end of turbine!\n"
                       "Vapor quality of outlet: " + str(vap_q) + ".")
@@ -1,5 +1,6 @@
 import random
 
+import numpy as np
 import xlsxwriter
 from CoolProp.CoolProp import PropsSI
 
@@ -8,7 +9,9 @@ from Compressor import Compressor
 from Condenser import Condenser
 from EngineerHelper import EngineerHelper
 from Evaporator import Evaporator
+from HDRM_batch_cycle import broadcast_genes, calculate_cycle_batch, group_by_fluids
 from Mixer import Mixer
+from PropertyService import property_service
 from Pump import Pump
 from ThrottlingValve import ThrottlingValve
 from Turbine import Turbine
@@ -34,7 +37,31 @@ def calculate_eff_evap_as_heat_source(q_cap,
                   eff_turboeq,
 
                   amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
-                  amb_pr_evap_hot_side):
+                  amb_pr_evap_hot_side,
+                  backend='HEOS', ambient_tables=False, saturation_tables=False):
+
+    # Properties of fluids are calculated with the chosen backend of CoolProp - 'HEOS' (default), or one of the
+    # tabulated backends 'BICUBIC&HEOS', 'TTSE&HEOS', which are faster, but less accurate:
+    property_service.set_backend(backend, [work_fl, amb_work_fl_cond, amb_work_fl_evap, amb_work_fl_evap_hot_side])
+    # With ambient_tables the enthalpies and temperatures of the ambient fluids are interpolated from the tables built
+    # once over the ranges of ambient temperatures (see PropertyService.set_ambient_tables()), otherwise the tables
+    # left by the previous calls are removed. The ambient of the hot side is cooled down at most to the temperature of
+    # the working fluid after the pump, which is higher than the temperature of ambient on the inlet of condenser:
+    if ambient_tables:
+        property_service.set_ambient_tables(
+            [[amb_work_fl_evap, [amb_t_evap_in, amb_t_evap_out], [amb_p_evap_out, amb_p_evap_out / amb_pr_evap]],
+             [amb_work_fl_cond, [amb_t_cond_in, amb_t_cond_out], [amb_p_cond_out, amb_p_cond_out / amb_pr_cond]],
+             [amb_work_fl_evap_hot_side, [amb_t_cond_in, amb_t_evap_hot_side_in],
+              [amb_p_evap_hot_side_out, amb_p_evap_hot_side_out / amb_pr_evap_hot_side]]])
+    else:
+        property_service.remove_ambient_tables()
+    # With saturation_tables the properties of saturated liquid and vapor of the working fluid are interpolated from
+    # the table of its saturation curve (see PropertyService.set_saturation_tables()), otherwise the tables left by
+    # the previous calls are removed:
+    if saturation_tables:
+        property_service.set_saturation_tables([work_fl])
+    else:
+        property_service.remove_saturation_tables()
 
     # The functions starts with creating tables to collect values of important attributes, each of them has 11 places:
     # indexes 1,2,3,4 for refrigeration cycle (1 is before the compressor, 4 is before evaporator),
@@ -147,7 +174,6 @@ def calculate_eff_evap_as_heat_source(q_cap,
                           amb_press_out=amb_p_cond_out)
     condenser.set_attr_combined_cycle()
     condenser.calculate_combined_cyc()
-    temp_in_cond = evaporator_hot_side.generate_enthalpies_data(accuracy=10)
 
     efficiency = round(evaporator.q_cap / evaporator_hot_side.heat_cap, 8)
     # print("Efficiency of HDRM: " + str(efficiency))
@@ -175,70 +201,223 @@ def calculate_cost_of_hdrm(throttling_valve, evaporator_cold_side, compressor, m
     return cost_of_hdrm
 
 
-# Input data:
-q_cap = 1e5
-work_fl = 'ammonia'
-amb_work_fl_cond = 'air'
-amb_work_fl_evap = 'air'
-amb_work_fl_evap_hot_side = 'water'
-t_cond = 35 + 273.15            # K
-overc_cond = 2                  # K
-t_evap = -12 + 273.15           # K
-overh_evap = 2                  # K
-# press_bef_turb = [40e5, 50e5, 60e5, 70e5, 80e5, 90e5]           # Pa
-# temp_bef_turb = [393, 413, 433, 453, 483, 523]    # K
-press_bef_turb = 56e5           # Pa
-temp_bef_turb = 295 + 273.15    # K
-pr_evap = 0.99
-amb_pr_evap = 0.99
-pr_cond = 0.99
-amb_pr_cond = 0.99
-pr_boil = 0.99
-pr_evap_hot_side = 0.99
-amb_pr_evap_hot_side = 0.99
-
-amb_t_evap_in = -4 + 273.15     # K
-amb_t_evap_out = -8 + 273.15    # K
-amb_t_cond_in = 20 + 273.15     # K
-amb_t_cond_out = 30 + 273.15    # K
-# amb_t_evap_hot_side_out = 120 + 273.15  # K
-evap_hot_side_pinch_point = 5  # K
-amb_t_evap_hot_side_in = 300 + 273.15     # K
-amb_p_evap_out = 1e5            # Pa
-amb_p_cond_out = 1e5            # Pa
-amb_p_evap_hot_side_out = 1e5   # Pa
-
-isent_eff_turb = 0.7
-isent_eff_pump = 0.9
-elec_eff_pump = 0.9
-isent_eff_comp = 0.7
-eff_boil = 0.9
-fuel_heat_val = 26e6            # J/kg
-eff_turboeq = 0.99
-pres_max = 72e5
-while press_bef_turb <= pres_max:
-    print(calculate_eff_evap_as_heat_source(q_cap,
-
-                  work_fl, amb_work_fl_cond, amb_work_fl_evap,
-
-                  t_cond, overc_cond, t_evap, overh_evap,
-
-                  press_bef_turb, temp_bef_turb,
-
-                  pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
-
-                  amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
-                  amb_p_cond_out,
+def calculate_eff_evap_as_heat_source_batch(q_cap,
+
+                                            work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                                            t_cond, overc_cond, t_evap, overh_evap,
+
+                                            press_bef_turb, temp_bef_turb,
+
+                                            pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
+
+                                            amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
+                                            amb_p_evap_out, amb_p_cond_out,
+
+                                            isent_eff_turb,
+                                            isent_eff_pump, elec_eff_pump,
+                                            isent_eff_comp,
+                                            eff_turboeq,
+
+                                            amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out,
+                                            evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
+                                            amb_pr_evap_hot_side,
+                                            backend='HEOS', ambient_tables=False, saturation_tables=False):
+
+    # The batch version of calculate_eff_evap_as_heat_source(): every argument can be a scalar or an array of values
+    # (e.g. one column of genes of the whole population, or a grid of points), and the arrays of efficiencies and SIC
+    # of the same shape are returned. The members for which the model can't be solved get the value nan.
+    shape, (q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
+            press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
+            amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out, amb_p_cond_out,
+            isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_turboeq,
+            amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
+            amb_pr_evap_hot_side) = broadcast_genes(q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond,
+                                                    overc_cond, t_evap, overh_evap, press_bef_turb, temp_bef_turb,
+                                                    pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
+                                                    pr_evap_hot_side, amb_t_evap_in, amb_t_evap_out, amb_t_cond_in,
+                                                    amb_t_cond_out, amb_p_evap_out, amb_p_cond_out, isent_eff_turb,
+                                                    isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_turboeq,
+                                                    amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out,
+                                                    evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
+                                                    amb_pr_evap_hot_side)
+    efficiency = np.full(q_cap.shape, np.nan)
+    sic = np.full(q_cap.shape, np.nan)
+
+    for fluids, m in group_by_fluids(work_fl, amb_work_fl_cond, amb_work_fl_evap, amb_work_fl_evap_hot_side):
+        property_service.set_backend(backend, list(fluids))
+        if ambient_tables:
+            property_service.set_ambient_tables(
+                [[fluids[2], [amb_t_evap_in[m], amb_t_evap_out[m]],
+                  [amb_p_evap_out[m], amb_p_evap_out[m] / amb_pr_evap[m]]],
+                 [fluids[1], [amb_t_cond_in[m], amb_t_cond_out[m]],
+                  [amb_p_cond_out[m], amb_p_cond_out[m] / amb_pr_cond[m]]],
+                 [fluids[3], [amb_t_cond_in[m], amb_t_evap_hot_side_in[m]],
+                  [amb_p_evap_hot_side_out[m], amb_p_evap_hot_side_out[m] / amb_pr_evap_hot_side[m]]]])
+        else:
+            property_service.remove_ambient_tables()
+        if saturation_tables:
+            property_service.set_saturation_tables([fluids[0]])
+        else:
+            property_service.remove_saturation_tables()
+        cycle = calculate_cycle_batch(q_cap[m], fluids[0], fluids[1], fluids[2],
+                                      t_cond[m], overc_cond[m], t_evap[m], overh_evap[m],
+                                      press_bef_turb[m], temp_bef_turb[m],
+                                      pr_evap[m], amb_pr_evap[m], pr_cond[m], amb_pr_cond[m], pr_boil[m],
+                                      amb_t_evap_in[m], amb_t_evap_out[m], amb_t_cond_in[m], amb_t_cond_out[m],
+                                      amb_p_evap_out[m], amb_p_cond_out[m],
+                                      isent_eff_turb[m], isent_eff_pump[m], elec_eff_pump[m], isent_eff_comp[m],
+                                      eff_turboeq[m])
+
+        # Evaporator on the hot side, the same as in Evaporator.calculate_hot_side():
+        hot_side = {'press_out': cycle['pres'][5], 'temp_in': cycle['temp'][8],
+                    'amb_press_out': amb_p_evap_hot_side_out[m]}
+        hot_side['press_in'] = cycle['pres'][5] / pr_evap_hot_side[m]
+        hot_side['enth_in'] = property_service.props_si_array('H', 'P', hot_side['press_in'], 'T',
+                                                              hot_side['temp_in'], fluids[0])
+        hot_side['enth_out'] = property_service.props_si_array('H', 'P', cycle['pres'][5], 'T', cycle['temp'][5],
+                                                               fluids[0])
+        hot_side['amb_press_in'] = amb_p_evap_hot_side_out[m] / amb_pr_evap_hot_side[m]
+        sat_temp_liquid = property_service.props_si_array('T', 'P', hot_side['press_in'], 'Q', 0, fluids[0])
+        amb_enth_pp = property_service.props_si_array('H', 'T', sat_temp_liquid + evap_hot_side_pinch_point[m], 'P',
+                                                      amb_p_evap_hot_side_out[m], fluids[3])
+        hot_side['amb_enth_in'] = property_service.props_si_array('H', 'P', hot_side['amb_press_in'], 'T',
+                                                                  amb_t_evap_hot_side_in[m], fluids[3])
+        enth_pp = property_service.props_si_array('H', 'P', hot_side['press_in'], 'Q', 0, fluids[0])
+        hot_side['mass_fl'] = cycle['mass_fl_turb']
+        hot_side['amb_mass_fl'] = (hot_side['mass_fl'] * (hot_side['enth_out'] - enth_pp)
+                                   / (hot_side['amb_enth_in'] - amb_enth_pp))
+        hot_side['amb_enth_out'] = (- hot_side['mass_fl'] / hot_side['amb_mass_fl']
+                                    * (hot_side['enth_out'] - hot_side['enth_in']) + hot_side['amb_enth_in'])
+        # If the temperature of ambient on the outlet can't be calculated, the member is not solved:
+        amb_temp_out = property_service.props_si_array('T', 'P', amb_p_evap_hot_side_out[m], 'H',
+                                                       hot_side['amb_enth_out'], fluids[3])
+        heat_cap = np.where(np.isnan(amb_temp_out), np.nan,
+                            hot_side['mass_fl'] * (hot_side['enth_out'] - hot_side['enth_in']))
+
+        efficiency[m] = np.round(q_cap[m] / heat_cap, 8)
+        sic[m] = calculate_cost_of_hdrm_batch(cycle, hot_side, efficiency[m], fluids) / q_cap[m]
+
+    return [np.reshape(efficiency, shape), np.reshape(sic, shape)]
+
+
+def calculate_cost_of_hdrm_batch(cycle, hot_side, efficiency, fluids):
+
+    # The costs of throttling valve, mixer, compressor, pump and turbine are calculated for the whole arrays, with the
+    # same formulas as in calculate_cost() of these components:
+    cost_of_hdrm = 50 + 50 + np.zeros(len(efficiency))
+    cost_of_hdrm += (18745 * np.power(cycle['power_comp'] / 1000, -0.835)) * cycle['power_comp'] / 1000
+    cost_of_hdrm += 900 * np.power(cycle['power_pump'] / 300, 0.25)
+    cost_of_hdrm += (28118 * np.power(cycle['power_turb'] / 1000, -0.835)) * cycle['power_turb'] / 1000
+
+    # The costs of heat exchangers are calculated by the components from profiles of temperatures, so an instance of
+    # every heat exchanger is created for every solved member with the attributes calculated above:
+    for i in range(len(efficiency)):
+        if np.isnan(efficiency[i]) or np.isnan(cost_of_hdrm[i]):
+            cost_of_hdrm[i] = np.nan
+            continue
+        evaporator_cold_side = Evaporator(press_in=cycle['pres'][4][i], press_out=cycle['pres'][1][i],
+                                          temp_in=cycle['evap_temp_in'][i], enth_in=cycle['enth'][4][i],
+                                          enth_out=cycle['enth'][1][i], mass_fl=cycle['mass_fl_evap'][i],
+                                          work_fl=fluids[0], amb_work_fl=fluids[2],
+                                          amb_press_in=cycle['evap_amb_press_in'][i],
+                                          amb_press_out=cycle['evap_amb_press_out'][i],
+                                          amb_enth_out=cycle['evap_amb_enth_out'][i],
+                                          amb_mass_fl=cycle['evap_amb_mass_fl'][i])
+        condenser = Condenser(press_in=cycle['pres'][9][i], press_out=cycle['cond_press_out'][i],
+                              enth_in=cycle['enth'][9][i], enth_out=cycle['enth'][10][i],
+                              mass_fl=cycle['mass_fl_cond'][i], work_fl=fluids[0], amb_work_fl=fluids[1],
+                              amb_press_in=cycle['cond_amb_press_in'][i],
+                              amb_press_out=cycle['cond_amb_press_out'][i],
+                              amb_enth_out=cycle['cond_amb_enth_out'][i], amb_mass_fl=cycle['cond_amb_mass_fl'][i])
+        evaporator_hot_side = Evaporator(press_in=hot_side['press_in'][i], press_out=hot_side['press_out'][i],
+                                         temp_in=hot_side['temp_in'][i], enth_in=hot_side['enth_in'][i],
+                                         enth_out=hot_side['enth_out'][i], mass_fl=hot_side['mass_fl'][i],
+                                         work_fl=fluids[0], amb_work_fl=fluids[3],
+                                         amb_press_in=hot_side['amb_press_in'][i],
+                                         amb_press_out=hot_side['amb_press_out'][i],
+                                         amb_enth_out=hot_side['amb_enth_out'][i],
+                                         amb_mass_fl=hot_side['amb_mass_fl'][i])
+        try:
+            cost_of_hdrm[i] += evaporator_cold_side.calculate_cost(surf_cost=20)
+            cost_of_hdrm[i] += condenser.calculate_cost(surf_cost=150)
+            cost_of_hdrm[i] += evaporator_hot_side.calculate_cost(surf_cost=150)
+        except ValueError:
+            cost_of_hdrm[i] = np.nan
+    return cost_of_hdrm
 
-                  isent_eff_turb,
-                  isent_eff_pump, elec_eff_pump,
-                  isent_eff_comp,
-                  eff_turboeq,
 
-                  amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
-                  amb_pr_evap_hot_side))
-    print(press_bef_turb)
-    press_bef_turb += 2e5
+# The sweep below is executed only when this file is run directly, so importing calculate_eff_evap_as_heat_source
+# (e.g. by the genetic algorithm or its worker processes) doesn't calculate anything.
+if __name__ == "__main__":
+    # Input data:
+    q_cap = 1e5
+    work_fl = 'ammonia'
+    amb_work_fl_cond = 'air'
+    amb_work_fl_evap = 'air'
+    amb_work_fl_evap_hot_side = 'water'
+    t_cond = 35 + 273.15            # K
+    overc_cond = 2                  # K
+    t_evap = -12 + 273.15           # K
+    overh_evap = 2                  # K
+    # press_bef_turb = [40e5, 50e5, 60e5, 70e5, 80e5, 90e5]           # Pa
+    # temp_bef_turb = [393, 413, 433, 453, 483, 523]    # K
+    press_bef_turb = 56e5           # Pa
+    temp_bef_turb = 295 + 273.15    # K
+    pr_evap = 0.99
+    amb_pr_evap = 0.99
+    pr_cond = 0.99
+    amb_pr_cond = 0.99
+    pr_boil = 0.99
+    pr_evap_hot_side = 0.99
+    amb_pr_evap_hot_side = 0.99
+
+    amb_t_evap_in = -4 + 273.15     # K
+    amb_t_evap_out = -8 + 273.15    # K
+    amb_t_cond_in = 20 + 273.15     # K
+    amb_t_cond_out = 30 + 273.15    # K
+    # amb_t_evap_hot_side_out = 120 + 273.15  # K
+    evap_hot_side_pinch_point = 5  # K
+    amb_t_evap_hot_side_in = 300 + 273.15     # K
+    amb_p_evap_out = 1e5            # Pa
+    amb_p_cond_out = 1e5            # Pa
+    amb_p_evap_hot_side_out = 1e5   # Pa
+
+    isent_eff_turb = 0.7
+    isent_eff_pump = 0.9
+    elec_eff_pump = 0.9
+    isent_eff_comp = 0.7
+    eff_boil = 0.9
+    fuel_heat_val = 26e6            # J/kg
+    eff_turboeq = 0.99
+    pres_max = 72e5
+    # The whole sweep of pressures before the turbine is calculated with one call of the batch model:
+    press_bef_turb = np.arange(press_bef_turb, pres_max + 1e5, 2e5)
+    results = calculate_eff_evap_as_heat_source_batch(q_cap,
+
+                                                      work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                                                      t_cond, overc_cond, t_evap, overh_evap,
+
+                                                      press_bef_turb, temp_bef_turb,
+
+                                                      pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
+                                                      pr_evap_hot_side,
+
+                                                      amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out,
+                                                      amb_p_evap_out, amb_p_cond_out,
+
+                                                      isent_eff_turb,
+                                                      isent_eff_pump, elec_eff_pump,
+                                                      isent_eff_comp,
+                                                      eff_turboeq,
+
+                                                      amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out,
+                                                      evap_hot_side_pinch_point, amb_t_evap_hot_side_in,
+                                                      amb_pr_evap_hot_side)
+    for index in range(len(press_bef_turb)):
+        print([float(results[0][index]), float(results[1][index])])
+        print(float(press_bef_turb[index]))
 '''
 workbook = xlsxwriter.Workbook("Multi_objective_test_data")
 worksheet = workbook.add_worksheet("sheet")
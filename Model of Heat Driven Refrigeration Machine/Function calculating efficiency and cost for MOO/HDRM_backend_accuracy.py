@@ -0,0 +1,176 @@
+import random
+import time
+
+import xlsxwriter
+
+from HDRM_MOO_calc_model import calculate_eff_evap_as_heat_source
+
+
+def report_backend_accuracy(backends, number_of_points, name_of_file,
+                            press_bef_turb_range, t_cond_range, temp_bef_turb_range,
+
+                            q_cap,
+
+                            work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                            overc_cond, t_evap, overh_evap,
+
+                            pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
+
+                            amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+                            amb_p_cond_out,
+
+                            isent_eff_turb,
+                            isent_eff_pump, elec_eff_pump,
+                            isent_eff_comp,
+                            eff_turboeq,
+
+                            amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
+                            amb_t_evap_hot_side_in,
+                            amb_pr_evap_hot_side):
+
+    # This function compares efficiency and SIC calculated with the tabulated backends of CoolProp with the ones
+    # calculated with HEOS. The points are drawn from the ranges of genes optimized by the genetic algorithm
+    # (pressure and temperature before the turbine, temperature of condensation). For every backend the maximum and
+    # mean relative errors and the time of one evaluation are printed and saved to the xlsx file.
+    random.seed(0)
+    points = []
+    for i in range(number_of_points):
+        points.append([random.uniform(press_bef_turb_range[0], press_bef_turb_range[1]),
+                       random.uniform(t_cond_range[0], t_cond_range[1]),
+                       random.uniform(temp_bef_turb_range[0], temp_bef_turb_range[1])])
+
+    results = {}
+    times = {}
+    for backend in ['HEOS'] + backends:
+        results[backend] = []
+        start_time = time.time()
+        for point in points:
+            # CoolProp may be unable to solve some states of the model with the tabulated backend:
+            try:
+                result = calculate_eff_evap_as_heat_source(q_cap,
+
+                                                           work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                                                           point[1], overc_cond, t_evap, overh_evap,
+
+                                                           point[0], point[2],
+
+                                                           pr_evap, amb_pr_evap, pr_cond, amb_pr_cond,
+                                                           pr_boil, pr_evap_hot_side,
+
+                                                           amb_t_evap_in, amb_t_evap_out, amb_t_cond_in,
+                                                           amb_t_cond_out, amb_p_evap_out, amb_p_cond_out,
+
+                                                           isent_eff_turb,
+                                                           isent_eff_pump, elec_eff_pump,
+                                                           isent_eff_comp,
+                                                           eff_turboeq,
+
+                                                           amb_work_fl_evap_hot_side,
+                                                           amb_p_evap_hot_side_out,
+                                                           evap_hot_side_pinch_point,
+                                                           amb_t_evap_hot_side_in,
+                                                           amb_pr_evap_hot_side,
+                                                           backend=backend)
+            except ValueError:
+                result = None
+            results[backend].append(result)
+        times[backend] = (time.time() - start_time) / number_of_points
+
+    workbook = xlsxwriter.Workbook(name_of_file + '.xlsx')
+    worksheet = workbook.add_worksheet('accuracy')
+    headers = ["backend", "max error of efficiency, %", "mean error of efficiency, %", "max error of SIC, %",
+               "mean error of SIC, %", "time of evaluation, s", "points not solved"]
+    for column in range(len(headers)):
+        worksheet.write(0, column, headers[column])
+
+    row = 1
+    for backend in ['HEOS'] + backends:
+        eff_errors = []
+        sic_errors = []
+        not_solved = 0
+        for reference, result in zip(results['HEOS'], results[backend]):
+            if reference is None or result is None:
+                not_solved += 1
+                continue
+            eff_errors.append(abs(result[0] - reference[0]) / abs(reference[0]) * 100)
+            sic_errors.append(abs(result[1] - reference[1]) / abs(reference[1]) * 100)
+        if len(eff_errors) == 0:
+            print(backend + ": none of the points has been solved.")
+            worksheet.write(row, 0, backend)
+            worksheet.write(row, 6, not_solved)
+            row += 1
+            continue
+        values = [backend, max(eff_errors), sum(eff_errors) / len(eff_errors), max(sic_errors),
+                  sum(sic_errors) / len(sic_errors), times[backend], not_solved]
+        for column in range(len(values)):
+            worksheet.write(row, column, values[column])
+        print(backend + ": efficiency error max " + str(round(values[1], 5)) + " %, mean " + str(round(values[2], 5))
+              + " %; SIC error max " + str(round(values[3], 5)) + " %, mean " + str(round(values[4], 5))
+              + " %; " + str(round(values[5], 4)) + " s per evaluation; " + str(not_solved) + " points not solved")
+        row += 1
+
+    workbook.close()
+
+
+if __name__ == "__main__":
+    # The same input data and ranges of genes as in GA_MOO.py:
+    q_cap = 1e5
+    work_fl = 'ammonia'
+    amb_work_fl_cond = 'air'
+    amb_work_fl_evap = 'air'
+    amb_work_fl_evap_hot_side = 'air'
+    overc_cond = 2                  # K
+    t_evap = -12 + 273.15           # K
+    overh_evap = 2                  # K
+    pr_evap = 0.99
+    amb_pr_evap = 0.99
+    pr_cond = 0.99
+    amb_pr_cond = 0.99
+    pr_boil = 0.99
+    pr_evap_hot_side = 0.99
+    amb_pr_evap_hot_side = 0.99
+
+    amb_t_evap_in = -4 + 273.15     # K
+    amb_t_evap_out = -8 + 273.15    # K
+    amb_t_cond_in = 20 + 273.15     # K
+    amb_t_cond_out = 30 + 273.15    # K
+    evap_hot_side_pinch_point = 5  # K
+    amb_t_evap_hot_side_in = 300 + 273.15     # K
+    amb_p_evap_out = 1e5            # Pa
+    amb_p_cond_out = 1e5            # Pa
+    amb_p_evap_hot_side_out = 1e5   # Pa
+
+    isent_eff_turb = 0.7
+    isent_eff_pump = 0.9
+    elec_eff_pump = 0.9
+    isent_eff_comp = 0.7
+    eff_turboeq = 0.99
+
+    press_bef_turb_range = [56e5, 72e5]                         # Pa
+    t_cond_range = [30 + 273.15, 35 + 273.15]                   # K
+    temp_bef_turb_range = [200 + 273.15, 295 + 273.15]          # K
+
+    report_backend_accuracy(['BICUBIC&HEOS', 'TTSE&HEOS'], 200, "HDRM_backend_accuracy",
+                            press_bef_turb_range, t_cond_range, temp_bef_turb_range,
+
+                            q_cap,
+
+                            work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                            overc_cond, t_evap, overh_evap,
+
+                            pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil, pr_evap_hot_side,
+
+                            amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+                            amb_p_cond_out,
+
+                            isent_eff_turb,
+                            isent_eff_pump, elec_eff_pump,
+                            isent_eff_comp,
+                            eff_turboeq,
+
+                            amb_work_fl_evap_hot_side, amb_p_evap_hot_side_out, evap_hot_side_pinch_point,
+                            amb_t_evap_hot_side_in,
+                            amb_pr_evap_hot_side)
@@ -1,3 +1,4 @@
+import numpy as np
 import xlsxwriter
 from CoolProp.CoolProp import PropsSI
 
@@ -6,7 +7,9 @@ from Compressor import Compressor
 from Condenser import Condenser
 from EngineerHelper import EngineerHelper
 from Evaporator import Evaporator
+from HDRM_batch_cycle import broadcast_genes, calculate_cycle_batch, group_by_fluids
 from Mixer import Mixer
+from PropertyService import property_service
 from Pump import Pump
 from ThrottlingValve import ThrottlingValve
 from Turbine import Turbine
@@ -30,7 +33,28 @@ def calculate_eff(q_cap,
                   isent_eff_pump, elec_eff_pump,
                   isent_eff_comp,
                   eff_boil, fuel_heat_val,
-                  eff_turboeq):
+                  eff_turboeq,
+                  backend='HEOS', ambient_tables=False, saturation_tables=False):
+
+    # Properties of fluids are calculated with the chosen backend of CoolProp - 'HEOS' (default), or one of the
+    # tabulated backends 'BICUBIC&HEOS', 'TTSE&HEOS', which are faster, but less accurate:
+    property_service.set_backend(backend, [work_fl, amb_work_fl_cond, amb_work_fl_evap])
+    # With ambient_tables the enthalpies and temperatures of the ambient fluids are interpolated from the tables built
+    # once over the ranges of ambient temperatures (see PropertyService.set_ambient_tables()), otherwise the tables
+    # left by the previous calls are removed:
+    if ambient_tables:
+        property_service.set_ambient_tables(
+            [[amb_work_fl_evap, [amb_t_evap_in, amb_t_evap_out], [amb_p_evap_out, amb_p_evap_out / amb_pr_evap]],
+             [amb_work_fl_cond, [amb_t_cond_in, amb_t_cond_out], [amb_p_cond_out, amb_p_cond_out / amb_pr_cond]]])
+    else:
+        property_service.remove_ambient_tables()
+    # With saturation_tables the properties of saturated liquid and vapor of the working fluid are interpolated from
+    # the table of its saturation curve (see PropertyService.set_saturation_tables()), otherwise the tables left by
+    # the previous calls are removed:
+    if saturation_tables:
+        property_service.set_saturation_tables([work_fl])
+    else:
+        property_service.remove_saturation_tables()
 
     # The functions starts with creating tables to collect values of important attributes, each of them has 11 places:
     # indexes 1,2,3,4 for refrigeration cycle (1 is before the compressor, 4 is before evaporator),
@@ -141,7 +165,6 @@ def calculate_eff(q_cap,
                           amb_press_out=amb_p_cond_out)
     condenser.set_attr_combined_cycle()
     condenser.calculate_combined_cyc()
-    temp_in_cond = evaporator.generate_enthalpies_data(accuracy=10)
 
     efficiency = round(evaporator.q_cap / (boiler.fuel_dem * boiler.fuel_heat_val), 8)
     print(efficiency)
@@ -163,6 +186,76 @@ def calculate_eff(q_cap,
 """
 
 
+def calculate_eff_batch(q_cap,
+
+                        work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                        t_cond, overc_cond, t_evap, overh_evap,
+
+                        press_bef_turb, temp_bef_turb,
+
+                        pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
+
+                        amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+                        amb_p_cond_out,
+
+                        isent_eff_turb,
+                        isent_eff_pump, elec_eff_pump,
+                        isent_eff_comp,
+                        eff_boil, fuel_heat_val,
+                        eff_turboeq,
+                        backend='HEOS', ambient_tables=False, saturation_tables=False):
+
+    # The batch version of calculate_eff(): every argument can be a scalar or an array of values (e.g. one column of
+    # genes of the whole population, or a grid of points), and the array of efficiencies of the same shape is
+    # returned. The members for which the model can't be solved get the efficiency nan. The warnings printed by
+    # the components (e.g. wet compression) are not checked here.
+    shape, (q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond, t_evap, overh_evap,
+            press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
+            amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out, amb_p_cond_out,
+            isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil, fuel_heat_val,
+            eff_turboeq) = broadcast_genes(q_cap, work_fl, amb_work_fl_cond, amb_work_fl_evap, t_cond, overc_cond,
+                                           t_evap, overh_evap, press_bef_turb, temp_bef_turb, pr_evap, amb_pr_evap,
+                                           pr_cond, amb_pr_cond, pr_boil, amb_t_evap_in, amb_t_evap_out,
+                                           amb_t_cond_in, amb_t_cond_out, amb_p_evap_out, amb_p_cond_out,
+                                           isent_eff_turb, isent_eff_pump, elec_eff_pump, isent_eff_comp, eff_boil,
+                                           fuel_heat_val, eff_turboeq)
+    efficiency = np.full(q_cap.shape, np.nan)
+
+    for fluids, m in group_by_fluids(work_fl, amb_work_fl_cond, amb_work_fl_evap):
+        property_service.set_backend(backend, list(fluids))
+        if ambient_tables:
+            property_service.set_ambient_tables(
+                [[fluids[2], [amb_t_evap_in[m], amb_t_evap_out[m]],
+                  [amb_p_evap_out[m], amb_p_evap_out[m] / amb_pr_evap[m]]],
+                 [fluids[1], [amb_t_cond_in[m], amb_t_cond_out[m]],
+                  [amb_p_cond_out[m], amb_p_cond_out[m] / amb_pr_cond[m]]]])
+        else:
+            property_service.remove_ambient_tables()
+        if saturation_tables:
+            property_service.set_saturation_tables([fluids[0]])
+        else:
+            property_service.remove_saturation_tables()
+        cycle = calculate_cycle_batch(q_cap[m], fluids[0], fluids[1], fluids[2],
+                                      t_cond[m], overc_cond[m], t_evap[m], overh_evap[m],
+                                      press_bef_turb[m], temp_bef_turb[m],
+                                      pr_evap[m], amb_pr_evap[m], pr_cond[m], amb_pr_cond[m], pr_boil[m],
+                                      amb_t_evap_in[m], amb_t_evap_out[m], amb_t_cond_in[m], amb_t_cond_out[m],
+                                      amb_p_evap_out[m], amb_p_cond_out[m],
+                                      isent_eff_turb[m], isent_eff_pump[m], elec_eff_pump[m], isent_eff_comp[m],
+                                      eff_turboeq[m])
+
+        # Boiler, the same as in Boiler.calculate_fuel_dem():
+        press_in = cycle['pres'][5] / pr_boil[m]
+        enth_in = property_service.props_si_array('H', 'P', press_in, 'T', cycle['temp'][8], fluids[0])
+        enth_out = property_service.props_si_array('H', 'P', cycle['pres'][5], 'T', cycle['temp'][5], fluids[0])
+        fuel_dem = cycle['mass_fl_turb'] * (enth_out - enth_in) / fuel_heat_val[m] / eff_boil[m]
+
+        efficiency[m] = np.round(q_cap[m] / (fuel_dem * fuel_heat_val[m]), 8)
+
+    return np.reshape(efficiency, shape)
+
+
 # Input data:
 q_cap = 1e5
 work_fl = 'ammonia'
@@ -0,0 +1,170 @@
+import numpy as np
+
+from PropertyService import property_service
+
+
+# The functions below calculate the combined cycle of HDRM (refrigeration cycle and power cycle with the common
+# condenser) for whole arrays of genes at once - e.g. for the whole population of the genetic algorithm or for a grid
+# of points. They follow exactly the equations of components (ThrottlingValve, Evaporator, Compressor, Turbine,
+# Turboequipment, Pump, Mixer, Condenser), but every property is calculated for the whole array with one call of
+# property_service.props_si_array() and the energy balances are calculated with NumPy arithmetic.
+# The heat source of the power cycle (boiler or hot-side evaporator) is calculated in calculate_eff_batch() and
+# calculate_eff_evap_as_heat_source_batch().
+
+
+def broadcast_genes(*genes):
+
+    # Every gene can be given as a scalar or as an array (or list) of values. All genes are broadcast to the same
+    # shape and flattened, so the model is calculated for one-dimensional arrays. The shape is returned to give the
+    # results the same shape as the genes.
+    shape = np.broadcast(*[np.asarray(gene, dtype=object) for gene in genes]).shape
+    flat_genes = []
+    for gene in genes:
+        gene = np.asarray(gene)
+        if gene.dtype.kind in 'iuf':
+            gene = gene.astype(float)
+        flat_genes.append(np.broadcast_to(gene, shape).ravel())
+    return shape, flat_genes
+
+
+def group_by_fluids(*fluids):
+
+    # CoolProp calculates arrays of states of one fluid only, so the members are divided into groups with the same
+    # names of all fluids. Returns the list of pairs: (names of fluids, indexes of members).
+    groups = {}
+    for index in range(len(fluids[0])):
+        groups.setdefault(tuple(str(fluid[index]) for fluid in fluids), []).append(index)
+    return [(names, np.array(indexes)) for names, indexes in groups.items()]
+
+
+def calculate_cycle_batch(q_cap,
+
+                          work_fl, amb_work_fl_cond, amb_work_fl_evap,
+
+                          t_cond, overc_cond, t_evap, overh_evap,
+
+                          press_bef_turb, temp_bef_turb,
+
+                          pr_evap, amb_pr_evap, pr_cond, amb_pr_cond, pr_boil,
+
+                          amb_t_evap_in, amb_t_evap_out, amb_t_cond_in, amb_t_cond_out, amb_p_evap_out,
+                          amb_p_cond_out,
+
+                          isent_eff_turb,
+                          isent_eff_pump, elec_eff_pump,
+                          isent_eff_comp,
+                          eff_turboeq):
+
+    # The names of fluids are single strings, all the other arguments are arrays of the same length (or scalars).
+    # The states which can't be solved by CoolProp get the value nan, which is passed to the results of the members.
+    # The same indexes of points as in calculate_eff():
+    # indexes 1,2,3,4 for refrigeration cycle (1 is before the compressor, 4 is before evaporator),
+    # indexes 5,6,7,8 - for power cycle (5 is before the turbine, 8 is before the boiler)
+    # indexes 9, 10 - for condenser applied for both cycles
+    pres = [0 for x in range(11)]
+    temp = [0 for x in range(11)]
+    enth = [0 for x in range(11)]
+    entr = [0 for x in range(11)]
+    cycle = {'pres': pres, 'temp': temp, 'enth': enth, 'entr': entr}
+
+    temp[10] = t_cond - overc_cond
+    temp[3] = temp[10]
+    temp[7] = temp[10]
+    temp[4] = t_evap
+    pres[5] = press_bef_turb
+    temp[5] = temp_bef_turb
+    pres[8] = press_bef_turb / pr_boil
+
+    # Throttling valve:
+    pres[3] = property_service.props_si_array('P', 'T', temp[3] + overc_cond, 'Q', 0, work_fl)
+    pres[4] = property_service.props_si_array('P', 'T', temp[4], 'Q', 1, work_fl)
+    enth[3] = property_service.props_si_array('H', 'T', temp[3], 'P', pres[3], work_fl)
+    enth[4] = enth[3]
+    entr[3] = property_service.props_si_array('S', 'H', enth[3], 'P', pres[3], work_fl)
+    entr[4] = property_service.props_si_array('S', 'H', enth[4], 'P', pres[4], work_fl)
+    enth[10] = enth[3]
+    entr[10] = entr[3]
+    pres[10] = pres[3]
+    pres[7] = pres[3]
+    pres[9] = pres[10] / pr_cond
+    pres[2] = pres[9]
+    pres[6] = pres[9]
+
+    # Evaporator - the end of two-phase zone is approximated with the cross point of straights AB and CD, the same as
+    # in Evaporator.set_attr_refr_cyc(). If the pressure doesn't fall in evaporator, the end of two-phase zone is
+    # at the pressure of inlet.
+    p_A = pres[4]
+    h_A = enth[4]
+    p_B = pres[4] * pr_evap
+    t_B = property_service.props_si_array('T', 'P', p_B, 'Q', 1, work_fl) + overh_evap
+    h_B = property_service.props_si_array('H', 'T', t_B, 'P', p_B, work_fl)
+    p_C = p_A
+    h_C = property_service.props_si_array('H', 'P', p_C, 'Q', 1, work_fl)
+    p_D = p_B
+    h_D = property_service.props_si_array('H', 'P', p_D, 'Q', 1, work_fl)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a_AB = (p_A - p_B)/(h_A - h_B)
+        b_AB = (p_A - ((p_A - p_B)/(h_A - h_B))*h_A)
+        a_CD = (p_C - p_D)/(h_C - h_D)
+        b_CD = (p_C - ((p_C - p_D)/(h_C - h_D))*h_C)
+        h_cp = (b_CD - b_AB)/(a_AB - a_CD)
+        p_cp = np.where(pr_evap < 1, a_AB * h_cp + b_AB, p_A)
+    pres[1] = p_B
+    temp[1] = property_service.props_si_array('T', 'P', p_cp, 'Q', 1, work_fl) + overh_evap
+    enth[1] = property_service.props_si_array('H', 'T', temp[1], 'P', pres[1], work_fl)
+    entr[1] = property_service.props_si_array('S', 'H', enth[1], 'P', pres[1], work_fl)
+    cycle['mass_fl_evap'] = q_cap / (enth[1] - enth[4])
+    cycle['evap_temp_in'] = property_service.props_si_array('T', 'P', pres[4], 'H', enth[4], work_fl)
+    cycle['evap_amb_press_out'] = amb_p_evap_out
+    cycle['evap_amb_press_in'] = amb_p_evap_out / amb_pr_evap
+    cycle['evap_amb_enth_in'] = property_service.props_si_array('H', 'T', amb_t_evap_in, 'P',
+                                                                cycle['evap_amb_press_in'], amb_work_fl_evap)
+    cycle['evap_amb_enth_out'] = property_service.props_si_array('H', 'T', amb_t_evap_out, 'P', amb_p_evap_out,
+                                                                 amb_work_fl_evap)
+    cycle['evap_amb_mass_fl'] = q_cap / (cycle['evap_amb_enth_in'] - cycle['evap_amb_enth_out'])
+
+    # Compressor:
+    enth_after_isent_transform = property_service.props_si_array('H', 'S', entr[1], 'P', pres[2], work_fl)
+    enth[2] = (enth_after_isent_transform - enth[1]) / isent_eff_comp + enth[1]
+    temp[2] = property_service.props_si_array('T', 'H', enth[2], 'P', pres[2], work_fl)
+    entr[2] = property_service.props_si_array('S', 'H', enth[2], 'P', pres[2], work_fl)
+    cycle['power_comp'] = np.abs((enth[2] - enth[1]) * cycle['mass_fl_evap'])
+
+    # Turbine, which power is given by the compressor (Turboequipment):
+    entr[5] = property_service.props_si_array('S', 'T', temp[5], 'P', pres[5], work_fl)
+    enth[5] = property_service.props_si_array('H', 'T', temp[5], 'P', pres[5], work_fl)
+    enth_after_isent_transform = property_service.props_si_array('H', 'S', entr[5], 'P', pres[6], work_fl)
+    enth[6] = enth[5] - isent_eff_turb * (enth[5] - enth_after_isent_transform)
+    temp[6] = property_service.props_si_array('T', 'H', enth[6], 'P', pres[6], work_fl)
+    entr[6] = property_service.props_si_array('S', 'H', enth[6], 'P', pres[6], work_fl)
+    cycle['power_turb'] = cycle['power_comp'] / eff_turboeq
+    cycle['mass_fl_turb'] = cycle['power_turb'] / (enth[5] - enth[6])
+
+    # Pump:
+    enth[7] = property_service.props_si_array('H', 'T', temp[7], 'P', pres[7], work_fl)
+    entr[7] = property_service.props_si_array('S', 'T', temp[7], 'P', pres[7], work_fl)
+    enth_after_isent_transf = property_service.props_si_array('H', 'S', entr[7], 'P', pres[8], work_fl)
+    enth[8] = (enth_after_isent_transf - enth[7]) / isent_eff_pump + enth[7]
+    temp[8] = property_service.props_si_array('T', 'H', enth[8], 'P', pres[8], work_fl)
+    entr[8] = property_service.props_si_array('S', 'H', enth[8], 'P', pres[8], work_fl)
+    cycle['power_pump'] = np.abs((enth[8] - enth[7]) * cycle['mass_fl_turb'])
+    cycle['power_elec_pump'] = cycle['power_pump'] / elec_eff_pump
+
+    # Mixer:
+    cycle['mass_fl_cond'] = cycle['mass_fl_turb'] + cycle['mass_fl_evap']
+    enth[9] = (enth[6] * cycle['mass_fl_turb'] + enth[2] * cycle['mass_fl_evap']) / cycle['mass_fl_cond']
+    temp[9] = property_service.props_si_array('T', 'H', enth[9], 'P', pres[9], work_fl)
+    entr[9] = property_service.props_si_array('S', 'H', enth[9], 'P', pres[9], work_fl)
+
+    # Condenser:
+    cycle['cond_press_out'] = pres[9] * pr_cond
+    cycle['cond_heat_val'] = cycle['mass_fl_cond'] * (enth[9] - enth[10])
+    cycle['cond_amb_press_out'] = amb_p_cond_out
+    cycle['cond_amb_press_in'] = amb_p_cond_out / amb_pr_cond
+    cycle['cond_amb_enth_in'] = property_service.props_si_array('H', 'T', amb_t_cond_in, 'P',
+                                                                cycle['cond_amb_press_in'], amb_work_fl_cond)
+    cycle['cond_amb_enth_out'] = property_service.props_si_array('H', 'T', amb_t_cond_out, 'P', amb_p_cond_out,
+                                                                 amb_work_fl_cond)
+    cycle['cond_amb_mass_fl'] = cycle['cond_heat_val'] / (cycle['cond_amb_enth_out'] - cycle['cond_amb_enth_in'])
+
+    return cycle